@@ -0,0 +1,72 @@
+"""
+Benchmark: JSON encoding and decoding of realistic message pages per codec backend.
+
+Measures, for every installed backend (orjson, msgspec, stdlib json), the cost of
+decoding a `list_messages` response page, encoding a page (as the webhook server
+and caches do), and encoding a `send_message` request body.
+
+Usage:
+    python benchmarks/bench_codec.py [--number 500] [--page-size 100]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("API_KEY", "benchmark-key")
+os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+
+from src.core.codec import BACKENDS, load_codec  # noqa: E402
+
+PAYLOAD = {"to": {"id": "contact123"}, "content": "Hello, World! Your order #4711 has shipped.", "from": "+0987654321"}
+
+
+def message(i: int) -> dict:
+    return {
+        "id": f"msg-{i:08d}-4f1c-9a2e-0d6b3c7e5a1f",
+        "from": "+0987654321",
+        "to": {"id": f"contact-{i % 50}", "name": "Alice Müller", "phone": "+491701234567"},
+        "content": "Hello, World! Your order #4711 has shipped and will arrive tomorrow.",
+        "status": ("queued", "delivered", "failed")[i % 3],
+        "createdAt": "2024-12-06T03:01:37.416Z",
+        "deliveredAt": "2024-12-06T03:01:39.002Z" if i % 3 == 1 else None,
+    }
+
+
+def per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=500, help="calls per measurement")
+    parser.add_argument("--page-size", type=int, default=100, help="messages per page")
+    args = parser.parse_args()
+
+    page = {"messages": [message(i) for i in range(args.page_size)], "page": 1, "quantityPerPage": args.page_size}
+    page_bytes = load_codec("json").dumps(page)
+
+    print(f"Page of {args.page_size} messages ({len(page_bytes)} bytes), microseconds per call")
+    print(f"  {'backend':<10} {'decode page':>12} {'encode page':>12} {'encode body':>12}")
+    results = {}
+    for name in BACKENDS:
+        try:
+            codec = load_codec(name)
+        except ImportError:
+            print(f"  {name:<10} not installed")
+            continue
+        decode = per_call_us(lambda: codec.loads(page_bytes), args.number)
+        encode = per_call_us(lambda: codec.dumps(page), args.number)
+        body = per_call_us(lambda: codec.dumps(PAYLOAD), args.number * 20)
+        results[name] = (decode, encode)
+        print(f"  {name:<10} {decode:12.1f} {encode:12.1f} {body:12.2f}")
+
+    fastest = next(name for name in BACKENDS if name in results)
+    if fastest != "json":
+        (decode, encode), (base_decode, base_encode) = results[fastest], results["json"]
+        print(f"\n{fastest} vs stdlib json: decode x{base_decode / decode:.1f}, encode x{base_encode / encode:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Benchmark: a new connection per call (`requests.request`) vs the `ApiClient`'s pooled session.
+
+Starts a local HTTP/1.1 keep-alive server that stands in for the messaging API,
+over plain HTTP and, when `openssl` is available to create a throwaway
+certificate, over TLS. The same GET requests are sent with `requests.request`
+and with `client.session.request`, so only connection reuse differs: retries,
+decoding and logging of `ApiClient.request` are left out. Reports wall time and
+the number of TCP connections (handshakes) the server accepted.
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--requests 500]
+"""
+import argparse
+import logging
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("API_KEY", "benchmark-key")
+os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+
+import requests  # noqa: E402
+from src.sdk.client import ApiClient  # noqa: E402
+
+BODY = b'{"id":"contact123","name":"Alice","phone":"+1234567890"}'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StandInHandler.lock:
+            StandInHandler.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def tls_certificate(directory: str) -> Optional[Tuple[str, str]]:
+    """Create a self-signed certificate for 127.0.0.1, or return None without `openssl`."""
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        return None
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        [openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-keyout", key, "-out", cert,
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def start_server(certificate: Optional[Tuple[str, str]] = None) -> Tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    scheme = "http"
+    if certificate is not None:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*certificate)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"{scheme}://127.0.0.1:{server.server_port}"
+
+
+def run(label, call, total):
+    StandInHandler.connections = 0
+    start = time.perf_counter()
+    for _ in range(total):
+        call()
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {label:<22} {total} requests in {elapsed:.3f}s "
+        f"({elapsed / total * 1e3:.3f} ms/req), {StandInHandler.connections} TCP connections"
+    )
+    return elapsed
+
+
+def compare(label: str, base_url: str, total: int, verify) -> None:
+    url = f"{base_url}/contacts/contact123"
+    print(label)
+    with ApiClient(base_url=base_url, api_key="benchmark-key") as client:
+        headers = dict(client.session.headers)
+        unpooled = run(
+            "requests.request",
+            lambda: requests.request("GET", url, headers=headers, verify=verify).json(),
+            total,
+        )
+        pooled = run("ApiClient session", lambda: client.session.request("GET", url, verify=verify).json(), total)
+    print(f"  speedup: {unpooled / pooled:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    logging.getLogger("logger.sdk").setLevel(logging.WARNING)
+
+    server, base_url = start_server()
+    try:
+        compare("HTTP", base_url, args.requests, verify=True)
+    finally:
+        server.shutdown()
+
+    with tempfile.TemporaryDirectory() as directory:
+        certificate = tls_certificate(directory)
+        if certificate is None:
+            print("TLS: skipped, openssl not found")
+            return
+        server, base_url = start_server(certificate)
+        try:
+            compare("TLS", base_url, args.requests, verify=certificate[0])
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
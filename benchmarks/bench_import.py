@@ -0,0 +1,74 @@
+"""
+Benchmark: cold import time of the SDK and the webhook server.
+
+Imports each module in a fresh interpreter (as a short-lived worker or serverless
+function would) without any SDK configuration, reports the median wall time, and
+lists the slowest imports below the SDK client from `python -X importtime`.
+`tests/unit/core/test_import_time.py` enforces a budget on the client import.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = ("src.sdk.client", "src.sdk.features.messages", "src.server.app")
+
+PROBE = "import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+
+
+def environment(module: str) -> dict:
+    env = {k: v for k, v in os.environ.items() if k not in ("API_KEY", "WEBHOOK_SECRET")}
+    env["PYTHONPATH"] = ROOT
+    if module == "src.server.app":
+        # The webhook server builds its client at import and needs credentials
+        env.update(API_KEY="benchmark-key", WEBHOOK_SECRET="benchmark-secret")
+    return env
+
+
+def cold_import_ms(module: str, cwd: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=cwd, env=environment(module), capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def slowest_imports(module: str, cwd: str, count: int = 10) -> list:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=environment(module), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[1:count + 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per module")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        print(f"Cold import time (median of {args.runs} runs), milliseconds")
+        for module in MODULES:
+            times = [cold_import_ms(module, cwd) for _ in range(args.runs)]
+            print(f"  {module:<28} {statistics.median(times):8.1f}")
+
+        print("\nSlowest imports under src.sdk.client (cumulative ms)")
+        for cumulative, name in slowest_imports("src.sdk.client", cwd):
+            print(f"  {name:<40} {cumulative:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
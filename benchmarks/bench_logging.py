@@ -0,0 +1,104 @@
+"""
+Benchmark: SDK call overhead with logging off, on, sampled and synchronous.
+
+Runs `send_message` and `get_contact` through a real `ApiClient` whose HTTP
+session is replaced by a stub returning canned responses, so only SDK-side work
+and logging are measured. Log records are written to a temporary file, either
+from the background queue listener (the SDK default) or synchronously on the
+calling thread for comparison.
+
+Usage:
+    python benchmarks/bench_logging.py [--number 2000]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("API_KEY", "benchmark-key")
+os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+
+from src.core.logger import LOG_FORMAT, logger, set_sampling, start_logging  # noqa: E402
+from src.sdk.client import ApiClient  # noqa: E402
+from src.sdk.features.contacts import Contacts  # noqa: E402
+from src.sdk.features.messages import Messages  # noqa: E402
+
+PAYLOAD = {"to": {"id": "contact123"}, "content": "Hello, World!", "from": "+0987654321"}
+MESSAGE = (
+    b'{"id":"msg1","from":"+0987654321","to":{"id":"contact123"},"content":"Hello, World!",'
+    b'"status":"queued","createdAt":"2024-12-06T03:01:37.416Z","deliveredAt":null}'
+)
+CONTACT = b'{"id":"contact123","name":"Alice","phone":"+1234567890"}'
+
+
+class StubResponse:
+    headers = {}
+
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+
+
+class StubSession:
+    """Answers like the API without any I/O."""
+
+    def request(self, method, url, **kwargs):
+        return StubResponse(MESSAGE if method == "POST" else CONTACT)
+
+    def close(self):
+        pass
+
+
+def file_handler(path: str) -> logging.Handler:
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+
+def per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    client = ApiClient()
+    client.session = StubSession()
+    messages, contacts = Messages(client), Contacts(client)
+    queue_handlers = list(logger.handlers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.log")
+        start_logging([file_handler(path)])
+
+        def configure(level, sampling=None, synchronous=False):
+            logger.setLevel(level)
+            set_sampling("sdk", sampling)
+            logger.handlers = [file_handler(path)] if synchronous else queue_handlers
+
+        scenarios = [
+            ("off (WARNING)", lambda: configure("WARNING")),
+            ("INFO, queued", lambda: configure("INFO")),
+            ("INFO, queued, 10% sampled", lambda: configure("INFO", sampling=0.1)),
+            ("INFO, synchronous file write", lambda: configure("INFO", synchronous=True)),
+            ("DEBUG, queued", lambda: configure("DEBUG")),
+        ]
+        print(f"SDK call overhead ({args.number} calls), microseconds per call")
+        for label, setup in scenarios:
+            setup()
+            send = per_call_us(lambda: messages.send_message(payload=dict(PAYLOAD)), args.number)
+            get = per_call_us(lambda: contacts.get_contact("contact123"), args.number)
+            print(f"  {label:<30} send_message {send:8.1f}   get_contact {get:8.1f}")
+
+        configure("INFO")
+        start_logging([])
+    start_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: per-call validation overhead of `send_message` and `list_messages`.
+
+Compares the previous approach (instantiating the model with `model(**data)` on
+every call) with the cached `TypeAdapter`s, one-pass validation from JSON bytes,
+and the end-to-end SDK call under each `ValidationMode`. The API client is a
+stub returning canned responses, so only SDK-side work is measured.
+
+Usage:
+    python benchmarks/bench_validators.py [--number 2000] [--page-size 100]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("API_KEY", "benchmark-key")
+os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+
+from src.core.validators import get_adapter, set_validation_mode, validate_json  # noqa: E402
+from src.schemas.messages import CreateMessageRequest, ListMessagesResponse, Message  # noqa: E402
+from src.sdk.features.messages import Messages  # noqa: E402
+
+PAYLOAD = {"to": {"id": "contact123"}, "content": "Hello, World!", "from": "+0987654321"}
+
+
+def message(i: int) -> dict:
+    return {
+        "id": f"msg{i}",
+        "from": "+0987654321",
+        "to": {"id": "contact123", "name": "Alice", "phone": "+1234567890"},
+        "content": "Hello, World!",
+        "status": "delivered",
+        "createdAt": "2024-12-06T03:01:37.416Z",
+        "deliveredAt": "2024-12-06T03:01:39.002Z",
+    }
+
+
+class StubClient:
+    """Answers like the API without any I/O."""
+
+    def __init__(self, page_size: int):
+        self.sent = message(0)
+        self.page = {"messages": [message(i) for i in range(page_size)], "page": 1, "quantityPerPage": page_size}
+
+    def request(self, method, endpoint, **kwargs):
+        return self.sent if method == "POST" else self.page
+
+
+def per_call_us(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    parser.add_argument("--page-size", type=int, default=100, help="messages per list_messages page")
+    args = parser.parse_args()
+
+    client = StubClient(args.page_size)
+    page_bytes = json.dumps(client.page).encode()
+    sdk = Messages(client)
+
+    print(f"Validation only ({args.number} calls, page of {args.page_size} messages), microseconds per call")
+    rows = [
+        ("send_message request, model(**payload)", lambda: CreateMessageRequest(**PAYLOAD)),
+        (
+            "send_message request, cached TypeAdapter",
+            lambda: get_adapter(CreateMessageRequest).validate_python(PAYLOAD),
+        ),
+        ("send_message response, model(**response)", lambda: Message(**client.sent)),
+        ("send_message response, cached TypeAdapter", lambda: get_adapter(Message).validate_python(client.sent)),
+        ("list_messages, json.loads + model(**response)", lambda: ListMessagesResponse(**json.loads(page_bytes))),
+        ("list_messages, validate_json(bytes)", lambda: validate_json(ListMessagesResponse, page_bytes)),
+    ]
+    for label, stmt in rows:
+        print(f"  {label:<48} {per_call_us(stmt, args.number):10.1f}")
+
+    print("\nEnd-to-end SDK call by validation mode, microseconds per call")
+    for mode in ("strict", "lenient", "off"):
+        set_validation_mode(mode)
+        send = per_call_us(lambda: sdk.send_message(payload=dict(PAYLOAD)), args.number)
+        listing = per_call_us(lambda: sdk.list_messages(limit=args.page_size), max(1, args.number // 10))
+        print(f"  {mode:<8} send_message {send:10.1f}   list_messages {listing:10.1f}")
+    set_validation_mode(None)
+
+
+if __name__ == "__main__":
+    main()
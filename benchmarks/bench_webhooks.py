@@ -0,0 +1,92 @@
+"""
+Benchmark: delivery events per second through `POST /webhooks` vs `POST /webhooks/batch`.
+
+Drives the FastAPI app in-process over `httpx.ASGITransport` (no sockets), signing
+every body like the API server does. The same events are sent one per request to
+the single-event endpoint and in batches (JSON array and NDJSON) to the batch
+endpoint, then redelivered to measure the cost of duplicates. Console output of the handlers is suppressed.
+Events are processed inline (`WEBHOOK_WORKERS=0`), so each request includes the full processing cost.
+
+Usage:
+    python benchmarks/bench_webhooks.py [--events 5000] [--batch-size 500]
+"""
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import io
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("API_KEY", "benchmark-key")
+os.environ.setdefault("WEBHOOK_SECRET", "benchmark-secret")
+os.environ.setdefault("WEBHOOK_WORKERS", "0")
+
+import httpx  # noqa: E402
+from src.core.config import get_settings  # noqa: E402
+from src.server.app import app  # noqa: E402
+
+
+def event(i: int) -> dict:
+    return {"id": f"msg-{i:08d}", "status": "delivered", "deliveredAt": "2024-12-06T03:01:39.002Z"}
+
+
+def sign(body: bytes) -> dict:
+    secret = get_settings().WEBHOOK_SECRET.encode("utf-8")
+    return {"Authorization": f"Bearer {hmac.new(secret, body, hashlib.sha256).hexdigest()}"}
+
+
+def encode(events: list, fmt: str) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(json.dumps(e, separators=(",", ":")).encode() + b"\n" for e in events)
+    return json.dumps(events, separators=(",", ":")).encode()
+
+
+async def run(requests: list) -> float:
+    """Send (path, body) pairs sequentially and return the elapsed seconds."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhooks.test") as client:
+        started = time.perf_counter()
+        for path, body in requests:
+            response = await client.post(path, content=body, headers=sign(body))
+            response.raise_for_status()
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5000, help="delivery events per scenario")
+    parser.add_argument("--batch-size", type=int, default=500, help="events per batch request")
+    args = parser.parse_args()
+    logging.getLogger("logger.webhooks").setLevel(logging.WARNING)
+
+    def batches(offset: int, fmt: str) -> list:
+        def batch(start: int) -> list:
+            return [event(offset + i) for i in range(start, min(start + args.batch_size, args.events))]
+
+        return [("/webhooks/batch", encode(batch(n), fmt)) for n in range(0, args.events, args.batch_size)]
+
+    # Distinct message IDs per scenario, so no event is a duplicate of an earlier one;
+    # the last scenario redelivers the first one's events, as a retrying sender would
+    single = [("/webhooks", encode(event(i), "json")) for i in range(args.events)]
+    scenarios = {
+        "single event per request": single,
+        f"batch of {args.batch_size}, JSON array": batches(args.events, "json"),
+        f"batch of {args.batch_size}, NDJSON": batches(2 * args.events, "ndjson"),
+        "duplicates, single per request": single,
+    }
+
+    print(f"{args.events} delivery events, events per second")
+    for label, requests in scenarios.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed = asyncio.run(run(requests))
+        print(f"  {label:<32} {args.events / elapsed:10.0f}   ({len(requests)} requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,11 @@ def send_message_example(messages):
     try:
         logger.info("Attempting to send a message...")
         response = messages.send_message(payload=payload)
-        logger.info(f"Message sent successfully: {response}")
+        logger.info("Message sent successfully: %s", response)
         print("Message sent successfully:")
         print(response)
     except Exception as e:
-        logger.error(f"Failed to send message: {e}")
+        logger.error("Failed to send message: %s", e)
 
 def manage_contacts_example(contacts):
     """Demonstrate creating, listing, and deleting a contact."""
@@ -36,26 +36,26 @@ def manage_contacts_example(contacts):
         }
         logger.info("Creating a new contact...")
         response = contacts.create_contact(new_contact)
-        logger.info(f"Contact created successfully: {response}")
+        logger.info("Contact created successfully: %s", response)
         print("Contact created successfully:")
         print(response)
 
         # List all contacts
         logger.info("Listing all contacts...")
         contacts_list = contacts.list_contacts()
-        logger.info(f"Retrieved contacts: {contacts_list}")
+        logger.info("Retrieved contacts: %s", contacts_list)
         print("Contacts list:")
         print(contacts_list)
 
         # Delete the created contact
-        contact_id = response["id"]
-        logger.info(f"Deleting contact with ID: {contact_id}")
+        contact_id = response.id
+        logger.info("Deleting contact with ID: %s", contact_id)
         contacts.delete_contact(contact_id)
-        logger.info(f"Contact with ID {contact_id} deleted successfully.")
+        logger.info("Contact with ID %s deleted successfully.", contact_id)
         print(f"Contact with ID {contact_id} deleted successfully.")
 
     except Exception as e:
-        logger.error(f"An error occurred while managing contacts: {e}")
+        logger.error("An error occurred while managing contacts: %s", e)
 
 
 def main():
@@ -72,7 +72,7 @@ def main():
         manage_contacts_example(contacts)
 
     except Exception as e:
-        logger.error(f"An error occurred during the main workflow: {e}")
+        logger.error("An error occurred during the main workflow: %s", e)
 
 if __name__ == "__main__":
     main()
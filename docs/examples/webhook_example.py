@@ -24,7 +24,7 @@ def generate_hmac_signature(payload: str, secret: str) -> str:
         hmac_instance = hmac.new(secret_key, message, hashlib.sha256)
         return hmac_instance.hexdigest()
     except Exception as e:
-        logger.error(f"Error generating HMAC signature: {e}")
+        logger.error("Error generating HMAC signature: %s", e)
         raise
 
 def trigger_webhook_example():
@@ -57,12 +57,12 @@ def trigger_webhook_example():
         # Simulate the webhook
         logger.info("Simulating webhook request...")
         response = os.popen(command).read()
-        logger.info(f"Webhook response: {response}")
+        logger.info("Webhook response: %s", response)
         print("Webhook response:")
         print(response)
 
     except Exception as e:
-        logger.error(f"An error occurred while triggering the webhook: {e}")
+        logger.error("An error occurred while triggering the webhook: %s", e)
 
 if __name__ == "__main__":
     trigger_webhook_example()
@@ -34,6 +34,9 @@ setup(
         "pydantic-settings",
     ],
     extras_require={
+        "fast": [
+            "orjson",
+        ],
         "dev": [
             "flake8",
             "black",
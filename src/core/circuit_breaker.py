@@ -0,0 +1,174 @@
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+from .logger import logger
+from .exceptions import ServerError, TransientError, RateLimitError, CircuitOpenError
+from .retry import NETWORK_ERRORS
+
+
+class CircuitState(str, Enum):
+    """States of a single circuit."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+StateChangeHook = Callable[[str, CircuitState, CircuitState], None]
+
+
+class _Circuit:
+    """Mutable state of the circuit for one endpoint key."""
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_calls = 0
+
+
+def is_server_failure(error: Exception) -> bool:
+    """
+    Default failure classification: server-side and network errors count against a
+    circuit, client errors (4xx) and rate limiting do not.
+
+    Args:
+        error (Exception): The error raised by the call.
+
+    Returns:
+        bool: True if the error indicates the endpoint is unhealthy.
+    """
+    if isinstance(error, RateLimitError):
+        return False
+    return isinstance(error, (ServerError, TransientError) + NETWORK_ERRORS)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker keyed by endpoint template (e.g. `"POST /messages"`, `"GET /contacts/{id}"`).
+
+    - closed: calls pass; `failure_threshold` consecutive failures open the circuit.
+    - open: calls fail immediately with `CircuitOpenError` for `recovery_timeout` seconds.
+    - half-open: up to `half_open_max_calls` trial calls pass; a success closes the
+      circuit, a failure opens it again.
+
+    One breaker can be shared by every thread and task using the same client.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[Exception], bool] = is_server_failure,
+        on_state_change: Optional[StateChangeHook] = None,
+    ):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open a circuit.
+            recovery_timeout (float): Seconds a circuit stays open before allowing trial calls.
+            half_open_max_calls (int): Concurrent trial calls allowed while half-open.
+            is_failure (Callable[[Exception], bool]): Decides which errors count as failures.
+            on_state_change (Callable, optional): Hook called as `hook(key, old_state, new_state)`.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._hooks: List[StateChangeHook] = [on_state_change] if on_state_change else []
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def add_listener(self, hook: StateChangeHook) -> None:
+        """
+        Register an additional state-change hook.
+
+        Args:
+            hook (Callable): Called as `hook(key, old_state, new_state)`.
+        """
+        self._hooks.append(hook)
+
+    def state(self, key: str) -> CircuitState:
+        """
+        Return the current state of the circuit for `key`.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CircuitState.CLOSED
+
+    def _transition(self, key: str, circuit: _Circuit, new_state: CircuitState, changes: list) -> None:
+        if circuit.state != new_state:
+            changes.append((key, circuit.state, new_state))
+            circuit.state = new_state
+
+    def _notify(self, changes: list) -> None:
+        for key, old_state, new_state in changes:
+            logger.warning("Circuit for %s changed from %s to %s", key, old_state.value, new_state.value)
+            for hook in self._hooks:
+                try:
+                    hook(key, old_state, new_state)
+                except Exception as e:
+                    logger.error("Circuit breaker hook failed: %s", e)
+
+    def before_call(self, key: str) -> None:
+        """
+        Check whether a call to `key` may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial slots taken.
+        """
+        changes = []
+        try:
+            with self._lock:
+                circuit = self._circuits.setdefault(key, _Circuit())
+                if circuit.state == CircuitState.OPEN:
+                    remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                    if remaining > 0:
+                        raise CircuitOpenError(key, retry_after=remaining)
+                    self._transition(key, circuit, CircuitState.HALF_OPEN, changes)
+                    circuit.trial_calls = 0
+                if circuit.state == CircuitState.HALF_OPEN:
+                    if circuit.trial_calls >= self.half_open_max_calls:
+                        raise CircuitOpenError(key)
+                    circuit.trial_calls += 1
+        finally:
+            self._notify(changes)
+
+    def release(self, key: str) -> None:
+        """
+        Give back the trial slot of a call to `key` that ended without an outcome
+        (cancelled or interrupted), so the next call can try again.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit and circuit.state == CircuitState.HALF_OPEN and circuit.trial_calls:
+                circuit.trial_calls -= 1
+
+    def record_success(self, key: str) -> None:
+        """
+        Record a successful call to `key`.
+        """
+        changes = []
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures = 0
+            if circuit.state == CircuitState.HALF_OPEN:
+                self._transition(key, circuit, CircuitState.CLOSED, changes)
+        self._notify(changes)
+
+    def record_failure(self, key: str, error: Exception) -> None:
+        """
+        Record a failed call to `key`. Errors that are not failures per `is_failure`
+        (e.g. a 404) count as successes, since the endpoint did answer.
+        """
+        if not self.is_failure(error):
+            self.record_success(key)
+            return
+        changes = []
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == CircuitState.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+                self._transition(key, circuit, CircuitState.OPEN, changes)
+        self._notify(changes)
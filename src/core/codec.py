@@ -0,0 +1,126 @@
+import json
+
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
+
+# Preference order when JSON_CODEC is "auto"
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class JsonCodec:
+    """
+    A JSON encoder/decoder pair.
+
+    Every backend produces compact UTF-8 output (no whitespace, non-ASCII
+    characters unescaped); number formatting may differ between libraries, so
+    nothing security-relevant such as signatures is encoded here. Decoding
+    errors are raised as `json.JSONDecodeError` (a `ValueError`) by every backend.
+
+    Attributes:
+        name (str): The backend library ("orjson", "msgspec" or "json").
+    """
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[Union[str, bytes]], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JsonCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    return JsonCodec("json", lambda obj: encoder.encode(obj).encode("utf-8"), json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+    return JsonCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+    return JsonCodec("msgspec", encoder.encode, loads)
+
+
+_FACTORIES = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "json": _stdlib_codec}
+
+
+@lru_cache(maxsize=None)
+def load_codec(name: str = "auto") -> JsonCodec:
+    """
+    Build the codec for a backend.
+
+    Args:
+        name (str): "orjson", "msgspec", "json", or "auto" for the fastest installed one.
+
+    Returns:
+        JsonCodec: The codec.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is unknown.
+    """
+    if name == "auto":
+        for backend in BACKENDS:
+            try:
+                return load_codec(backend)
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    return _FACTORIES[name]()
+
+
+_codec: Optional[JsonCodec] = None
+
+
+def set_codec(name: Optional[str]) -> None:
+    """
+    Choose the JSON backend used by the SDK and the webhook server.
+
+    Args:
+        name (str, optional): "orjson", "msgspec", "json" or "auto".
+            None falls back to `settings.JSON_CODEC`.
+    """
+    global _codec
+    _codec = load_codec(name) if name is not None else None
+
+
+def get_codec() -> JsonCodec:
+    """
+    Return the active JSON codec.
+    """
+    global _codec
+    if _codec is None:
+        from .config import get_sdk_options
+        _codec = load_codec(get_sdk_options().JSON_CODEC)
+    return _codec
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize `obj` to compact UTF-8 JSON bytes with the active codec.
+    """
+    return get_codec().dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document with the active codec.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    return get_codec().loads(data)
@@ -1,20 +1,52 @@
 import os
+from functools import lru_cache
+from typing import Any, Literal, Optional
 
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
 from src.core.logger import logger
 
 
-class Settings(BaseSettings):
+_ENV_FILE = os.path.join(os.path.dirname(__file__), "../../.env")
+
+
+class SdkOptions(BaseSettings):
+    """
+    Options read by the SDK on every request. All have defaults, so they load
+    without `API_KEY` or `WEBHOOK_SECRET`; other keys in the environment are ignored.
+    """
+    VALIDATION_MODE: Literal["strict", "lenient", "off"] = Field(
+        default="strict", json_schema_extra={"env": "VALIDATION_MODE"}
+    )
+    RESPONSE_FORMAT: Literal["model", "raw"] = Field(default="model", json_schema_extra={"env": "RESPONSE_FORMAT"})
+    JSON_CODEC: Literal["auto", "orjson", "msgspec", "json"] = Field(
+        default="auto", json_schema_extra={"env": "JSON_CODEC"}
+    )
+
+    model_config = ConfigDict(env_file=_ENV_FILE, env_file_encoding="utf-8", extra="ignore")
+
+
+class Settings(SdkOptions):
     BASE_URL: str = Field(default="http://localhost:3000", json_schema_extra={"env": "BASE_URL"})
     API_KEY: str = Field(json_schema_extra={"env": "API_KEY"})
     WEBHOOK_SECRET: str = Field(json_schema_extra={"env": "WEBHOOK_SECRET"})
+    WEBHOOK_MAX_BODY_BYTES: int = Field(default=1024 * 1024, json_schema_extra={"env": "WEBHOOK_MAX_BODY_BYTES"})
+    WEBHOOK_QUEUE_SIZE: int = Field(default=10_000, json_schema_extra={"env": "WEBHOOK_QUEUE_SIZE"})
+    WEBHOOK_WORKERS: int = Field(default=4, json_schema_extra={"env": "WEBHOOK_WORKERS"})
+    WEBHOOK_WORKER_THREADS: int = Field(default=0, json_schema_extra={"env": "WEBHOOK_WORKER_THREADS"})
+    WEBHOOK_RETRY_AFTER: int = Field(default=1, json_schema_extra={"env": "WEBHOOK_RETRY_AFTER"})
+    WEBHOOK_DRAIN_TIMEOUT: float = Field(default=30.0, json_schema_extra={"env": "WEBHOOK_DRAIN_TIMEOUT"})
+    WEBHOOK_HANDLER_TIMEOUT: float = Field(default=10.0, json_schema_extra={"env": "WEBHOOK_HANDLER_TIMEOUT"})
+    WEBHOOK_DEDUP_TTL: float = Field(default=24 * 3600.0, json_schema_extra={"env": "WEBHOOK_DEDUP_TTL"})
+    WEBHOOK_DEDUP_MAX_ENTRIES: int = Field(default=100_000, json_schema_extra={"env": "WEBHOOK_DEDUP_MAX_ENTRIES"})
+    WEBHOOK_DEDUP_PATH: Optional[str] = Field(default=None, json_schema_extra={"env": "WEBHOOK_DEDUP_PATH"})
+    WEBHOOK_REPLAY_WINDOW: Optional[float] = Field(default=None, json_schema_extra={"env": "WEBHOOK_REPLAY_WINDOW"})
 
     @field_validator("BASE_URL")
     def validate_base_url(cls, value):
         if not value.startswith("http"):
             raise ValueError("BASE_URL must start with 'http'")
-        logger.info(f"Validated BASE_URL: {value}")
+        logger.info("Validated BASE_URL: %s", value)
         return value
 
     @field_validator("API_KEY", "WEBHOOK_SECRET")
@@ -22,10 +54,50 @@ class Settings(BaseSettings):
         field_name = info.field_name  # Get the name of the field being validated
         if not value:
             raise ValueError(f"{field_name} cannot be empty.")
-        logger.info(f"Validated {field_name}: {value}")
+        logger.info("Validated %s", field_name)
         return value
 
-    model_config = ConfigDict(env_file=os.path.join(os.path.dirname(__file__), "../../.env"), env_file_encoding="utf-8")
+    model_config = ConfigDict(env_file=_ENV_FILE, env_file_encoding="utf-8", extra="forbid")
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Load and validate the settings from the environment and `.env` on first use.
+
+    Nothing is read at import time, so importing the SDK stays cheap and works
+    without a `.env` file when the client is given its configuration directly.
+
+    Returns:
+        Settings: The shared settings instance.
+    """
+    return Settings()
+
+
+@lru_cache(maxsize=None)
+def _load_sdk_options() -> SdkOptions:
+    return SdkOptions()
+
+
+def get_sdk_options() -> SdkOptions:
+    """
+    Return the options the SDK needs per request (codec, validation mode,
+    response format).
+
+    These come from the full settings once they are loaded; otherwise only the
+    optional fields are read, so a client configured with an explicit
+    `base_url` and `api_key` works without `API_KEY` or `WEBHOOK_SECRET`.
+
+    Returns:
+        SdkOptions: The loaded settings, or the SDK options alone.
+    """
+    if get_settings.cache_info().currsize:
+        return get_settings()
+    return _load_sdk_options()
 
 
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    # `from src.core.config import settings` keeps working, loading settings on access
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
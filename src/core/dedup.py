@@ -0,0 +1,130 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .cache import CacheBackend, TTLCache
+
+# Outcomes of `EventDeduplicator.claim`
+NEW = "new"
+DUPLICATE = "duplicate"
+REPLAYED = "replayed"
+
+# (message id, status, deliveredAt) of a delivery event
+EventRef = Tuple[str, str, Optional[Union[datetime, str]]]
+
+
+class EventDeduplicator:
+    """
+    Recognizes webhook delivery events that were already received.
+
+    Senders retry deliveries they consider failed, so the same event can arrive
+    many times. An event is identified by (message id, status, deliveredAt) and
+    remembered in a bounded cache store for `ttl` seconds; a repeat costs one
+    lookup instead of being processed again. Any `CacheBackend` can hold the
+    keys: the default in-memory `TTLCache`, or a `SQLiteCache` so duplicates are
+    still recognized after a restart.
+
+    Replay protection is opt-in. With a `replay_window`, events whose
+    `deliveredAt` is older than the window are refused outright, so a captured
+    request cannot be replayed once its key has been evicted. Keep `ttl` at
+    least as long as the window. Without a window, and for events without a
+    `deliveredAt` (e.g. `queued`), only deduplication applies: such an event is
+    accepted again once its key has expired.
+
+    A persistent store does blocking I/O; claim batches with `claim_many` and,
+    in async code, call it from a thread pool.
+
+    Attributes:
+        stats (dict): `new`, `duplicate` and `replayed` event counts.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheBackend] = None,
+        ttl: float = 24 * 3600.0,
+        replay_window: Optional[float] = None,
+    ):
+        """
+        Args:
+            store (CacheBackend, optional): Store of seen event keys. Defaults to a `TTLCache` of 100,000 events.
+            ttl (float): Seconds an event is remembered.
+            replay_window (float, optional): Maximum age in seconds of `deliveredAt`. None accepts any age.
+        """
+        self.store = store if store is not None else TTLCache(max_size=100_000, ttl=ttl)
+        self.ttl = ttl
+        self.replay_window = replay_window
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {NEW: 0, DUPLICATE: 0, REPLAYED: 0}
+
+    @staticmethod
+    def key(event_id: str, status: str, delivered_at: Optional[Union[datetime, str]] = None) -> str:
+        """
+        Identify a delivery event.
+        """
+        if isinstance(delivered_at, datetime):
+            delivered_at = delivered_at.isoformat()
+        return f"{event_id}|{status}|{delivered_at or ''}"
+
+    def is_replay(self, delivered_at: Optional[datetime], now: Optional[datetime] = None) -> bool:
+        """
+        Whether an event is older than the replay window. Events without a
+        timestamp (e.g. `queued`) cannot be dated and are never replays.
+        """
+        if self.replay_window is None or not isinstance(delivered_at, datetime):
+            return False
+        if delivered_at.tzinfo is None:
+            delivered_at = delivered_at.replace(tzinfo=timezone.utc)
+        now = now or datetime.now(timezone.utc)
+        return (now - delivered_at).total_seconds() > self.replay_window
+
+    def claim(self, event_id: str, status: str, delivered_at: Optional[Union[datetime, str]] = None) -> str:
+        """
+        Check an incoming event and remember it if it is new.
+
+        Call `release` if a claimed event could not be accepted (e.g. the queue
+        was full), so the sender's retry is not mistaken for a duplicate.
+
+        Returns:
+            str: `NEW`, `DUPLICATE` (already received) or `REPLAYED` (outside the replay window).
+        """
+        return self.claim_many([(event_id, status, delivered_at)])[0]
+
+    def claim_many(self, events: Iterable[EventRef]) -> List[str]:
+        """
+        Claim several events under a single lock acquisition; see `claim`.
+
+        Args:
+            events (Iterable): (message id, status, deliveredAt) of each event.
+
+        Returns:
+            list[str]: The outcome of each event, in order.
+        """
+        checked = [
+            (self.is_replay(delivered_at), self.key(event_id, status, delivered_at))
+            for event_id, status, delivered_at in events
+        ]
+        outcomes = []
+        with self._lock:
+            for replayed, key in checked:
+                if replayed:
+                    outcome = REPLAYED
+                elif self.store.get(key) is not None:
+                    outcome = DUPLICATE
+                else:
+                    self.store.set(key, 1, ttl=self.ttl)
+                    outcome = NEW
+                self.stats[outcome] += 1
+                outcomes.append(outcome)
+        return outcomes
+
+    def release(self, event_id: str, status: str, delivered_at: Optional[Union[datetime, str]] = None) -> None:
+        """
+        Forget a claimed event, so its next delivery is processed.
+        """
+        self.store.delete(self.key(event_id, status, delivered_at))
+
+    def release_many(self, events: Iterable[EventRef]) -> None:
+        """
+        Forget several claimed events; see `release`.
+        """
+        for event in events:
+            self.release(*event)
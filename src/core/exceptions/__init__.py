@@ -1,4 +1,7 @@
-from .api import ApiError, UnauthorizedError, NotFoundError, ServerError, TransientError
+from .api import (
+    ApiError, UnauthorizedError, NotFoundError, ServerError, TransientError, RateLimitError, RetryExhaustedError,
+    CircuitOpenError,
+)
 from .resource import ContactNotFoundError, MessageNotFoundError, ResourceNotFoundError
 from .decorators import handle_exceptions, handle_404_error
 
@@ -8,6 +11,9 @@ __all__ = [
     "NotFoundError",
     "ServerError",
     "TransientError",
+    "RateLimitError",
+    "RetryExhaustedError",
+    "CircuitOpenError",
     "ContactNotFoundError",
     "MessageNotFoundError",
     "ResourceNotFoundError",
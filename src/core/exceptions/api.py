@@ -15,9 +15,9 @@ class ApiError(Exception):
         self.message = message
         self.status_code = status_code
         if status_code:
-            logger.error(f"[API Error] {status_code}: {message}")
+            logger.error("[API Error] %s: %s", status_code, message)
         else:
-            logger.error(f"[API Error]: {message}")
+            logger.error("[API Error]: %s", message)
 
     def __str__(self):
         return f"{self.message} (HTTP {self.status_code})" if self.status_code else self.message
@@ -53,6 +53,52 @@ class TransientError(ApiError):
     def __init__(self, message: str = "Transient server error. Please retry.", status_code: int = None):
         super().__init__(message, status_code=status_code)
         if status_code:
-            logger.warning(f"[TransientError] {message} (HTTP {status_code})")
+            logger.warning("[TransientError] %s (HTTP %s)", message, status_code)
         else:
-            logger.warning(f"[TransientError] {message}")
+            logger.warning("[TransientError] %s", message)
+
+
+class RateLimitError(TransientError):
+    """
+    Exception raised for 429 Too Many Requests responses.
+
+    Attributes:
+        retry_after (float, optional): Seconds the server asked us to wait, from the `Retry-After` header.
+    """
+
+    def __init__(self, message: str = "Rate limit exceeded. Please slow down.", retry_after: float = None):
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+
+class RetryExhaustedError(ApiError, RuntimeError):
+    """
+    Exception raised when a retried request keeps failing until attempts or the deadline run out.
+
+    Attributes:
+        attempts (int): Number of attempts that were made.
+        last_error (Exception): The error raised by the final attempt.
+    """
+
+    def __init__(self, attempts: int, last_error: Exception):
+        super().__init__(
+            f"Failed after {attempts} attempts: {getattr(last_error, 'message', last_error)}",
+            status_code=getattr(last_error, "status_code", None),
+        )
+        self.attempts = attempts
+        self.last_error = last_error
+
+
+class CircuitOpenError(ApiError):
+    """
+    Exception raised without contacting the server while an endpoint's circuit breaker is open.
+
+    Attributes:
+        endpoint (str): The endpoint template whose circuit is open.
+        retry_after (float, optional): Seconds until trial calls are allowed again.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float = None):
+        super().__init__(f"Circuit open for {endpoint}; failing fast.")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
@@ -1,3 +1,5 @@
+import inspect
+
 from httpx import HTTPStatusError
 from src.core.logger import logger
 from .resource import ContactNotFoundError, MessageNotFoundError
@@ -7,6 +9,7 @@ from .api import ApiError
 def handle_exceptions(func):
     """
     Decorator to handle exceptions consistently across the SDK.
+    Supports both regular and `async` functions.
 
     Args:
         func (Callable): The function to wrap.
@@ -19,14 +22,27 @@ def handle_exceptions(func):
         RuntimeError: Raises unexpected errors as runtime exceptions.
     """
 
+    if inspect.iscoroutinefunction(func):
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except ApiError as api_error:
+                logger.error("[ApiError]: %s", api_error)
+                raise
+            except Exception as unexpected_error:
+                logger.error("[Unhandled Exception]: %s", unexpected_error)
+                raise RuntimeError(f"An unexpected error occurred: {unexpected_error}")
+
+        return async_wrapper
+
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except ApiError as api_error:
-            logger.error(f"[ApiError]: {api_error}")
+            logger.error("[ApiError]: %s", api_error)
             raise
         except Exception as unexpected_error:
-            logger.error(f"[Unhandled Exception]: {unexpected_error}")
+            logger.error("[Unhandled Exception]: %s", unexpected_error)
             raise RuntimeError(f"An unexpected error occurred: {unexpected_error}")
 
     return wrapper
@@ -0,0 +1,101 @@
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict
+from .retry import RetryBudget
+
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+
+class HedgingPolicy:
+    """
+    Configuration and bookkeeping for hedged requests.
+
+    If an idempotent request has not answered after the `percentile` latency
+    observed for its endpoint, a second identical request is fired and whichever
+    answers first wins. Extra load is capped by a token budget: each request
+    earns `max_hedge_ratio` tokens and each hedge spends one, so at most about
+    `max_hedge_ratio` extra requests are sent per request.
+
+    Attributes:
+        stats (dict): `requests` seen, `hedged` requests and `hedge_wins` (hedge answered first).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.005,
+        max_hedge_ratio: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Args:
+            percentile (float): Latency percentile (0-100) after which a hedge is sent.
+            initial_delay (float): Hedge delay used until `min_samples` latencies are known.
+            min_delay (float): Lower bound for the hedge delay, in seconds.
+            max_hedge_ratio (float): Maximum extra requests per request.
+            window (int): Number of recent latencies kept per endpoint.
+            min_samples (int): Samples needed before the percentile is trusted.
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        # Hedges share the retry budget's token scheme: earn a fraction per request, spend one per hedge
+        self.budget = RetryBudget(ratio=max_hedge_ratio, min_tokens=0, max_tokens=max(1.0, window * max_hedge_ratio))
+        self._latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0}
+
+    def applies_to(self, method: str) -> bool:
+        """
+        Whether requests with this HTTP method may be hedged.
+        """
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, key: str) -> float:
+        """
+        How long to wait for the first attempt before hedging a request to `key`.
+
+        Args:
+            key (str): The endpoint template.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        with self._lock:
+            samples = sorted(self._latencies[key])
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return max(self.min_delay, samples[index])
+
+    def record_request(self, key: str, latency: float) -> None:
+        """
+        Record the latency of a completed request to `key`.
+        """
+        with self._lock:
+            self._latencies[key].append(latency)
+            self.stats["requests"] += 1
+        self.budget.deposit()
+
+    def allow_hedge(self) -> bool:
+        """
+        Try to spend budget on a hedge.
+
+        Returns:
+            bool: True if a hedge may be sent.
+        """
+        if not self.budget.withdraw():
+            return False
+        with self._lock:
+            self.stats["hedged"] += 1
+        return True
+
+    def record_hedge_win(self) -> None:
+        """
+        Record that the hedge answered before the original request.
+        """
+        with self._lock:
+            self.stats["hedge_wins"] += 1
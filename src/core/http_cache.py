@@ -0,0 +1,168 @@
+import copy
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+from .cache import CacheBackend, TTLCache
+from .singleflight import request_key
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a `Cache-Control` header into a dict of lower-cased directives.
+
+    Args:
+        value (str, optional): The raw header value, e.g. `"private, max-age=60"`.
+
+    Returns:
+        dict: e.g. `{"private": None, "max-age": "60"}`.
+    """
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+class HttpCache:
+    """
+    Response cache following HTTP caching semantics for GET requests.
+
+    - Fresh entries (within `Cache-Control: max-age`) are served without a request.
+    - Stale entries with an `ETag` or `Last-Modified` validator are revalidated with
+      `If-None-Match` / `If-Modified-Since`; a `304 Not Modified` answer is served
+      from the cache, so the body is neither downloaded nor parsed again.
+    - `no-store` responses are never stored and `no-cache` ones are always revalidated.
+    - A successful write (POST/PUT/PATCH/DELETE) to a path invalidates its cached
+      GETs with any query parameters, those of the paths below it, and the lists of
+      its parent collection (e.g. `PATCH /contacts/1` drops `GET /contacts?pageIndex=2`).
+
+    Entries are JSON-compatible dicts, so any `CacheBackend` can hold them. Bodies
+    are copied in and out, so callers may modify what they receive.
+
+    Attributes:
+        stats (dict): `hits` served fresh, `revalidated` by a 304, `misses` and `stored` responses.
+    """
+
+    def __init__(self, store: Optional[CacheBackend] = None, default_max_age: float = 0.0):
+        """
+        Args:
+            store (CacheBackend, optional): Where entries are kept. Defaults to an
+                in-memory `TTLCache` of 1024 entries kept for up to an hour.
+            default_max_age (float): Freshness in seconds for responses without `max-age`.
+                The default of 0 revalidates them on every request.
+        """
+        self.store = store if store is not None else TTLCache(max_size=1024, ttl=3600)
+        self.default_max_age = default_max_age
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Mapping] = None) -> str:
+        """
+        Cache key of a GET request to `endpoint` with query `params`.
+        """
+        return request_key("GET", endpoint, params=params) if params else request_key("GET", endpoint)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for `key`, fresh or stale, or None.
+        """
+        entry = self.store.get(key)
+        if entry is None:
+            self._count("misses")
+            return None
+        return copy.deepcopy(entry)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Whether `entry` may be served without contacting the server.
+        """
+        fresh = time.time() < entry["expires_at"]
+        if fresh:
+            self._count("hits")
+        return fresh
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Validator headers that turn a request for `entry` into a conditional one.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _expires_at(self, directives: Dict[str, Optional[str]]) -> float:
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("max-age")
+        if max_age is not None and max_age.isdigit():
+            return time.time() + int(max_age)
+        return time.time() + self.default_max_age
+
+    def save(self, key: str, headers: Mapping[str, str], body: Any) -> None:
+        """
+        Store a 200 response if its headers allow it.
+
+        Args:
+            key (str): The request's cache key.
+            headers (Mapping): The response headers.
+            body (Any): The parsed JSON body.
+        """
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives:
+            self.store.delete(key)
+            return
+        entry = {
+            "body": copy.deepcopy(body),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "expires_at": self._expires_at(directives),
+        }
+        if not (entry["etag"] or entry["last_modified"] or entry["expires_at"] > time.time()):
+            return  # Neither fresh nor revalidatable: storing it would never pay off
+        self.store.set(key, entry)
+        self._count("stored")
+
+    def revalidated(self, key: str, entry: Dict[str, Any], headers: Mapping[str, str]) -> Any:
+        """
+        Handle a `304 Not Modified`: refresh the entry's freshness and validators.
+
+        Returns:
+            Any: The cached body.
+        """
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        entry = {
+            **entry,
+            "etag": headers.get("ETag") or entry.get("etag"),
+            "last_modified": headers.get("Last-Modified") or entry.get("last_modified"),
+            "expires_at": self._expires_at(directives),
+        }
+        self.store.set(key, entry)
+        self._count("revalidated")
+        return copy.deepcopy(entry["body"])
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop the cached GETs affected by a write to `endpoint`: the path itself
+        with any query parameters, every path below it, and the listings of its
+        parent collection.
+        """
+        path = endpoint.rstrip("/") or "/"
+        self._drop(path)
+        self.store.delete_prefix(self.key(path.rstrip("/") + "/"))
+        parent = path.rpartition("/")[0]
+        if parent:
+            self._drop(parent)
+
+    def _drop(self, path: str) -> None:
+        # The un-parameterized key, and the same path with any query parameters
+        self.store.delete(self.key(path))
+        self.store.delete_prefix(self.key(path) + " ")
@@ -0,0 +1,67 @@
+import threading
+import uuid
+from typing import Dict, Optional, Tuple
+
+MUTATING_METHODS = ("POST", "PUT", "PATCH")
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+class IdempotencyKeys:
+    """
+    Issues `Idempotency-Key` values for mutating requests.
+
+    A key is generated once per logical call and sent with every retry of that
+    call, so the server can recognize a repeated POST and return the original
+    result instead of performing the action twice. Independent calls always get
+    distinct keys, even with identical bodies: two `send_message` calls with the
+    same payload are two messages. To make a deliberate re-send safe (e.g. after
+    a timeout with unknown outcome), pass your own key in the headers.
+
+    Attributes:
+        stats (dict): `issued` keys.
+    """
+
+    def __init__(self, methods: Tuple[str, ...] = MUTATING_METHODS):
+        """
+        Args:
+            methods (tuple): HTTP methods that receive a key.
+        """
+        self.methods = methods
+        self._lock = threading.Lock()
+        self.stats = {"issued": 0}
+
+    def applies_to(self, method: str) -> bool:
+        """
+        Whether requests with this HTTP method receive an idempotency key.
+        """
+        return method.upper() in self.methods
+
+    def new_key(self) -> str:
+        """
+        Generate a key for one logical call.
+        """
+        with self._lock:
+            self.stats["issued"] += 1
+        return str(uuid.uuid4())
+
+    def prepare(self, method: str, kwargs: Dict) -> Optional[str]:
+        """
+        Add an `Idempotency-Key` header to the request arguments of a mutating
+        call. Call once per logical call, before its retry loop, so every
+        attempt sends the same key.
+
+        A key already set by the caller is left untouched.
+
+        Args:
+            method (str): The HTTP method.
+            kwargs (dict): The request arguments, updated in place.
+
+        Returns:
+            str: The key that was added, or None if no key was added.
+        """
+        headers = kwargs.get("headers") or {}
+        if not self.applies_to(method) or any(name.lower() == IDEMPOTENCY_HEADER.lower() for name in headers):
+            return None
+        key = self.new_key()
+        kwargs["headers"] = {**headers, IDEMPOTENCY_HEADER: key}
+        return key
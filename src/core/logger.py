@@ -1,47 +1,200 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
+
+# Directory of the rotating error log, created when the first record is written
+log_dir = os.environ.get("LOG_DIR", "logs")
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+# Level of the SDK loggers; DEBUG adds request arguments and payloads
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of a logger's records below WARNING.
+
+    Sampling is deterministic: with `rate=0.1` exactly every tenth DEBUG/INFO
+    record is kept. Warnings and errors are never dropped.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate (float): Fraction of records to keep, between 0 and 1.
+        """
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Sampling rate must be between 0 and 1")
+        self.rate = rate
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            self._seen += 1
+            seen = self._seen
+        return int(seen * self.rate) > int((seen - 1) * self.rate)
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Queue handler that renders the message once on the calling thread, so later
+    changes to mutable arguments cannot alter it, without copying the record.
+    The listener runs in the same process, so `exc_info` is passed on as is for
+    handlers that inspect the exception itself.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            with _listener_lock:
+                if _listener is None:
+                    _start_listener(None)
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _LogFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that creates its directory when the first record is
+    written. If the directory cannot be created, e.g. on a read-only filesystem,
+    file logging is disabled with a warning on stderr.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            try:
+                os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+            except OSError as e:
+                sys.stderr.write(f"File logging disabled: {e}\n")
+                self.setLevel(logging.CRITICAL + 1)
+                return
+        super().emit(record)
+
+
+def _default_handlers() -> List[logging.Handler]:
+    """
+    Console handler for INFO and above, rotating file handler for WARNING and above.
+
+    The log directory and file are only created when a warning is written.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    file_handler = _LogFileHandler(
+        os.path.abspath(os.path.join(log_dir, "app.log")), maxBytes=5 * 1024 * 1024, backupCount=3, delay=True
+    )
+    file_handler.setLevel(logging.WARNING)
+    file_handler.setFormatter(formatter)
+    return [console_handler, file_handler]
+
+
+def start_logging(handlers: Optional[List[logging.Handler]] = None) -> QueueListener:
+    """
+    Start the background thread that writes queued log records to the handlers.
+
+    SDK loggers only put records on an in-memory queue, so console and file I/O
+    never happens on the request thread. The listener starts with the default
+    handlers when the first record is logged; calling this again replaces the
+    handlers, after flushing the records already queued.
+
+    Args:
+        handlers (list, optional): Handlers to write to. Defaults to the console and `logs/app.log`.
+
+    Returns:
+        QueueListener: The running listener.
+    """
+    with _listener_lock:
+        return _start_listener(handlers)
+
+
+def _start_listener(handlers: Optional[List[logging.Handler]]) -> QueueListener:
+    """
+    Replace the running listener. Called with `_listener_lock` held.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    _listener = QueueListener(
+        _queue, *(handlers if handlers is not None else _default_handlers()), respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """
+    Write out all queued records and stop the background thread.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def set_sampling(context: str, rate: Optional[float]) -> None:
+    """
+    Sample a logger's DEBUG and INFO records, e.g. for high-volume webhook traffic.
+
+    Args:
+        context (str): Context of the logger (e.g. 'sdk', 'webhooks').
+        rate (float, optional): Fraction of records to keep. None or 1 disables sampling.
+    """
+    logger = logging.getLogger(f"logger.{context}")
+    for existing in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+        logger.removeFilter(existing)
+    if rate is not None and rate < 1:
+        logger.addFilter(SamplingFilter(rate))
 
-# Ensure logs directory exists
-log_dir = "logs"
-os.makedirs(log_dir, exist_ok=True)
 
 # Central logger
-def get_logger(context="sdk"):
+def get_logger(context="sdk", level: Optional[str] = None):
     """
     Get a logger with a specific context.
 
+    Records below the logger's level are discarded before a record is even built,
+    so pass message arguments lazily (`logger.debug("Payload: %s", payload)`)
+    and guard expensive ones with `logger.isEnabledFor`.
+
     Args:
         context (str): Context for the logger (e.g., 'sdk', 'webhooks').
+        level (str, optional): Logger level. Defaults to the `LOG_LEVEL` environment variable or INFO.
 
     Returns:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(f"logger.{context}")
-    logger.setLevel(logging.DEBUG)
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
-    console_handler.setFormatter(console_format)
+    logger.setLevel(level or LOG_LEVEL)
 
-    # File handler
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, "app.log"), maxBytes=5 * 1024 * 1024, backupCount=3
-    )
-    file_handler.setLevel(logging.WARNING)
-    file_format = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
-    file_handler.setFormatter(file_format)
-
-    # Add handlers if not already added
-    if not logger.hasHandlers():
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+    # Hand records to the background listener, started with the first record
+    if not any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+        logger.addHandler(_QueueHandler(_queue))
 
     return logger
 
 
+atexit.register(stop_logging)
+
 # Create loggers for SDK and Webhook
 logger = get_logger("sdk")
 webhook_logger = get_logger("webhooks")
@@ -0,0 +1,92 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List
+from .logger import logger
+
+
+def page_items(page: Any, items_key: str) -> List[Any]:
+    """
+    Return the list of items in a page, given either as a raw dict or as a
+    validated model (where `items_key` may be the field's alias).
+    """
+    if isinstance(page, dict):
+        return page[items_key]
+    for name, field in type(page).model_fields.items():
+        if items_key in (name, field.alias):
+            return getattr(page, name)
+    raise KeyError(items_key)
+
+
+def paginate(
+    fetch_page: Callable[[int], Any],
+    items_key: str,
+    page_size: int,
+    start_page: int = 1,
+) -> Iterator[Any]:
+    """
+    Lazily walk every page of a paginated endpoint, yielding individual items.
+
+    While the caller is consuming one page, the next page is already being fetched
+    on a background thread. Iteration stops after the first short (or empty) page.
+
+    Args:
+        fetch_page (Callable[[int], Any]): Fetches a page by number and returns the response.
+        items_key (str): Key (or field alias) holding the list of items in each response.
+        page_size (int): Requested items per page; a shorter page marks the end.
+        start_page (int): The first page to fetch. Defaults to 1.
+
+    Yields:
+        Any: Each item of each page, in order.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paginate")
+    try:
+        page = start_page
+        pending = executor.submit(fetch_page, page)
+        while pending is not None:
+            items = page_items(pending.result(), items_key)
+            logger.debug("Fetched page %s with %s items.", page, len(items))
+            pending = None
+            if len(items) >= page_size:
+                page += 1
+                pending = executor.submit(fetch_page, page)
+            yield from items
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=True)
+
+
+async def apaginate(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    items_key: str,
+    page_size: int,
+    start_page: int = 1,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of `paginate`: the next page is fetched in a background task
+    while the caller processes the current one.
+
+    Args:
+        fetch_page (Callable[[int], Awaitable[dict]]): Fetches a page by number.
+        items_key (str): Key (or field alias) holding the list of items in each response.
+        page_size (int): Requested items per page; a shorter page marks the end.
+        start_page (int): The first page to fetch. Defaults to 1.
+
+    Yields:
+        Any: Each item of each page, in order.
+    """
+    page = start_page
+    pending = asyncio.ensure_future(fetch_page(page))
+    try:
+        while pending is not None:
+            items = page_items(await pending, items_key)
+            logger.debug("Fetched page %s with %s items.", page, len(items))
+            pending = None
+            if len(items) >= page_size:
+                page += 1
+                pending = asyncio.ensure_future(fetch_page(page))
+            for item in items:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,103 @@
+import re
+import threading
+from typing import Dict, Optional
+
+_SEPARATORS = re.compile(r"[\s\-().]")
+_E164 = re.compile(r"^\+[1-9]\d{1,14}$")
+
+
+def normalize_e164(phone: str, default_country_code: Optional[str] = None) -> str:
+    """
+    Normalize a phone number to E.164 (`+` followed by up to 15 digits).
+
+    Spaces, dashes, dots and parentheses are removed and an international `00`
+    prefix becomes `+`. Numbers without either prefix get `default_country_code`.
+
+    Args:
+        phone (str): The phone number, e.g. `"+1 (234) 567-890"` or `"0044 20 7946 0958"`.
+        default_country_code (str, optional): Country calling code for local numbers, e.g. `"44"`.
+
+    Returns:
+        str: The normalized number, e.g. `"+1234567890"`.
+
+    Raises:
+        ValueError: If the number cannot be normalized to E.164.
+    """
+    number = _SEPARATORS.sub("", phone or "")
+    if number.startswith("00"):
+        number = "+" + number[2:]
+    elif not number.startswith("+") and default_country_code:
+        number = f"+{default_country_code.lstrip('+')}{number.lstrip('0')}"
+    if not _E164.match(number):
+        raise ValueError(f"Invalid phone number: {phone!r}")
+    return number
+
+
+class PhoneIndex:
+    """
+    Thread-safe in-memory index of contacts by normalized E.164 phone number.
+
+    Lookups are O(1). Contacts whose phone number cannot be normalized are not indexed.
+    """
+
+    def __init__(self, default_country_code: Optional[str] = None):
+        """
+        Args:
+            default_country_code (str, optional): Country calling code for local numbers.
+        """
+        self.default_country_code = default_country_code
+        self._by_phone: Dict[str, Dict] = {}
+        self._phone_by_id: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_phone)
+
+    def normalize(self, phone: str) -> str:
+        """
+        Normalize `phone` with this index's default country code.
+        """
+        return normalize_e164(phone, self.default_country_code)
+
+    def get(self, phone: str) -> Optional[Dict]:
+        """
+        Return the indexed contact with this phone number, or None.
+
+        Raises:
+            ValueError: If the phone number is invalid.
+        """
+        key = self.normalize(phone)
+        with self._lock:
+            return self._by_phone.get(key)
+
+    def add(self, contact: Dict) -> None:
+        """
+        Index (or re-index, if its phone changed) a contact returned by the API.
+        """
+        try:
+            key = self.normalize(contact["phone"])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            old_key = self._phone_by_id.get(contact["id"])
+            if old_key is not None and old_key != key:
+                self._by_phone.pop(old_key, None)
+            self._by_phone[key] = contact
+            self._phone_by_id[contact["id"]] = key
+
+    def remove(self, contact_id: str) -> None:
+        """
+        Remove a contact from the index by ID.
+        """
+        with self._lock:
+            key = self._phone_by_id.pop(contact_id, None)
+            if key is not None and self._by_phone.get(key, {}).get("id") == contact_id:
+                del self._by_phone[key]
+
+    def clear(self) -> None:
+        """
+        Remove every contact from the index.
+        """
+        with self._lock:
+            self._by_phone.clear()
+            self._phone_by_id.clear()
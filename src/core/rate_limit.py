@@ -0,0 +1,211 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from .logger import logger
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header value into seconds.
+
+    Args:
+        value (str, optional): Either delay-seconds or an HTTP-date.
+
+    Returns:
+        float, optional: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so the lock is
+    only held for a few arithmetic operations and the same bucket can be shared
+    by threads and asyncio tasks alike.
+
+    The bucket also supports adaptive throttling: `throttle()` pauses it and cuts
+    its rate (e.g. after a 429), and `recover()` gradually restores the configured
+    rate after successful calls.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: Optional[float] = None, min_rate: float = 0.1):
+        """
+        Args:
+            rate (float, optional): Tokens added per second. None means unlimited,
+                though the bucket can still be paused by `throttle()`.
+            capacity (float, optional): Maximum burst size. Defaults to `rate` (one second of traffic).
+            min_rate (float): Lower bound for the adaptive rate.
+        """
+        self.configured_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate or 1.0)
+        self.min_rate = min_rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, returning how many seconds the caller must wait before using it.
+
+        Returns:
+            float: The delay in seconds (0 if a token is available now).
+        """
+        with self._lock:
+            now = time.monotonic()
+            pause = max(0.0, self._paused_until - now)
+            if self.rate is None:
+                return pause
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, pause)
+
+    def throttle(self, retry_after: Optional[float], factor: float = 0.5) -> None:
+        """
+        Slow the bucket down after the server rejected a request.
+
+        Args:
+            retry_after (float, optional): Seconds during which no request may pass.
+            factor (float): Multiplier applied to the current rate.
+        """
+        with self._lock:
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            if self.rate is not None:
+                self.rate = max(self.min_rate, self.rate * factor)
+
+    def recover(self, step: float = 0.1) -> None:
+        """
+        Move the rate back towards its configured value after a successful call.
+
+        Args:
+            step (float): Fraction of the configured rate restored per call.
+        """
+        if self.rate is None or self.rate >= self.configured_rate:
+            return
+        with self._lock:
+            self.rate = min(self.configured_rate, self.rate + self.configured_rate * step)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with a global bucket and optional per-endpoint buckets.
+
+    Endpoints are identified by their template (see `endpoint_template`), e.g.
+    `"POST /messages"`. One limiter can be shared by every thread and task that
+    uses the same client. When the server answers 429, the endpoint's bucket (or
+    the global one if the endpoint has no limit of its own) is paused for
+    `Retry-After` and its rate is cut, then recovered gradually.
+
+    Attributes:
+        stats (dict): `throttled_seconds` (total time callers were delayed),
+            `throttled_requests` (calls that had to wait) and `rate_limited_responses`
+            (429s received).
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        backoff_factor: float = 0.5,
+        recovery_step: float = 0.1,
+    ):
+        """
+        Args:
+            rate (float, optional): Global requests per second. None disables the global limit.
+            burst (float, optional): Global burst size. Defaults to `rate`.
+            endpoint_limits (dict, optional): Map of endpoint template to `(rate, burst)`.
+            backoff_factor (float): Rate multiplier applied when a 429 is received.
+            recovery_step (float): Fraction of the configured rate restored per successful call.
+        """
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.global_bucket = TokenBucket(rate, burst)
+        self.endpoint_buckets = {
+            key: TokenBucket(endpoint_rate, endpoint_burst)
+            for key, (endpoint_rate, endpoint_burst) in (endpoint_limits or {}).items()
+        }
+        self.stats = {"throttled_seconds": 0.0, "throttled_requests": 0, "rate_limited_responses": 0}
+        self._stats_lock = threading.Lock()
+
+    def _buckets(self, key: str):
+        bucket = self.endpoint_buckets.get(key)
+        return (self.global_bucket, bucket) if bucket else (self.global_bucket,)
+
+    def _reserve(self, key: str) -> float:
+        delay = max(bucket.reserve() for bucket in self._buckets(key))
+        if delay > 0:
+            with self._stats_lock:
+                self.stats["throttled_seconds"] += delay
+                self.stats["throttled_requests"] += 1
+            logger.debug("Rate limiter delaying %s by %.3fs", key, delay)
+        return delay
+
+    def acquire(self, key: str) -> None:
+        """
+        Block the current thread until a request to `key` may be sent.
+
+        Args:
+            key (str): The endpoint template, e.g. `"GET /contacts/{id}"`.
+        """
+        delay = self._reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, key: str) -> None:
+        """
+        Wait, without blocking the event loop, until a request to `key` may be sent.
+
+        Args:
+            key (str): The endpoint template, e.g. `"GET /contacts/{id}"`.
+        """
+        delay = self._reserve(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_rate_limited(self, key: str, retry_after: Optional[float]) -> None:
+        """
+        Record a 429 response for `key` and slow down accordingly.
+
+        Args:
+            key (str): The endpoint template that was rejected.
+            retry_after (float, optional): Seconds from the `Retry-After` header.
+        """
+        with self._stats_lock:
+            self.stats["rate_limited_responses"] += 1
+        logger.warning("Rate limited on %s; pausing for %ss", key, retry_after or 0)
+        # Endpoints with their own limit absorb their 429s; everything else slows the whole client
+        bucket = self.endpoint_buckets.get(key) or self.global_bucket
+        bucket.throttle(retry_after, self.backoff_factor)
+
+    def on_success(self, key: str) -> None:
+        """
+        Record a successful response for `key`, letting throttled buckets recover.
+
+        Args:
+            key (str): The endpoint template that succeeded.
+        """
+        for bucket in self._buckets(key):
+            bucket.recover(self.recovery_step)
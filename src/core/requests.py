@@ -1,17 +1,60 @@
+import inspect
+
+import httpx
 import requests
 
 from functools import wraps
 from .logger import logger
 
+
+def endpoint_template(method: str, endpoint: str) -> str:
+    """
+    Collapse a concrete request into its endpoint template, e.g.
+    `("GET", "/contacts/abc123?x=1")` becomes `"GET /contacts/{id}"`.
+
+    Used to key per-endpoint state (rate limits, circuit breakers, metrics)
+    without creating one entry per resource ID.
+
+    Args:
+        method (str): The HTTP method.
+        endpoint (str): The endpoint path, optionally with a query string.
+
+    Returns:
+        str: The method and templated path.
+    """
+    path = endpoint.split("?", 1)[0].rstrip("/") or "/"
+    segments = path.split("/")
+    # "/contacts/abc" -> ["", "contacts", "abc"]: everything after the collection is an ID
+    templated = segments[:2] + ["{id}" for _ in segments[2:]]
+    return f"{method.upper()} {'/'.join(templated)}"
+
+
 def handle_request_errors(func):
+    """
+    Log transport-level errors raised by `requests` or `httpx` before re-raising them.
+    Supports both regular and `async` functions.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                logger.error("HTTPError: %s", e)
+                raise
+            except httpx.HTTPError as e:
+                logger.error("RequestException: %s", e)
+                raise
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTPError: {e}")
+            logger.error("HTTPError: %s", e)
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"RequestException: {e}")
+            logger.error("RequestException: %s", e)
             raise
     return wrapper
@@ -1,32 +1,221 @@
+import asyncio
+import inspect
+import random
+import threading
 import time
 from functools import wraps
+from typing import Any, Callable, Optional, Tuple
+
+import httpx
+import requests
+
 from .logger import logger
-from .exceptions import TransientError
+from .exceptions import TransientError, RetryExhaustedError
+
+# Transport failures that are safe to classify as transient: the request either never
+# reached the server or the connection died before a response arrived.
+NETWORK_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    httpx.TransportError,
+)
+
+
+class RetryBudget:
+    """
+    Caps retry amplification to a fraction of regular traffic.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one, so
+    at most roughly `ratio` retries are made per request over time. A small
+    reserve lets low-volume clients retry at all. When a partial outage makes
+    most calls fail, the budget drains and callers fail fast instead of
+    multiplying the load on the struggling server.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        """
+        Args:
+            ratio (float): Retries allowed per first attempt.
+            min_tokens (float): Tokens available before any traffic has been seen.
+            max_tokens (float): Upper bound on saved-up tokens.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Try to spend a token on a retry.
+
+        Returns:
+            bool: True if the retry may proceed.
+        """
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class RetryPolicy:
+    """
+    Configurable retry policy: exponential backoff with full jitter, an overall
+    deadline, an optional retry budget and classification of retryable errors.
+
+    `call()` runs a function with retries using `time.sleep`; `acall()` runs a
+    coroutine function with retries using `asyncio.sleep`.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        max_elapsed: Optional[float] = 30.0,
+        retry_on: Tuple[int, ...] = (429, 502, 503, 504),
+        retry_network_errors: bool = True,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Args:
+            max_attempts (int): Maximum number of attempts, including the first one.
+            base_delay (float): Backoff before the first retry, in seconds.
+            max_delay (float): Upper bound for a single backoff, in seconds.
+            multiplier (float): Growth factor of the backoff between retries.
+            jitter (bool): Use "full jitter" (a random delay between 0 and the backoff).
+            max_elapsed (float, optional): Give up once retrying would exceed this many seconds overall.
+            retry_on (tuple): HTTP status codes of `TransientError`s to retry on.
+            retry_network_errors (bool): Retry connection errors and timeouts.
+            budget (RetryBudget, optional): Shared budget limiting retry amplification.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.retry_on = retry_on
+        self.retry_network_errors = retry_network_errors
+        self.budget = budget
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Decide whether an error is worth retrying.
+
+        Args:
+            error (Exception): The error raised by the attempt.
+
+        Returns:
+            bool: True for transient HTTP statuses in `retry_on` and, if enabled, network errors.
+        """
+        if isinstance(error, TransientError):
+            return error.status_code in self.retry_on
+        return self.retry_network_errors and isinstance(error, NETWORK_ERRORS)
+
+    def compute_delay(self, retry_number: int, error: Exception) -> float:
+        """
+        Compute the backoff before the given retry.
+
+        Args:
+            retry_number (int): 1 for the first retry, 2 for the second, and so on.
+            error (Exception): The error that triggered the retry.
+
+        Returns:
+            float: Seconds to wait. Never shorter than a server-provided `Retry-After`.
+        """
+        backoff = min(self.max_delay, self.base_delay * self.multiplier ** (retry_number - 1))
+        delay = random.uniform(0, backoff) if self.jitter else backoff
+        retry_after = getattr(error, "retry_after", None)
+        return max(delay, retry_after) if retry_after else delay
 
+    def _next_delay(self, attempt: int, started: float, error: Exception) -> float:
+        """
+        Decide what to do after a failed attempt.
 
-def retry(max_retries: int = 3, backoff: int = 2, retry_on: tuple = (502, 503)):
+        Returns:
+            float: Seconds to sleep before the next attempt.
+
+        Raises:
+            Exception: The original error if it is not retryable or the budget is spent.
+            RetryExhaustedError: If attempts or the overall deadline are exhausted.
+        """
+        if not self.is_retryable(error):
+            raise error
+        if attempt >= self.max_attempts:
+            raise RetryExhaustedError(attempt, error) from error
+        delay = self.compute_delay(attempt, error)
+        if self.max_elapsed is not None and time.monotonic() - started + delay > self.max_elapsed:
+            logger.warning("Retry deadline of %ss reached after %s attempts.", self.max_elapsed, attempt)
+            raise RetryExhaustedError(attempt, error) from error
+        if self.budget is not None and not self.budget.withdraw():
+            logger.warning("Retry budget exhausted; not retrying.")
+            raise error
+        logger.warning("Retrying due to %s (attempt %s/%s) in %.2fs...", error, attempt, self.max_attempts, delay)
+        return delay
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call `func` with retries, sleeping between attempts with `time.sleep`.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, started, e)
+            time.sleep(delay)
+
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await `func` with retries, sleeping between attempts with `asyncio.sleep`.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, started, e)
+            await asyncio.sleep(delay)
+
+
+def retry(policy: Optional[RetryPolicy] = None, **policy_kwargs):
     """
     Retry decorator for handling transient errors.
 
+    Coroutine functions are retried with `asyncio.sleep`, so the backoff never
+    blocks the event loop.
+
     Args:
-        max_retries (int): Maximum number of retries.
-        backoff (int): Backoff time in seconds between retries.
-        retry_on (tuple): HTTP status codes to retry on.
+        policy (RetryPolicy, optional): The policy to apply. If omitted, one is built
+            from `policy_kwargs` (see `RetryPolicy` for the available options).
     """
+    policy = policy or RetryPolicy(**policy_kwargs)
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await policy.acall(func, *args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
-                try:
-                    return func(*args, **kwargs)
-                except TransientError as e:
-                    if e.status_code in retry_on:
-                        logger.warning(f"Retrying due to {e} (attempt {retries + 1}/{max_retries})...")
-                        retries += 1
-                        time.sleep(backoff)
-                    else:
-                        raise
-            raise RuntimeError(f"Failed after {max_retries} retries.")
+            return policy.call(func, *args, **kwargs)
         return wrapper
     return decorator
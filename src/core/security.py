@@ -19,14 +19,51 @@ def generate_signature(payload: dict, secret: str) -> str:
         str: Hexadecimal HMAC signature.
     """
     try:
-        # Serialize payload to JSON with stable formatting
-        message = json.dumps(payload, separators=(",", ":")).encode("utf-8")  # Convert to bytes
+        # Fixed canonical form (stdlib, ASCII-escaped), independent of the JSON codec
+        message = json.dumps(payload, separators=(",", ":")).encode("utf-8")
         hmac_instance = hmac.new(secret.encode("utf-8"), message, hashlib.sha256)
         return hmac_instance.hexdigest()
     except Exception as e:
         raise ValueError(f"Error generating signature: {str(e)}")
 
 
+class SignatureVerifier:
+    """
+    Incremental HMAC-SHA256 check of a webhook body.
+
+    Feed the raw body chunk by chunk as it arrives with `update`, then call
+    `verify`, so the signature can be checked before anything is parsed and
+    without holding a second copy of the body.
+    """
+
+    def __init__(self, secret: str):
+        """
+        Args:
+            secret (str): Webhook secret.
+        """
+        self._hmac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Add the next chunk of the raw body.
+        """
+        self._hmac.update(chunk)
+
+    def verify(self, signature: str) -> bool:
+        """
+        Compare the signature of the bytes seen so far with `signature` in constant time.
+
+        Raises:
+            UnauthorizedError: If the signature is invalid.
+        """
+        if not hmac.compare_digest(self._hmac.hexdigest(), signature):
+            logger.error("Invalid HMAC signature.")
+            raise UnauthorizedError(
+                message="Unauthorized: Signature validation failed."
+            )
+        return True
+
+
 def verify_signature(message: bytes, signature: str, secret: str):
     """
     Validate the HMAC signature of incoming webhooks.
@@ -41,20 +78,13 @@ def verify_signature(message: bytes, signature: str, secret: str):
     """
     logger.info("Validating HMAC signature.")
     try:
-        # Create HMAC using secret and SHA256
-        hmac_instance = hmac.new(secret.encode("utf-8"), message, hashlib.sha256)
-        expected_signature = hmac_instance.hexdigest()
-
-        # Validate the signature
-        if not hmac.compare_digest(expected_signature, signature):
-            logger.error("Invalid HMAC signature.")
-            raise UnauthorizedError(
-                message="Unauthorized: Signature validation failed."
-            )
+        verifier = SignatureVerifier(secret)
+        verifier.update(message)
+        verifier.verify(signature)
 
         logger.info("HMAC signature validated successfully.")
         return True
 
     except Exception as e:
-        logger.error(f"Error validating signature: {str(e)}")
+        logger.error("Error validating signature: %s", e)
         raise
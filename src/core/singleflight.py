@@ -0,0 +1,130 @@
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def request_key(method: str, endpoint: str, **kwargs) -> str:
+    """
+    Build the coalescing key of a request: method, endpoint and the remaining
+    request arguments (query parameters, headers, ...) in a stable order.
+
+    Args:
+        method (str): The HTTP method.
+        endpoint (str): The API endpoint path.
+        **kwargs: The request arguments.
+
+    Returns:
+        str: e.g. `'GET /contacts {"params": {"max": 10, "pageIndex": 1}}'`.
+    """
+    key = f"{method.upper()} {endpoint}"
+    if kwargs:
+        key += " " + json.dumps(kwargs, sort_keys=True, default=str)
+    return key
+
+
+class _Call:
+    """An in-flight call shared by every caller with the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one.
+
+    While a call for a key is in flight, other threads asking for the same key
+    wait for it and receive its result, or its error, instead of starting their
+    own. Once it completes, the next call for the key starts afresh; nothing is
+    cached.
+
+    Attributes:
+        stats (dict): `calls` actually executed and `collapsed` calls that shared one.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "collapsed": 0}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run `func`, or wait for the in-flight call with the same key.
+
+        Args:
+            key (str): Identifies identical calls, see `request_key`.
+            func (Callable): The call to run if none is in flight.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats["calls"] += 1
+            else:
+                self.stats["collapsed"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of `SingleFlight`.
+
+    The shared call runs as its own task, so one caller being cancelled does not
+    cancel the request for the others.
+
+    Attributes:
+        stats (dict): `calls` actually executed and `collapsed` calls that shared one.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.stats = {"calls": 0, "collapsed": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `func()`, or the in-flight call with the same key.
+
+        Args:
+            key (str): Identifies identical calls, see `request_key`.
+            func (Callable): Coroutine function to run if no call is in flight.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.stats["calls"] += 1
+        else:
+            self.stats["collapsed"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        self._calls.pop(key, None)
+        # Mark the error as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,169 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from .cache import CacheBackend
+from .logger import logger
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_updated ON cache_entries (namespace, updated_at);
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Durable cache store backed by a local SQLite database in WAL mode.
+
+    Entries survive process restarts, so a redeployed worker starts warm. Several
+    stores can share one file by using different namespaces (e.g. `"contacts"` and
+    `"messages"`). The database is versioned with `PRAGMA user_version`; a file
+    written by an incompatible version is discarded and rebuilt, since its
+    content can always be fetched again.
+
+    Attributes:
+        stats (dict): `hits`, `misses`, `evictions` (dropped to respect `max_entries`)
+            and `expirations` (dropped because their TTL passed).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str = "default",
+        ttl: Optional[float] = 24 * 3600.0,
+        max_entries: int = 100_000,
+        prune_interval: int = 100,
+    ):
+        """
+        Args:
+            path (str): Database file, created if missing. `":memory:"` gives a non-durable store.
+            namespace (str): Partition of the database used by this store.
+            ttl (float, optional): Default time-to-live in seconds. None keeps entries until evicted.
+            max_entries (int): Size cap of the namespace; the oldest written entries are evicted.
+            prune_interval (int): Writes between size-cap and expiry sweeps.
+        """
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._setup()
+
+    def _setup(self) -> None:
+        """
+        Enable WAL mode and create or migrate the schema.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                logger.warning(
+                    "Discarding cache %s with schema version %s (expected %s)", self.path, version, SCHEMA_VERSION
+                )
+                self._conn.execute("DROP TABLE IF EXISTS cache_entries")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return default
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+                )
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return default
+            self.stats["hits"] += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        data = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, data, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self.prune_interval == 0:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """
+        Drop expired entries and enforce `max_entries`. Called with the lock held.
+        """
+        expired = self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, now)
+        ).rowcount
+        self.stats["expirations"] += expired
+        excess = self._conn.execute(
+            "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY updated_at LIMIT ?)",
+                (self.namespace, self.namespace, excess),
+            )
+            self.stats["evictions"] += excess
+
+    def prune(self) -> None:
+        """
+        Drop expired entries and enforce the size cap now.
+        """
+        with self._lock:
+            self._prune(time.time())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                (self.namespace, len(prefix), prefix),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
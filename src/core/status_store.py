@@ -0,0 +1,201 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from src.schemas.messages import TERMINAL_STATUSES
+from .logger import logger
+
+# Ordering of message statuses; a status never moves back to a lower rank
+STATUS_RANK = {"queued": 0, "delivered": 1, "failed": 1}
+
+StatusListener = Callable[[str, Dict], None]
+
+# (message_id, status, delivered_at) as carried by a delivery webhook
+StatusEvent = Tuple[str, str, Optional[Union[datetime, str]]]
+
+
+class MessageStatusStore:
+    """
+    Latest known delivery status of each message, fed by webhook events.
+
+    Transitions are monotonic: `queued` may become `delivered` or `failed`, and a
+    terminal status never changes again. Events arriving out of order (a late
+    `queued` after `delivered`) or duplicated are ignored, so the store is safe
+    to feed from retried or concurrent webhook deliveries.
+
+    Instead of polling `Messages.get_message`, callers can read the store, block
+    on `wait_for_status` / `wait_for_status_async`, or `subscribe` to changes.
+
+    Attributes:
+        stats (dict): `applied` status changes and `ignored` stale or duplicate events.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        """
+        Args:
+            max_entries (int): Messages tracked before the least recently updated are dropped.
+        """
+        self.max_entries = max_entries
+        self._statuses: "OrderedDict[str, Dict]" = OrderedDict()
+        self._listeners: List[StatusListener] = []
+        self._changed = threading.Condition()
+        self.stats = {"applied": 0, "ignored": 0}
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def get(self, message_id: str) -> Optional[Dict]:
+        """
+        Return the latest known status of a message, or None if unknown.
+
+        Returns:
+            dict: `{"id": ..., "status": ..., "deliveredAt": ...}`.
+        """
+        with self._changed:
+            return self._statuses.get(message_id)
+
+    def update(self, message_id: str, status: str, delivered_at: Optional[Union[datetime, str]] = None) -> bool:
+        """
+        Record a status event for a message.
+
+        Args:
+            message_id (str): The message ID.
+            status (str): One of 'queued', 'delivered' or 'failed'.
+            delivered_at (datetime | str, optional): Delivery timestamp, if any.
+
+        Returns:
+            bool: True if the event changed the stored status, False if it was stale or a duplicate.
+
+        Raises:
+            ValueError: If the status is unknown.
+        """
+        return self.update_many([(message_id, status, delivered_at)])[0]
+
+    def update_many(self, events: Iterable[StatusEvent]) -> List[bool]:
+        """
+        Record a batch of status events under a single lock acquisition.
+
+        Waiters are woken and listeners called once per applied change, after the
+        whole batch has been recorded.
+
+        Args:
+            events (Iterable[tuple]): `(message_id, status, delivered_at)` tuples.
+
+        Returns:
+            list[bool]: For each event, whether it changed the stored status.
+
+        Raises:
+            ValueError: If a status is unknown; no event of the batch is recorded.
+        """
+        events = [
+            (message_id, status, delivered_at.isoformat() if isinstance(delivered_at, datetime) else delivered_at)
+            for message_id, status, delivered_at in events
+        ]
+        for _, status, _ in events:
+            if status not in STATUS_RANK:
+                raise ValueError(f"Unknown message status: {status}")
+
+        results = []
+        applied = []
+        with self._changed:
+            for message_id, status, delivered_at in events:
+                current = self._statuses.get(message_id)
+                if current is not None and STATUS_RANK[status] <= STATUS_RANK[current["status"]]:
+                    self.stats["ignored"] += 1
+                    results.append(False)
+                    continue
+                record = {"id": message_id, "status": status, "deliveredAt": delivered_at}
+                self._statuses[message_id] = record
+                self._statuses.move_to_end(message_id)
+                self.stats["applied"] += 1
+                applied.append((message_id, record))
+                results.append(True)
+            while len(self._statuses) > self.max_entries:
+                self._statuses.popitem(last=False)
+            if applied:
+                self._changed.notify_all()
+            listeners = list(self._listeners)
+        for message_id, record in applied:
+            for listener in listeners:
+                try:
+                    listener(message_id, record)
+                except Exception as e:
+                    logger.error("Message status listener failed: %s", e)
+        return results
+
+    def subscribe(self, listener: StatusListener) -> Callable[[], None]:
+        """
+        Call `listener(message_id, record)` after every applied status change.
+
+        Listeners run on the thread that recorded the event; exceptions are logged
+        and do not affect the store or other listeners.
+
+        Returns:
+            Callable: Removes the listener when called.
+        """
+        with self._changed:
+            self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with self._changed:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+
+    def wait_for_status(
+        self, message_id: str, statuses: Iterable[str] = TERMINAL_STATUSES, timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Block until a message reaches one of `statuses`.
+
+        Args:
+            message_id (str): The message ID.
+            statuses (Iterable[str]): Statuses to wait for. Defaults to the terminal ones.
+            timeout (float, optional): Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            dict: The status record, or None if the timeout expired first.
+        """
+        statuses = tuple(statuses)
+
+        def reached() -> Optional[Dict]:
+            record = self._statuses.get(message_id)
+            return record if record is not None and record["status"] in statuses else None
+
+        with self._changed:
+            return self._changed.wait_for(reached, timeout=timeout)
+
+    async def wait_for_status_async(
+        self, message_id: str, statuses: Iterable[str] = TERMINAL_STATUSES, timeout: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Asynchronously wait until a message reaches one of `statuses`, without
+        blocking the event loop. Events may be recorded from any thread.
+
+        Args:
+            message_id (str): The message ID.
+            statuses (Iterable[str]): Statuses to wait for. Defaults to the terminal ones.
+            timeout (float, optional): Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            dict: The status record, or None if the timeout expired first.
+        """
+        statuses = tuple(statuses)
+        loop = asyncio.get_running_loop()
+        reached = loop.create_future()
+
+        def listener(changed_id: str, record: Dict) -> None:
+            if changed_id == message_id and record["status"] in statuses:
+                loop.call_soon_threadsafe(lambda: reached.done() or reached.set_result(record))
+
+        unsubscribe = self.subscribe(listener)
+        try:
+            record = self.get(message_id)
+            if record is not None and record["status"] in statuses:
+                return record
+            return await asyncio.wait_for(reached, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            unsubscribe()
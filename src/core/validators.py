@@ -1,30 +1,204 @@
-from pydantic import ValidationError
-from functools import wraps
-from typing import Any, Callable
+import inspect
+
+from enum import Enum
+from functools import lru_cache, wraps
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Callable, Optional, Union
 from .logger import logger
 
 
+class ValidationMode(str, Enum):
+    """
+    How API responses are validated.
+
+    - strict: invalid responses raise `ValueError` (the default).
+    - lenient: invalid responses are logged and returned unchanged.
+    - off: responses are not validated and returned as raw dicts; for trusted
+      servers and hot paths.
+
+    Request payloads are always validated.
+    """
+    STRICT = "strict"
+    LENIENT = "lenient"
+    OFF = "off"
+
+
+class ResponseFormat(str, Enum):
+    """
+    What SDK methods return.
+
+    - model: the validated Pydantic model (`Contact`, `Message`, ...), built in a
+      single validation pass (the default).
+    - raw: the JSON response as a plain dict.
+    """
+    MODEL = "model"
+    RAW = "raw"
+
+
+_mode: Optional[ValidationMode] = None
+_format: Optional[ResponseFormat] = None
+
+
+def _settings() -> Any:
+    # Imported on use so that importing the SDK does not load pydantic-settings or `.env`
+    from .config import get_sdk_options
+    return get_sdk_options()
+
+
+def set_validation_mode(mode: Union[ValidationMode, str, None]) -> None:
+    """
+    Set the response validation mode for the whole SDK.
+
+    Args:
+        mode (ValidationMode | str, optional): "strict", "lenient" or "off".
+            None falls back to `settings.VALIDATION_MODE`.
+    """
+    global _mode
+    _mode = ValidationMode(mode) if mode is not None else None
+
+
+def get_validation_mode() -> ValidationMode:
+    """
+    Return the active response validation mode.
+    """
+    return _mode if _mode is not None else ValidationMode(_settings().VALIDATION_MODE)
+
+
+def set_response_format(response_format: Union[ResponseFormat, str, None]) -> None:
+    """
+    Choose whether SDK methods return models or raw dicts.
+
+    Args:
+        response_format (ResponseFormat | str, optional): "model" or "raw".
+            None falls back to `settings.RESPONSE_FORMAT`.
+    """
+    global _format
+    _format = ResponseFormat(response_format) if response_format is not None else None
+
+
+def get_response_format() -> ResponseFormat:
+    """
+    Return the active response format.
+    """
+    return _format if _format is not None else ResponseFormat(_settings().RESPONSE_FORMAT)
+
+
+@lru_cache(maxsize=None)
+def get_adapter(model: Any) -> TypeAdapter:
+    """
+    Return the compiled `TypeAdapter` for a model, building it once per model.
+    """
+    return TypeAdapter(model)
+
+
+def _log_validation_error(kind: str, error: ValidationError) -> None:
+    logger.error("%s Validation Error: %s", kind, error.json())
+    for detail in error.errors():
+        logger.error("Field: %s, Error: %s", detail["loc"], detail["msg"])
+
+
+def validate_payload(model: Any, payload: dict) -> None:
+    """
+    Validate a single request payload against a Pydantic model.
+
+    Args:
+        model (Any): The Pydantic model describing the payload.
+        payload (dict): The payload to validate.
+
+    Raises:
+        ValueError: If the payload does not match the model.
+    """
+    try:
+        logger.debug("Validating request payload: %s", payload)
+        get_adapter(model).validate_python(payload)
+    except ValidationError as e:
+        _log_validation_error("Request", e)
+        raise ValueError("Invalid payload")  # Halt execution here
+
+
+def validate_json(model: Any, data: Union[str, bytes]) -> Any:
+    """
+    Parse and validate raw JSON in a single pass, without building an
+    intermediate dict first.
+
+    Args:
+        model (Any): The Pydantic model (or type) describing the document.
+        data (str | bytes): The raw JSON.
+
+    Returns:
+        Any: The validated model instance.
+
+    Raises:
+        ValueError: If the JSON is malformed or does not match the model.
+    """
+    try:
+        return get_adapter(model).validate_json(data)
+    except ValidationError as e:
+        _log_validation_error("JSON", e)
+        raise ValueError(f"Invalid JSON document: {e}")
+
+
+def _check_request(model: Any, kwargs: dict) -> None:
+    """
+    Validate the `payload` keyword argument against the request model.
+
+    Raises:
+        ValueError: If the payload does not match the model.
+    """
+    if "payload" in kwargs:
+        validate_payload(model, kwargs["payload"])
+    else:
+        logger.warning("No payload provided for validation.")
+
+
+def parse_response(model: Any, response: Any) -> Any:
+    """
+    Validate an API response against the response model and return the result
+    in the active `ResponseFormat`, according to the active `ValidationMode`.
+
+    In `off` mode, and for invalid responses in `lenient` mode, the response is
+    returned as received.
+
+    Args:
+        model (Any): The Pydantic model describing the response.
+        response (Any): The decoded JSON response.
+
+    Returns:
+        Any: The model instance, or the response itself in raw format.
+
+    Raises:
+        ValueError: If the response does not match the model in strict mode.
+    """
+    mode = get_validation_mode()
+    if mode is ValidationMode.OFF:
+        return response
+    try:
+        result = get_adapter(model).validate_python(response)
+    except ValidationError as e:
+        _log_validation_error("Response", e)
+        if mode is ValidationMode.LENIENT:
+            return response
+        raise ValueError(f"Invalid response: {e}")
+    return response if get_response_format() is ResponseFormat.RAW else result
+
+
 def validate_request(model: Any):
     """
     Decorator to validate request payloads using a Pydantic model.
     Logs detailed errors for invalid inputs and halts execution.
+    Works with both regular and `async` functions.
     """
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _check_request(model, kwargs)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if "payload" in kwargs:
-                try:
-                    logger.debug("Entering validate_request decorator.")
-                    logger.info(f"Validating request payload: {kwargs['payload']}")
-                    model(**kwargs["payload"])  # Validate the payload
-                    logger.debug("Exiting validate_request decorator.")
-                except ValidationError as e:
-                    logger.error(f"Request Validation Error: {e.json()}")
-                    for error in e.errors():
-                        logger.error(f"Field: {error['loc']}, Error: {error['msg']}")
-                    raise ValueError("Invalid payload")  # Halt execution here
-            else:
-                logger.warning("No payload provided for validation.")
+            _check_request(model, kwargs)
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -32,22 +206,20 @@ def validate_request(model: Any):
 
 def validate_response(model: Any):
     """
-    Decorator to validate API responses using a Pydantic model.
+    Decorator to validate API responses using a Pydantic model and return the
+    validated model (or the raw response, see `ResponseFormat`).
     Logs detailed errors for invalid responses.
+    Works with both regular and `async` functions.
     """
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return parse_response(model, await func(*args, **kwargs))
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.debug("Entering validate_response decorator.")
-            response = func(*args, **kwargs)
-            try:
-                model(**response)  # Validate the response
-                logger.debug("Exiting validate_response decorator.")
-                return response
-            except ValidationError as e:
-                logger.error(f"Response Validation Error: {e.json()}")
-                for error in e.errors():
-                    logger.error(f"Field: {error['loc']}, Error: {error['msg']}")
-                raise ValueError(f"Invalid response: {e}")
+            return parse_response(model, func(*args, **kwargs))
         return wrapper
     return decorator
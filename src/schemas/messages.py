@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Literal, Union, Optional
+from typing import Any, Dict, List, Literal, Union, Optional
 from datetime import datetime
 
+# Statuses after which a message never changes again
+TERMINAL_STATUSES = ("delivered", "failed")
+
 
 class MessageContact(BaseModel):
     """
@@ -103,27 +106,15 @@ class Message(BaseModel):
         json_schema_extra={"example": "2024-12-06T03:01:37.416Z"}
     )
 
+    @field_validator("to", mode="before")
     @classmethod
     def validate_to_field(cls, value):
         """
-        Custom validator for the 'to' field to normalize its structure.
+        Normalize a bare contact ID in 'to' into a ContactDetails object.
         """
         if isinstance(value, str):
-            # Treat the string as a contact ID and wrap it in a ContactDetails object
-            return ContactDetails(id=value)
-        elif isinstance(value, dict):
-            # Parse it as a ContactDetails object
-            return ContactDetails(**value)
-        raise ValueError("'to' must be a valid contact ID (str) or ContactDetails object.")
-
-    @classmethod
-    def model_validate(cls, data):
-        """
-        Custom validation for the entire model to preprocess 'to'.
-        """
-        if "to" in data:
-            data["to"] = cls.validate_to_field(data["to"])
-        return super().model_validate(data)
+            return {"id": value}
+        return value
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -153,3 +144,28 @@ class ListMessagesResponse(BaseModel):
         populate_by_name=True,
         arbitrary_types_allowed=True
     )
+
+
+class BulkSendResult(BaseModel):
+    """
+    Outcome of a single message within a bulk send.
+
+    Attributes:
+        index (int): Position of the payload in the input iterable.
+        payload (dict): The payload that was sent (or rejected).
+        response (Optional[Message]): The sent message when the send succeeded (a dict in raw format).
+        error (Optional[Exception]): The validation or API error when the send failed.
+    """
+    index: int = Field(..., description="Position of the payload in the input iterable.")
+    payload: Dict[str, Any] = Field(..., description="The payload that was sent.")
+    response: Optional[Any] = Field(None, description="The sent message on success.")
+    error: Optional[Exception] = Field(None, description="The error raised on failure.")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the message was sent successfully."""
+        return self.error is None
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True
+    )
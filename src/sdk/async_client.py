@@ -0,0 +1,173 @@
+import asyncio
+import time
+import httpx
+from typing import Any, Optional
+from src.core.logger import logger
+from src.core.requests import handle_request_errors, endpoint_template
+from src.core.retry import RetryPolicy
+from src.core.singleflight import request_key
+from .client import BaseApiClient
+
+
+class AsyncApiClient(BaseApiClient):
+    """
+    An asyncio API client built on `httpx.AsyncClient`.
+
+    Mirrors `ApiClient`: the same authentication, error mapping and retry rules,
+    but requests and retry backoff never block the event loop, so many calls can
+    be in flight concurrently from a single process. Share one instance between
+    `AsyncContacts` and `AsyncMessages`, and release it with `aclose()` or by
+    using it as an async context manager.
+    """
+
+    body_argument = "content"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **options,
+    ):
+        """
+        Initialize the async API client with configuration and authentication details.
+
+        Args:
+            base_url (str, optional): API base URL. Defaults to `settings.BASE_URL`.
+            api_key (str, optional): API key. Defaults to `settings.API_KEY`.
+            max_connections (int): Maximum number of concurrent connections.
+            max_keepalive_connections (int): Maximum number of idle keep-alive connections.
+            keepalive_expiry (float): Seconds an idle connection is kept open.
+            transport (httpx.AsyncBaseTransport, optional): Custom transport, e.g. for testing.
+            **options: Shared client options (`timeout`, `rate_limiter`, `retry_policy`,
+                `circuit_breaker`, `hedging`, `singleflight`, `http_cache`, `idempotency`); see `BaseApiClient`.
+        """
+        super().__init__(base_url=base_url, api_key=api_key, **options)
+        self.http = httpx.AsyncClient(
+            headers=self.default_headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying `httpx.AsyncClient` and release all pooled connections.
+        """
+        await self.http.aclose()
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def request(self, method: str, endpoint: str, retry_policy: Optional[RetryPolicy] = None, **kwargs) -> Any:
+        """
+        Sends an HTTP request to the API server with retry and error handling.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            endpoint (str): The API endpoint path (e.g., "/contacts").
+            retry_policy (RetryPolicy, optional): Overrides the client's retry policy for this call.
+            **kwargs: Additional arguments for `httpx.AsyncClient.request`.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            ApiError: For unexpected errors during the request.
+            RetryExhaustedError: If transient failures persist after all retries.
+        """
+        policy = retry_policy or self.retry_policy
+        if self._coalesces(method):
+            return await self.singleflight.do(
+                request_key(method, endpoint, **kwargs),
+                lambda: policy.acall(self._send, method, endpoint, **kwargs),
+            )
+
+        # One key per logical call, shared by all of its retries
+        self.idempotency.prepare(method, kwargs)
+        return await policy.acall(self._send, method, endpoint, **kwargs)
+
+    @handle_request_errors
+    async def _send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """
+        Perform a single attempt of a request.
+        """
+        url = f"{self.base_url}{endpoint}"
+        key = endpoint_template(method, endpoint)
+        cache_key, entry, fresh = self._cache_lookup(method, endpoint, kwargs)
+        if fresh:
+            logger.info("Serving %s from the HTTP cache", key)
+            return entry["body"]
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(key)
+
+        logger.info("Sending %s request to %s", method, url)
+        logger.debug("Request arguments: %s", kwargs)
+        self._encode_body(kwargs)
+        self._before_send(key)
+        try:
+            response = await self._perform(key, method, url, **kwargs)
+            logger.info("Received response with status %s", response.status_code)
+            result = self._process_response(key, response, cache_key, entry)
+        except Exception as e:
+            self._record_outcome(key, e)
+            raise
+        except BaseException:
+            # Cancelled (e.g. by a caller's timeout): the endpoint's health is unknown
+            self._abandon_call(key)
+            raise
+        self._record_outcome(key)
+        if self.http_cache and cache_key is None:
+            self.http_cache.invalidate(endpoint)
+        return result
+
+    async def _perform(self, key: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send the HTTP request, hedging it if enabled and the method is idempotent.
+
+        If the first attempt has not answered within the policy's delay (and the
+        hedge budget allows), an identical request is fired; the first successful
+        response wins and the other task is cancelled.
+        """
+        if not (self.hedging and self.hedging.applies_to(method)):
+            return await self.http.request(method, url, **kwargs)
+
+        started = time.monotonic()
+        tasks = [asyncio.ensure_future(self.http.request(method, url, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedging.delay(key))
+            if done or not self.hedging.allow_hedge():
+                response = await tasks[0]
+                self.hedging.record_request(key, time.monotonic() - started)
+                return response
+
+            logger.debug("Hedging %s %s after %.3fs", method, url, time.monotonic() - started)
+            tasks.append(asyncio.ensure_future(self.http.request(method, url, **kwargs)))
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is tasks[1]:
+                        self.hedging.record_hedge_win()
+                    self.hedging.record_request(key, time.monotonic() - started)
+                    return task.result()
+            raise error
+        finally:
+            # Cancel the losing attempt (or both, if the caller itself was cancelled)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
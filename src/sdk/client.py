@@ -1,66 +1,336 @@
+import time
 import requests
-from typing import Any
-from src.core.config import settings
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional, Tuple, Union
+from src.core import codec
 from src.core.logger import logger
-from src.core.requests import handle_request_errors
-from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, TransientError
-from src.core.retry import retry
+from src.core.requests import handle_request_errors, endpoint_template
+from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError, TransientError, RateLimitError
+from src.core.rate_limit import RateLimiter, parse_retry_after
+from src.core.retry import RetryPolicy, RetryBudget
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.hedging import HedgingPolicy, IDEMPOTENT_METHODS
+from src.core.singleflight import SingleFlight, AsyncSingleFlight, request_key
+from src.core.http_cache import HttpCache
+from src.core.idempotency import IdempotencyKeys
 
 
-class ApiClient:
+class BaseApiClient:
     """
-    A base API client for handling HTTP requests with authentication, error handling, 
-    and advanced retry logic for transient errors.
+    Shared configuration and error mapping for the sync and async API clients.
+
+    JSON request bodies and responses go through `src.core.codec`, which uses
+    orjson or msgspec when installed and the standard library otherwise.
     """
 
-    def __init__(self):
+    # Keyword of the HTTP library's request method that takes pre-encoded bytes
+    body_argument = "data"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        singleflight: Optional[Union[SingleFlight, AsyncSingleFlight]] = None,
+        http_cache: Optional[HttpCache] = None,
+        idempotency: Optional[IdempotencyKeys] = None,
+    ):
         """
-        Initialize the API client with configuration and authentication details.
+        Initialize shared client configuration.
+
+        When both `base_url` and `api_key` are given, settings are never loaded,
+        so no `.env` file or environment variables are required.
+
+        Args:
+            base_url (str, optional): API base URL. Defaults to `settings.BASE_URL`.
+            api_key (str, optional): API key. Defaults to `settings.API_KEY`.
+            timeout (float, optional): Default request timeout in seconds.
+            rate_limiter (RateLimiter, optional): Client-side limiter applied to every request.
+            retry_policy (RetryPolicy, optional): Default retry policy. Defaults to exponential
+                backoff with full jitter and a per-client retry budget.
+            circuit_breaker (CircuitBreaker, optional): Per-endpoint breaker that fails fast during outages.
+            hedging (HedgingPolicy, optional): Enables hedged requests for idempotent GETs.
+            singleflight (SingleFlight | AsyncSingleFlight, optional): Coalesces concurrent
+                identical GETs into one HTTP call whose result every caller receives.
+            http_cache (HttpCache, optional): Caches GET responses and revalidates them with
+                conditional requests (ETag / Last-Modified).
+            idempotency (IdempotencyKeys, optional): Issues the `Idempotency-Key` sent with
+                POST/PUT/PATCH requests and reused by their retries.
         """
-        self.base_url = settings.BASE_URL
-        self.api_key = settings.API_KEY
+        if not (base_url and api_key):
+            from src.core.config import get_settings
+            settings = get_settings()
+            base_url, api_key = base_url or settings.BASE_URL, api_key or settings.API_KEY
+        self.base_url = base_url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(budget=RetryBudget())
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.singleflight = singleflight
+        self.http_cache = http_cache
+        self.idempotency = idempotency if idempotency is not None else IdempotencyKeys()
 
+    @property
+    def default_headers(self) -> Dict[str, str]:
+        """
+        Headers sent with every request.
+        """
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
-    def _handle_api_errors(self, response: requests.Response) -> None:
+    def _handle_api_errors(self, response: Any) -> None:
         """
         Handle API errors based on the HTTP status code.
 
         Args:
-            response (requests.Response): The HTTP response object.
+            response (requests.Response | httpx.Response): The HTTP response object.
 
         Raises:
             UnauthorizedError: For 401 Unauthorized.
             NotFoundError: For 404 Not Found.
-            TransientError: For retryable server errors like 502 or 503.
+            RateLimitError: For 429 Too Many Requests, carrying the `Retry-After` delay.
+            TransientError: For retryable gateway errors: 502, 503 and 504.
             ServerError: For other 500+ server errors.
             ApiError: Generic API error for unexpected status codes.
         """
         if response.status_code == 401:
-            logger.error(f"Unauthorized: {response.text}")
+            logger.error("Unauthorized: %s", response.text)
             raise UnauthorizedError("Unauthorized. Check your API key.")
         if response.status_code == 404:
-            logger.error(f"Resource Not Found: {response.text}")
+            logger.error("Resource Not Found: %s", response.text)
             raise NotFoundError("Resource not found.")
-        if response.status_code in (502, 503):
-            logger.warning(f"Transient Error: {response.text}")
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            logger.warning("Rate Limited: retry after %ss", retry_after)
+            raise RateLimitError(retry_after=retry_after)
+        if response.status_code in (502, 503, 504):
+            logger.warning("Transient Error: %s", response.text)
             raise TransientError("Transient server error. Please retry.", status_code=response.status_code)
         if response.status_code >= 500:
-            logger.error(f"Server Error: {response.text}")
+            logger.error("Server Error: %s", response.text)
             raise ServerError("Server error. Please try again later.")
-        if not response.ok:
-            logger.error(f"Unhandled API Error: {response.status_code} - {response.text}")
+        if response.status_code >= 400:
+            logger.error("Unhandled API Error: %s - %s", response.status_code, response.text)
             raise ApiError(f"Unhandled API Error: {response.status_code}: {response.text}")
 
+    def _coalesces(self, method: str) -> bool:
+        """
+        Whether requests with this HTTP method are shared between concurrent callers.
+        """
+        return self.singleflight is not None and method.upper() in IDEMPOTENT_METHODS
 
-    @retry(max_retries=3, backoff=2, retry_on=(502, 503))
-    @handle_request_errors
-    def request(self, method: str, endpoint: str, **kwargs) -> Any:
+    def _cache_lookup(self, method: str, endpoint: str, kwargs: Dict) -> Tuple[Optional[str], Optional[Dict], bool]:
+        """
+        Look a GET up in the HTTP cache. For a stale entry, validator headers are
+        added to `kwargs` so the request becomes conditional.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The API endpoint path.
+            kwargs (dict): The request arguments, updated in place.
+
+        Returns:
+            tuple: The cache key (None if the request is not cacheable), the cached
+                entry if any, and whether that entry is fresh.
+        """
+        if not (self.http_cache and method.upper() == "GET"):
+            return None, None, False
+        cache_key = self.http_cache.key(endpoint, kwargs.get("params"))
+        entry = self.http_cache.lookup(cache_key)
+        if entry is None:
+            return cache_key, None, False
+        if self.http_cache.is_fresh(entry):
+            return cache_key, entry, True
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.http_cache.conditional_headers(entry)}
+        return cache_key, entry, False
+
+    def _encode_body(self, kwargs: Dict) -> None:
+        """
+        Serialize a `json=` request body with the active codec, in place.
+
+        Args:
+            kwargs (dict): The request arguments of a single attempt.
+        """
+        if kwargs.get("json") is not None:
+            kwargs[self.body_argument] = codec.dumps(kwargs.pop("json"))
+
+    def _before_send(self, key: str) -> None:
+        """
+        Fail fast if the endpoint's circuit is open.
+
+        Args:
+            key (str): The endpoint template of the request.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call.
+        """
+        if self.circuit_breaker:
+            self.circuit_breaker.before_call(key)
+
+    def _process_response(
+        self, key: str, response: Any, cache_key: Optional[str] = None, entry: Optional[Dict] = None
+    ) -> Any:
+        """
+        Turn a raw response into the SDK result, raising on API errors.
+
+        Feeds rate-limit signals back to the rate limiter and stores cacheable
+        GET responses in the HTTP cache.
+
+        Args:
+            key (str): The endpoint template of the request.
+            response (requests.Response | httpx.Response): The HTTP response object.
+            cache_key (str, optional): HTTP cache key if the request is cacheable.
+            entry (dict, optional): The cached entry the request was made conditional on.
+
+        Returns:
+            dict: The JSON response, or None for 204 No Content.
+        """
+        # Handle deletion api
+        if response.status_code == 204:
+            logger.info("Item successfully deleted.")
+            return None
+
+        # Not modified: serve the cached body without downloading it again
+        if response.status_code == 304 and entry is not None:
+            logger.info("Serving %s from the HTTP cache after revalidation", key)
+            if self.rate_limiter:
+                self.rate_limiter.on_success(key)
+            return self.http_cache.revalidated(cache_key, entry, response.headers)
+
+        # Handle API errors
+        try:
+            self._handle_api_errors(response)
+        except RateLimitError as e:
+            if self.rate_limiter:
+                self.rate_limiter.on_rate_limited(key, e.retry_after)
+            raise
+        if self.rate_limiter:
+            self.rate_limiter.on_success(key)
+        result = codec.loads(response.content)
+        if cache_key is not None:
+            self.http_cache.save(cache_key, response.headers, result)
+        return result
+
+    def _record_outcome(self, key: str, error: Optional[Exception] = None) -> None:
+        """
+        Report the outcome of an attempt to the circuit breaker.
+
+        Args:
+            key (str): The endpoint template of the request.
+            error (Exception, optional): The error raised by the attempt, if any.
+        """
+        if not self.circuit_breaker:
+            return
+        if error is None:
+            self.circuit_breaker.record_success(key)
+        else:
+            self.circuit_breaker.record_failure(key, error)
+
+    def _abandon_call(self, key: str) -> None:
+        """
+        Release the circuit breaker slot of an attempt that was cancelled or
+        interrupted before it had an outcome.
+
+        Args:
+            key (str): The endpoint template of the request.
+        """
+        if self.circuit_breaker:
+            self.circuit_breaker.release(key)
+
+
+class ApiClient(BaseApiClient):
+    """
+    A base API client for handling HTTP requests with authentication, error handling,
+    and advanced retry logic for transient errors.
+
+    The client keeps a single long-lived `requests.Session` backed by a pooled
+    `HTTPAdapter`, so TCP/TLS connections are reused across calls instead of being
+    re-established for every request. Share one instance between `Contacts` and
+    `Messages`, and release it with `close()` or by using it as a context manager.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        **options,
+    ):
+        """
+        Initialize the API client with configuration and authentication details.
+
+        Args:
+            base_url (str, optional): API base URL. Defaults to `settings.BASE_URL`.
+            api_key (str, optional): API key. Defaults to `settings.API_KEY`.
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections kept per host.
+            pool_block (bool): If True, never open more than `pool_maxsize` connections
+                to one host; callers wait for a free connection instead.
+            **options: Shared client options (`timeout`, `rate_limiter`, `retry_policy`,
+                `circuit_breaker`, `hedging`, `singleflight`, `http_cache`, `idempotency`); see `BaseApiClient`.
+        """
+        super().__init__(base_url=base_url, api_key=api_key, **options)
+        self.session = self._create_session(pool_connections, pool_maxsize, pool_block)
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=2 * pool_maxsize, thread_name_prefix="hedge") if self.hedging else None
+        )
+
+    def _create_session(self, pool_connections: int, pool_maxsize: int, pool_block: bool) -> requests.Session:
+        """
+        Build the pooled session used for every request made by this client.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections kept per host.
+            pool_block (bool): Whether to block when a host's pool is exhausted.
+
+        Returns:
+            requests.Session: A session with authentication headers and pooled adapters mounted.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.default_headers)
+        return session
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release all pooled connections.
+        """
+        if self._hedge_executor:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def request(self, method: str, endpoint: str, retry_policy: Optional[RetryPolicy] = None, **kwargs) -> Any:
         """
         Sends an HTTP request to the API server with retry and error handling.
 
         Args:
             method (str): The HTTP method (GET, POST, etc.).
             endpoint (str): The API endpoint path (e.g., "/contacts").
+            retry_policy (RetryPolicy, optional): Overrides the client's retry policy for this call.
             **kwargs: Additional arguments for the request.
 
         Returns:
@@ -68,21 +338,87 @@ class ApiClient:
 
         Raises:
             ApiError: For unexpected errors during the request.
+            RetryExhaustedError: If transient failures persist after all retries.
+        """
+        policy = retry_policy or self.retry_policy
+        if self._coalesces(method):
+            return self.singleflight.do(
+                request_key(method, endpoint, **kwargs),
+                lambda: policy.call(self._send, method, endpoint, **kwargs),
+            )
+
+        # One key per logical call, shared by all of its retries
+        self.idempotency.prepare(method, kwargs)
+        return policy.call(self._send, method, endpoint, **kwargs)
+
+    @handle_request_errors
+    def _send(self, method: str, endpoint: str, **kwargs) -> Any:
+        """
+        Perform a single attempt of a request.
         """
         url = f"{self.base_url}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self.api_key}"
-        headers["Content-Type"] = "application/json"
-
-        logger.info(f"Sending {method} request to {url} with headers {headers} and payload {kwargs}")
-        response = requests.request(method, url, headers=headers, **kwargs)
-        logger.info(f"Received response with status {response.status_code}")
-        
-        # Handle deletion api
-        if response.status_code == 204:
-            logger.info(f"Item successfully deleted.")
-            return None
+        kwargs.setdefault("timeout", self.timeout)
+        key = endpoint_template(method, endpoint)
+        cache_key, entry, fresh = self._cache_lookup(method, endpoint, kwargs)
+        if fresh:
+            logger.info("Serving %s from the HTTP cache", key)
+            return entry["body"]
+        if self.rate_limiter:
+            self.rate_limiter.acquire(key)
 
-        # Handle API errors
-        self._handle_api_errors(response)
-        return response.json()
+        logger.info("Sending %s request to %s", method, url)
+        logger.debug("Request arguments: %s", kwargs)
+        self._encode_body(kwargs)
+        self._before_send(key)
+        try:
+            response = self._perform(key, method, url, **kwargs)
+            logger.info("Received response with status %s", response.status_code)
+            result = self._process_response(key, response, cache_key, entry)
+        except Exception as e:
+            self._record_outcome(key, e)
+            raise
+        except BaseException:
+            self._abandon_call(key)
+            raise
+        self._record_outcome(key)
+        if self.http_cache and cache_key is None:
+            self.http_cache.invalidate(endpoint)
+        return result
+
+    def _perform(self, key: str, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send the HTTP request, hedging it if enabled and the method is idempotent.
+
+        The first attempt runs on the hedging pool; if it has not answered within the
+        policy's delay (and the hedge budget allows), an identical request is fired
+        and the first successful response wins. A slower duplicate cannot be
+        interrupted mid-flight, so its response is simply discarded.
+        """
+        if not (self.hedging and self.hedging.applies_to(method)):
+            return self.session.request(method, url, **kwargs)
+
+        started = time.monotonic()
+        primary = self._hedge_executor.submit(self.session.request, method, url, **kwargs)
+        done, _ = wait([primary], timeout=self.hedging.delay(key))
+        if done or not self.hedging.allow_hedge():
+            response = primary.result()
+            self.hedging.record_request(key, time.monotonic() - started)
+            return response
+
+        logger.debug("Hedging %s %s after %.3fs", method, url, time.monotonic() - started)
+        hedge = self._hedge_executor.submit(self.session.request, method, url, **kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is hedge:
+                    self.hedging.record_hedge_win()
+                self.hedging.record_request(key, time.monotonic() - started)
+                return future.result()
+        raise error
@@ -1,11 +1,39 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, Iterator, List, Optional
 from httpx import HTTPStatusError
 
 from ..client import ApiClient
+from ..async_client import AsyncApiClient
 from src.schemas.contacts import CreateContactRequest, Contact, ListContactsResponse
-from src.core.validators import validate_request, validate_response
+from src.core.validators import validate_request, validate_response, parse_response
 from src.core.exceptions import handle_exceptions, handle_404_error
 from src.core.logger import logger
+from src.core.pagination import paginate, apaginate
+from src.core.cache import CacheBackend
+from src.core.phone_index import PhoneIndex
+from src.core.singleflight import SingleFlight, AsyncSingleFlight
+
+
+def _remember_contacts(owner, contacts: List[Dict]) -> None:
+    """
+    Record contacts returned by the API in the owner's phone index and cache
+    (keyed by contact ID), for those that are configured.
+    """
+    for contact in contacts:
+        if isinstance(contact, dict) and contact.get("id"):
+            if owner.phone_index is not None:
+                owner.phone_index.add(contact)
+            if owner.cache is not None:
+                owner.cache.set(contact["id"], contact)
+
+
+def _forget_contact(owner, contact_id: str) -> None:
+    """
+    Drop a contact from the owner's phone index and cache.
+    """
+    if owner.phone_index is not None:
+        owner.phone_index.remove(contact_id)
+    if owner.cache is not None:
+        owner.cache.delete(contact_id)
 
 
 class Contacts:
@@ -15,14 +43,24 @@ class Contacts:
     Provides methods for creating, listing, retrieving, updating, and deleting contacts.
     """
 
-    def __init__(self, client: ApiClient):
+    def __init__(
+        self, client: ApiClient, cache: Optional[CacheBackend] = None, phone_index: Optional[PhoneIndex] = None
+    ):
         """
         Initialize the Contacts module.
 
         Args:
             client (ApiClient): The shared API client instance.
+            cache (CacheBackend, optional): Read-through cache for contacts (e.g. `TTLCache`).
+                Populated by create, get, update and list calls, invalidated on delete.
+            phone_index (PhoneIndex, optional): Index of known contacts by phone number, kept
+                current by the same calls and required by `get_or_create_contact`. None (the
+                default) indexes nothing, so listing contacts keeps no copy of them.
         """
         self.client = client
+        self.cache = cache
+        self.phone_index = phone_index
+        self._creating = SingleFlight()
 
     @validate_request(CreateContactRequest)
     @validate_response(Contact)
@@ -37,9 +75,47 @@ class Contacts:
         Returns:
             Contact: The created contact details.
         """
-        logger.info(f"Creating contact with payload: {payload}")
-        return self.client.request("POST", "/contacts", json=payload)
+        logger.debug("Creating contact with payload: %s", payload)
+        contact = self.client.request("POST", "/contacts", json=payload)
+        _remember_contacts(self, [contact])
+        return contact
+
+    def get_or_create_contact(self, phone: str, name: str) -> Contact:
+        """
+        Return the known contact with this phone number, creating it only if none is indexed.
+
+        Lookups are answered from the phone index without an API call. The index is
+        filled by `list_contacts` / `iter_contacts` (iterate once to warm it up) and
+        kept current by create, get, update and delete calls. Concurrent calls for the
+        same number create at most one contact.
+
+        Args:
+            phone (str): The phone number; formatting differences are normalized to E.164.
+            name (str): The name used if the contact has to be created.
+
+        Returns:
+            Contact: The existing or newly created contact.
+
+        Raises:
+            ValueError: If the phone number is invalid or no phone index is configured.
+        """
+        if self.phone_index is None:
+            raise ValueError("get_or_create_contact requires a phone_index")
+        phone = self.phone_index.normalize(phone)
+        contact = self.phone_index.get(phone)
+        if contact is not None:
+            logger.debug("Found contact %s for %s in the phone index", contact["id"], phone)
+            return parse_response(Contact, contact)
+        return self._creating.do(phone, lambda: self._create_if_missing(phone, name))
 
+    def _create_if_missing(self, phone: str, name: str) -> Contact:
+        """
+        Create the contact unless a concurrent call has indexed it meanwhile.
+        """
+        contact = self.phone_index.get(phone)
+        if contact is not None:
+            return parse_response(Contact, contact)
+        return self.create_contact({"name": name, "phone": phone})
 
     @validate_response(ListContactsResponse)
     @handle_exceptions
@@ -55,14 +131,34 @@ class Contacts:
             ListContactsResponse: A paginated list of contacts.
         """
         params = {"pageIndex": page, "max": max}
-        logger.info(f"Listing contacts with params: {params}")
-        return self.client.request("GET", "/contacts", params=params)
+        logger.debug("Listing contacts with params: %s", params)
+        response = self.client.request("GET", "/contacts", params=params)
+        _remember_contacts(self, (response or {}).get("contactsList", []))
+        return response
+
+    def iter_contacts(self, page_size: int = 100, start_page: int = 1) -> Iterator[Contact]:
+        """
+        Iterate over every contact, fetching pages lazily.
+
+        The next page is prefetched while the current one is being consumed, and
+        iteration stops after the first short page.
+
+        Args:
+            page_size (int): Number of contacts requested per page. Defaults to 100.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Yields:
+            Contact: Each contact in order.
+        """
+        logger.info("Iterating contacts from page %s with page size %s", start_page, page_size)
+        fetch_page = lambda page: self.list_contacts(page=page, max=page_size)  # noqa: E731
+        return paginate(fetch_page, "contactsList", page_size, start_page)
 
     @validate_response(Contact)
     @handle_exceptions
     def get_contact(self, contact_id: str) -> Contact:
         """
-        Retrieve a specific contact by ID.
+        Retrieve a specific contact by ID, from the cache when one is configured.
 
         Args:
             contact_id (str): The unique ID of the contact.
@@ -70,9 +166,16 @@ class Contacts:
         Returns:
             Contact: The retrieved contact details.
         """
-        logger.info(f"Fetching contact with ID: {contact_id}")
+        if self.cache is not None:
+            cached = self.cache.get(contact_id)
+            if cached is not None:
+                logger.debug("Serving contact %s from cache", contact_id)
+                return cached
+        logger.info("Fetching contact with ID: %s", contact_id)
         try:
-            return self.client.request("GET", f"/contacts/{contact_id}")
+            contact = self.client.request("GET", f"/contacts/{contact_id}")
+            _remember_contacts(self, [contact])
+            return contact
         except HTTPStatusError as e:
             handle_404_error(e, contact_id, "Contact")
 
@@ -90,9 +193,13 @@ class Contacts:
         Returns:
             Contact: The updated contact details.
         """
-        logger.info(f"Updating contact {contact_id} with payload: {payload}")
+        logger.debug("Updating contact %s with payload: %s", contact_id, payload)
+        if self.cache is not None:
+            self.cache.delete(contact_id)
         try:
-            return self.client.request("PATCH", f"/contacts/{contact_id}", json=payload)
+            contact = self.client.request("PATCH", f"/contacts/{contact_id}", json=payload)
+            _remember_contacts(self, [contact])
+            return contact
         except HTTPStatusError as e:
             handle_404_error(e, contact_id, "Contact")
 
@@ -107,9 +214,197 @@ class Contacts:
         Returns:
             None
         """
-        logger.info(f"Deleting contact with ID: {contact_id}")
+        logger.info("Deleting contact with ID: %s", contact_id)
         try:
             self.client.request("DELETE", f"/contacts/{contact_id}")
-            logger.info(f"Successfully deleted contact with ID: {contact_id}")
+            _forget_contact(self, contact_id)
+            logger.info("Successfully deleted contact with ID: %s", contact_id)
+        except HTTPStatusError as e:
+            handle_404_error(e, contact_id, "Contact")
+
+
+class AsyncContacts:
+    """
+    Asynchronous Contacts SDK module, mirroring `Contacts` on top of `AsyncApiClient`.
+
+    Provides coroutine methods for creating, listing, retrieving, updating, and deleting contacts.
+    """
+
+    def __init__(
+        self, client: AsyncApiClient, cache: Optional[CacheBackend] = None, phone_index: Optional[PhoneIndex] = None
+    ):
+        """
+        Initialize the AsyncContacts module.
+
+        Args:
+            client (AsyncApiClient): The shared async API client instance.
+            cache (CacheBackend, optional): Read-through cache for contacts (e.g. `TTLCache`).
+                Populated by create, get, update and list calls, invalidated on delete.
+            phone_index (PhoneIndex, optional): Index of known contacts by phone number, kept
+                current by the same calls and required by `get_or_create_contact`. None (the
+                default) indexes nothing, so listing contacts keeps no copy of them.
+        """
+        self.client = client
+        self.cache = cache
+        self.phone_index = phone_index
+        self._creating = AsyncSingleFlight()
+
+    @validate_request(CreateContactRequest)
+    @validate_response(Contact)
+    @handle_exceptions
+    async def create_contact(self, payload: Dict) -> Contact:
+        """
+        Create a new contact in the system.
+
+        Args:
+            payload (dict): A dictionary containing 'name' and 'phone'.
+
+        Returns:
+            Contact: The created contact details.
+        """
+        logger.debug("Creating contact with payload: %s", payload)
+        contact = await self.client.request("POST", "/contacts", json=payload)
+        _remember_contacts(self, [contact])
+        return contact
+
+    async def get_or_create_contact(self, phone: str, name: str) -> Contact:
+        """
+        Return the known contact with this phone number, creating it only if none is indexed.
+
+        Lookups are answered from the phone index without an API call. The index is
+        filled by `list_contacts` / `iter_contacts` (iterate once to warm it up) and
+        kept current by create, get, update and delete calls. Concurrent calls for the
+        same number create at most one contact.
+
+        Args:
+            phone (str): The phone number; formatting differences are normalized to E.164.
+            name (str): The name used if the contact has to be created.
+
+        Returns:
+            Contact: The existing or newly created contact.
+
+        Raises:
+            ValueError: If the phone number is invalid or no phone index is configured.
+        """
+        if self.phone_index is None:
+            raise ValueError("get_or_create_contact requires a phone_index")
+        phone = self.phone_index.normalize(phone)
+        contact = self.phone_index.get(phone)
+        if contact is not None:
+            logger.debug("Found contact %s for %s in the phone index", contact["id"], phone)
+            return parse_response(Contact, contact)
+        return await self._creating.do(phone, lambda: self._create_if_missing(phone, name))
+
+    async def _create_if_missing(self, phone: str, name: str) -> Contact:
+        """
+        Create the contact unless a concurrent call has indexed it meanwhile.
+        """
+        contact = self.phone_index.get(phone)
+        if contact is not None:
+            return parse_response(Contact, contact)
+        return await self.create_contact({"name": name, "phone": phone})
+
+    @validate_response(ListContactsResponse)
+    @handle_exceptions
+    async def list_contacts(self, page: int = 1, max: int = 10) -> ListContactsResponse:
+        """
+        List all contacts with pagination.
+
+        Args:
+            page (int): The page number to retrieve. Defaults to 1.
+            max (int): The maximum number of contacts per page. Defaults to 10.
+
+        Returns:
+            ListContactsResponse: A paginated list of contacts.
+        """
+        params = {"pageIndex": page, "max": max}
+        logger.debug("Listing contacts with params: %s", params)
+        response = await self.client.request("GET", "/contacts", params=params)
+        _remember_contacts(self, (response or {}).get("contactsList", []))
+        return response
+
+    def iter_contacts(self, page_size: int = 100, start_page: int = 1) -> AsyncIterator[Contact]:
+        """
+        Asynchronously iterate over every contact, fetching pages lazily.
+
+        The next page is prefetched while the current one is being consumed, and
+        iteration stops after the first short page.
+
+        Args:
+            page_size (int): Number of contacts requested per page. Defaults to 100.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Yields:
+            Contact: Each contact in order.
+        """
+        logger.info("Iterating contacts from page %s with page size %s", start_page, page_size)
+        fetch_page = lambda page: self.list_contacts(page=page, max=page_size)  # noqa: E731
+        return apaginate(fetch_page, "contactsList", page_size, start_page)
+
+    @validate_response(Contact)
+    @handle_exceptions
+    async def get_contact(self, contact_id: str) -> Contact:
+        """
+        Retrieve a specific contact by ID, from the cache when one is configured.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+
+        Returns:
+            Contact: The retrieved contact details.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(contact_id)
+            if cached is not None:
+                logger.debug("Serving contact %s from cache", contact_id)
+                return cached
+        logger.info("Fetching contact with ID: %s", contact_id)
+        try:
+            contact = await self.client.request("GET", f"/contacts/{contact_id}")
+            _remember_contacts(self, [contact])
+            return contact
+        except HTTPStatusError as e:
+            handle_404_error(e, contact_id, "Contact")
+
+    @validate_request(CreateContactRequest)
+    @validate_response(Contact)
+    @handle_exceptions
+    async def update_contact(self, contact_id: str, payload: Dict) -> Contact:
+        """
+        Update the details of an existing contact.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+            payload (dict): A dictionary containing 'name' and/or 'phone'.
+
+        Returns:
+            Contact: The updated contact details.
+        """
+        logger.debug("Updating contact %s with payload: %s", contact_id, payload)
+        if self.cache is not None:
+            self.cache.delete(contact_id)
+        try:
+            contact = await self.client.request("PATCH", f"/contacts/{contact_id}", json=payload)
+            _remember_contacts(self, [contact])
+            return contact
+        except HTTPStatusError as e:
+            handle_404_error(e, contact_id, "Contact")
+
+    @handle_exceptions
+    async def delete_contact(self, contact_id: str) -> None:
+        """
+        Delete a contact by ID.
+
+        Args:
+            contact_id (str): The unique ID of the contact.
+
+        Returns:
+            None
+        """
+        logger.info("Deleting contact with ID: %s", contact_id)
+        try:
+            await self.client.request("DELETE", f"/contacts/{contact_id}")
+            _forget_contact(self, contact_id)
+            logger.info("Successfully deleted contact with ID: %s", contact_id)
         except HTTPStatusError as e:
             handle_404_error(e, contact_id, "Contact")
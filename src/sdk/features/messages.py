@@ -1,12 +1,36 @@
-from typing import Dict
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
 from httpx import HTTPStatusError
 
 from ..client import ApiClient
-from src.schemas.messages import CreateMessageRequest, Message, ListMessagesResponse
-from src.core.validators import validate_request, validate_response
+from ..async_client import AsyncApiClient
+from src.schemas.messages import CreateMessageRequest, Message, ListMessagesResponse, BulkSendResult, TERMINAL_STATUSES
+from src.core.validators import validate_request, validate_response, validate_payload
 from src.core.exceptions import handle_exceptions, handle_404_error
 from src.core.logger import logger
+from src.core.pagination import paginate, apaginate
 from src.core.security import verify_signature
+from src.core.cache import CacheBackend
+from src.core.status_store import MessageStatusStore
+
+
+def _remember_messages(owner, messages: List[Dict]) -> None:
+    """
+    Record the status of messages returned by the API in the owner's status store
+    and cache the ones in a terminal state, keyed by message ID. Queued messages
+    are not cached since their status is still going to change.
+    """
+    for message in messages:
+        if not (isinstance(message, dict) and message.get("id") and message.get("status")):
+            continue
+        try:
+            owner.status_store.update(message["id"], message["status"], message.get("deliveredAt"))
+        except ValueError:
+            continue
+        if owner.cache is not None and message["status"] in TERMINAL_STATUSES:
+            owner.cache.set(message["id"], message)
 
 
 class Messages:
@@ -16,18 +40,24 @@ class Messages:
     Provides methods for sending, listing, and retrieving messages.
     """
 
-    def __init__(self, client: ApiClient):
+    def __init__(
+        self, client: ApiClient, cache: Optional[CacheBackend] = None, status_store: Optional[MessageStatusStore] = None
+    ):
         """
         Initialize the Messages module.
 
         Args:
             client (ApiClient): The shared API client instance.
+            cache (CacheBackend, optional): Cache for messages in a terminal state
+                (delivered or failed), e.g. a persistent `SQLiteCache`.
+            status_store (MessageStatusStore, optional): Delivery statuses pushed by webhooks,
+                used by `wait_for_status`. Defaults to a new, empty store.
         """
         self.client = client
+        self.cache = cache
+        self.status_store = status_store if status_store is not None else MessageStatusStore()
 
     @validate_request(CreateMessageRequest)
-    @validate_response(Message)
-    @handle_exceptions
     def send_message(self, payload: Dict) -> Message:
         """
         Send a new message to a contact.
@@ -38,15 +68,72 @@ class Messages:
         Returns:
             Message: The details of the sent message.
         """
+        return self._send(payload)
+
+    @validate_response(Message)
+    @handle_exceptions
+    def _send(self, payload: Dict) -> Message:
+        """
+        Send an already validated message payload to the API.
+        """
         logger.info("Preparing to send a message.")
         # Ensure the payload aligns with the API's expected format
         if "from_sender" in payload:
             payload["from"] = payload.pop("from_sender")
-        logger.debug(f"Transformed payload: {payload}")
+        logger.debug("Transformed payload: %s", payload)
 
         # Make the API call to send the message
         logger.info("Sending message request to the API.")
-        return self.client.request("POST", "/messages", json=payload)
+        message = self.client.request("POST", "/messages", json=payload)
+        _remember_messages(self, [message])
+        return message
+
+    def send_messages(self, payloads: Iterable[Dict], concurrency: int = 8) -> Iterator[BulkSendResult]:
+        """
+        Send many messages with bounded concurrency, streaming per-item results in input order.
+
+        Payloads are consumed lazily (generators are fine) and validated before they are
+        dispatched, so invalid items never occupy a worker. Only a small window of
+        results is held at any time, keeping memory flat regardless of batch size. A
+        failing item is reported in its result and never aborts the batch.
+
+        Args:
+            payloads (Iterable[dict]): Message payloads, as accepted by `send_message`.
+            concurrency (int): Maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkSendResult: One result per payload, in input order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        window = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="send_messages")
+        try:
+            for index, payload in enumerate(payloads):
+                try:
+                    validate_payload(CreateMessageRequest, payload)
+                    window.append((index, payload, executor.submit(self._send, payload)))
+                except ValueError as e:
+                    window.append((index, payload, e))
+                if len(window) >= 2 * concurrency:
+                    yield self._collect(*window.popleft())
+            while window:
+                yield self._collect(*window.popleft())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect(index: int, payload: Dict, outcome) -> BulkSendResult:
+        """
+        Wait for a queued send and wrap its outcome in a `BulkSendResult`.
+        """
+        if isinstance(outcome, Exception):
+            return BulkSendResult(index=index, payload=payload, error=outcome)
+        try:
+            return BulkSendResult(index=index, payload=payload, response=outcome.result())
+        except Exception as e:
+            return BulkSendResult(index=index, payload=payload, error=e)
 
     @validate_response(ListMessagesResponse)
     @handle_exceptions
@@ -62,14 +149,33 @@ class Messages:
             ListMessagesResponse: A paginated list of sent messages.
         """
         params = {"page": page, "limit": limit}
-        logger.info(f"Requesting a list of messages with params: {params}")
-        return self.client.request("GET", "/messages", params=params)
+        logger.debug("Requesting a list of messages with params: %s", params)
+        response = self.client.request("GET", "/messages", params=params)
+        _remember_messages(self, (response or {}).get("messages", []))
+        return response
+
+    def iter_messages(self, page_size: int = 100, start_page: int = 1) -> Iterator[Message]:
+        """
+        Iterate over every sent message, fetching pages lazily.
+
+        The next page is prefetched while the current one is being consumed, and
+        iteration stops after the first short page.
+
+        Args:
+            page_size (int): Number of messages requested per page. Defaults to 100.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Yields:
+            Message: Each message in order.
+        """
+        logger.info("Iterating messages from page %s with page size %s", start_page, page_size)
+        return paginate(lambda page: self.list_messages(page=page, limit=page_size), "messages", page_size, start_page)
 
     @validate_response(Message)
     @handle_exceptions
     def get_message(self, message_id: str) -> Message:
         """
-        Retrieve a specific message by ID.
+        Retrieve a specific message by ID, from the cache when one is configured.
 
         Args:
             message_id (str): The unique ID of the message.
@@ -77,13 +183,35 @@ class Messages:
         Returns:
             Message: The retrieved message details.
         """
-        logger.info(f"Fetching message details for ID: {message_id}")
+        if self.cache is not None:
+            cached = self.cache.get(message_id)
+            if cached is not None:
+                logger.debug("Serving message %s from cache", message_id)
+                return cached
+        logger.info("Fetching message details for ID: %s", message_id)
         try:
-            return self.client.request("GET", f"/messages/{message_id}")
+            message = self.client.request("GET", f"/messages/{message_id}")
+            _remember_messages(self, [message])
+            return message
         except HTTPStatusError as e:
-            logger.error(f"Message with ID {message_id} not found.")
+            logger.error("Message with ID %s not found.", message_id)
             handle_404_error(e, message_id, "Message")
 
+    def wait_for_status(self, message_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Wait for a message to be delivered or to fail, as reported by webhooks,
+        instead of polling `get_message`.
+
+        Args:
+            message_id (str): The unique ID of the message.
+            timeout (float, optional): Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            dict: The final status record (`id`, `status`, `deliveredAt`), or None on timeout.
+        """
+        logger.info("Waiting for the final status of message %s", message_id)
+        return self.status_store.wait_for_status(message_id, timeout=timeout)
+
     def validate_webhook_signature(self, raw_body: bytes, signature: str, secret: str):
         """
         Validate the webhook signature using the SDK.
@@ -101,5 +229,211 @@ class Messages:
             verify_signature(raw_body, signature, secret)
             logger.info("Webhook signature successfully validated.")
         except ValueError as e:
-            logger.error(f"Invalid webhook signature: {e}")
+            logger.error("Invalid webhook signature: %s", e)
             raise
+
+
+class AsyncMessages:
+    """
+    Asynchronous Messages SDK module, mirroring `Messages` on top of `AsyncApiClient`.
+
+    Provides coroutine methods for sending, listing, and retrieving messages.
+    """
+
+    def __init__(
+        self,
+        client: AsyncApiClient,
+        cache: Optional[CacheBackend] = None,
+        status_store: Optional[MessageStatusStore] = None,
+    ):
+        """
+        Initialize the AsyncMessages module.
+
+        Args:
+            client (AsyncApiClient): The shared async API client instance.
+            cache (CacheBackend, optional): Cache for messages in a terminal state
+                (delivered or failed), e.g. a persistent `SQLiteCache`.
+            status_store (MessageStatusStore, optional): Delivery statuses pushed by webhooks,
+                used by `wait_for_status`. Defaults to a new, empty store.
+        """
+        self.client = client
+        self.cache = cache
+        self.status_store = status_store if status_store is not None else MessageStatusStore()
+
+    @validate_request(CreateMessageRequest)
+    async def send_message(self, payload: Dict) -> Message:
+        """
+        Send a new message to a contact.
+
+        Args:
+            payload (dict): A dictionary containing 'to', 'content', and 'from_sender'.
+
+        Returns:
+            Message: The details of the sent message.
+        """
+        return await self._send(payload)
+
+    async def send_messages(
+        self, payloads: Union[Iterable[Dict], AsyncIterable[Dict]], concurrency: int = 50
+    ) -> AsyncIterator[BulkSendResult]:
+        """
+        Send many messages with bounded concurrency, streaming per-item results in input order.
+
+        Async counterpart of `Messages.send_messages`; accepts sync or async iterables.
+
+        Args:
+            payloads (Iterable[dict] | AsyncIterable[dict]): Message payloads, as accepted by `send_message`.
+            concurrency (int): Maximum number of requests in flight. Defaults to 50.
+
+        Yields:
+            BulkSendResult: One result per payload, in input order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(payload: Dict):
+            async with semaphore:
+                return await self._send(payload)
+
+        window = deque()
+        try:
+            index = 0
+            async for payload in _aiterate(payloads):
+                try:
+                    validate_payload(CreateMessageRequest, payload)
+                    window.append((index, payload, asyncio.ensure_future(send(payload))))
+                except ValueError as e:
+                    window.append((index, payload, e))
+                index += 1
+                if len(window) >= 2 * concurrency:
+                    yield await self._collect(*window.popleft())
+            while window:
+                yield await self._collect(*window.popleft())
+        finally:
+            for _, _, outcome in window:
+                if isinstance(outcome, asyncio.Future):
+                    outcome.cancel()
+
+    @staticmethod
+    async def _collect(index: int, payload: Dict, outcome) -> BulkSendResult:
+        """
+        Await a queued send and wrap its outcome in a `BulkSendResult`.
+        """
+        if isinstance(outcome, Exception):
+            return BulkSendResult(index=index, payload=payload, error=outcome)
+        try:
+            return BulkSendResult(index=index, payload=payload, response=await outcome)
+        except Exception as e:
+            return BulkSendResult(index=index, payload=payload, error=e)
+
+    @validate_response(Message)
+    @handle_exceptions
+    async def _send(self, payload: Dict) -> Message:
+        """
+        Send an already validated message payload to the API.
+        """
+        logger.info("Preparing to send a message.")
+        # Ensure the payload aligns with the API's expected format
+        if "from_sender" in payload:
+            payload["from"] = payload.pop("from_sender")
+        logger.debug("Transformed payload: %s", payload)
+
+        # Make the API call to send the message
+        logger.info("Sending message request to the API.")
+        message = await self.client.request("POST", "/messages", json=payload)
+        _remember_messages(self, [message])
+        return message
+
+    @validate_response(ListMessagesResponse)
+    @handle_exceptions
+    async def list_messages(self, page: int = 1, limit: int = 10) -> ListMessagesResponse:
+        """
+        List all sent messages with pagination.
+
+        Args:
+            page (int): The page number to retrieve. Defaults to 1.
+            limit (int): The maximum number of messages per page. Defaults to 10.
+
+        Returns:
+            ListMessagesResponse: A paginated list of sent messages.
+        """
+        params = {"page": page, "limit": limit}
+        logger.debug("Requesting a list of messages with params: %s", params)
+        response = await self.client.request("GET", "/messages", params=params)
+        _remember_messages(self, (response or {}).get("messages", []))
+        return response
+
+    def iter_messages(self, page_size: int = 100, start_page: int = 1) -> AsyncIterator[Message]:
+        """
+        Asynchronously iterate over every sent message, fetching pages lazily.
+
+        The next page is prefetched while the current one is being consumed, and
+        iteration stops after the first short page.
+
+        Args:
+            page_size (int): Number of messages requested per page. Defaults to 100.
+            start_page (int): The first page to fetch. Defaults to 1.
+
+        Yields:
+            Message: Each message in order.
+        """
+        logger.info("Iterating messages from page %s with page size %s", start_page, page_size)
+        return apaginate(lambda page: self.list_messages(page=page, limit=page_size), "messages", page_size, start_page)
+
+    @validate_response(Message)
+    @handle_exceptions
+    async def get_message(self, message_id: str) -> Message:
+        """
+        Retrieve a specific message by ID, from the cache when one is configured.
+
+        Args:
+            message_id (str): The unique ID of the message.
+
+        Returns:
+            Message: The retrieved message details.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(message_id)
+            if cached is not None:
+                logger.debug("Serving message %s from cache", message_id)
+                return cached
+        logger.info("Fetching message details for ID: %s", message_id)
+        try:
+            message = await self.client.request("GET", f"/messages/{message_id}")
+            _remember_messages(self, [message])
+            return message
+        except HTTPStatusError as e:
+            logger.error("Message with ID %s not found.", message_id)
+            handle_404_error(e, message_id, "Message")
+
+    async def wait_for_status(self, message_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Wait for a message to be delivered or to fail, as reported by webhooks,
+        instead of polling `get_message`.
+
+        Args:
+            message_id (str): The unique ID of the message.
+            timeout (float, optional): Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            dict: The final status record (`id`, `status`, `deliveredAt`), or None on timeout.
+        """
+        logger.info("Waiting for the final status of message %s", message_id)
+        return await self.status_store.wait_for_status_async(message_id, timeout=timeout)
+
+    # Signature validation is pure CPU work, so the sync implementation is shared as-is.
+    validate_webhook_signature = Messages.validate_webhook_signature
+
+
+async def _aiterate(items: Union[Iterable, AsyncIterable]) -> AsyncIterator:
+    """
+    Iterate over a sync or async iterable from a coroutine.
+    """
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
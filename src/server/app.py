@@ -1,47 +1,340 @@
-import json
+import asyncio
+import logging
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from fastapi import FastAPI, HTTPException, Header, Request
-from src.core.config import settings
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from src.core import codec
+from src.core.config import get_settings
+from src.core.cache import TTLCache
+from src.core.dedup import DUPLICATE, NEW, REPLAYED, EventDeduplicator, EventRef
+from src.core.sqlite_cache import SQLiteCache
 from src.sdk.client import ApiClient
 from src.schemas.webhook import WebhookPayload
 from src.sdk.features.messages import Messages
-from src.core.security import verify_signature
+from src.core.security import SignatureVerifier
+from src.core.validators import get_adapter
+from src.core.status_store import MessageStatusStore
 from src.core.logger import webhook_logger as logger
 from src.schemas.errors import UnauthorizedError, BadRequestError, ServerError
+from src.server.handlers import WILDCARD, HandlerRegistry
+from src.server.workers import BatchTooLargeError, EventWorkerPool, QueueFullError
+
+
+class CodecJSONResponse(JSONResponse):
+    """
+    JSON response rendered with the SDK's JSON codec.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return codec.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Run the webhook workers for the lifetime of the server and drain their
+    queue on shutdown.
+    """
+    settings = get_settings()
+    executor = None
+    if settings.WEBHOOK_WORKER_THREADS > 0:
+        executor = ThreadPoolExecutor(settings.WEBHOOK_WORKER_THREADS, thread_name_prefix="webhook")
+    handlers.executor = executor
+    if worker_pool is not None:
+        await worker_pool.start()
+    try:
+        yield
+    finally:
+        if worker_pool is not None:
+            await worker_pool.stop(settings.WEBHOOK_DRAIN_TIMEOUT)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        handlers.executor = None
+
 
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=CodecJSONResponse, lifespan=lifespan)
+
+# Latest delivery status per message, fed by incoming webhooks
+status_store = MessageStatusStore()
 
 # SDK instance for validation
 # Initialize ApiClient and Messages
 api_client = ApiClient()
-messages_sdk = Messages(client=api_client)
+messages_sdk = Messages(client=api_client, status_store=status_store)
+
+
+async def read_verified_body(request: Request, authorization: str) -> bytes:
+    """
+    Read the raw body chunk by chunk, computing its HMAC as it streams in, and
+    check the signature before anything is parsed.
+
+    Args:
+        request (Request): The incoming request.
+        authorization (str): The `Authorization` header, `Bearer <signature>`.
+
+    Returns:
+        bytes: The authenticated raw body.
+
+    Raises:
+        HTTPException: 413 if the body exceeds `WEBHOOK_MAX_BODY_BYTES`.
+        UnauthorizedError: If the signature is invalid.
+    """
+    settings = get_settings()
+    limit = settings.WEBHOOK_MAX_BODY_BYTES
+    too_large = HTTPException(status_code=413, detail=f"Request body exceeds {limit} bytes.")
+    if int(request.headers.get("content-length") or 0) > limit:
+        raise too_large
+
+    verifier = SignatureVerifier(settings.WEBHOOK_SECRET)
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise too_large
+        verifier.update(chunk)
+        chunks.append(chunk)
+    verifier.verify(authorization.removeprefix("Bearer "))
+    return b"".join(chunks)
+
+
+# Placeholder for an NDJSON line that is not valid JSON
+_INVALID_JSON = object()
+
+
+def _json_invalid_error(loc: tuple = ("body",)) -> Dict:
+    return {"type": "json_invalid", "loc": loc, "msg": "JSON decode error", "input": {}}
+
+
+def parse_webhook_payload(raw_body: bytes) -> WebhookPayload:
+    """
+    Parse an authenticated body into the event model in a single pass.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or not a valid event,
+            reported like FastAPI's own body validation (422).
+    """
+    try:
+        return get_adapter(WebhookPayload).validate_python(codec.loads(raw_body))
+    except ValueError as e:
+        if isinstance(e, ValidationError):
+            errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        else:
+            errors = [_json_invalid_error()]
+        raise RequestValidationError(errors, body=raw_body)
+
+
+def parse_webhook_batch(raw_body: bytes) -> List[Union[WebhookPayload, List[Dict]]]:
+    """
+    Parse an authenticated batch body: a JSON array of events, or NDJSON (one
+    event per line). The body is decoded once and every event validated with the
+    cached `WebhookPayload` adapter; an invalid event does not affect the others.
+
+    Returns:
+        list: For each event, the parsed payload or the list of its validation errors.
+
+    Raises:
+        RequestValidationError: If a JSON array body cannot be decoded.
+    """
+    body = raw_body.strip()
+    if body.startswith(b"["):
+        try:
+            items = codec.loads(body)
+        except ValueError:
+            raise RequestValidationError([_json_invalid_error()], body=raw_body)
+    else:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(codec.loads(line))
+            except ValueError:
+                items.append(_INVALID_JSON)
+
+    adapter = get_adapter(WebhookPayload)
+    events = []
+    for item in items:
+        if item is _INVALID_JSON:
+            events.append([{"type": "json_invalid", "loc": (), "msg": "JSON decode error"}])
+            continue
+        try:
+            events.append(adapter.validate_python(item))
+        except ValidationError as e:
+            events.append(e.errors(include_url=False, include_context=False, include_input=False))
+    return events
+
+
+# Event handlers per status; register more with `handlers.on("delivered")`
+handlers = HandlerRegistry(timeout=get_settings().WEBHOOK_HANDLER_TIMEOUT)
+
+
+@handlers.on(WILDCARD)
+async def print_event(payload: WebhookPayload) -> None:
+    """
+    Default handler: simulate event processing (printing is sufficient per task).
+    Printing is cheap enough to stay on the event loop.
+    """
+    print(f"Processed webhook payload: {payload.model_dump()}")
+
+
+async def process_events(payloads: List[WebhookPayload]) -> List[bool]:
+    """
+    Process authenticated delivery events in bulk: record their statuses, then
+    dispatch each event to the registered handlers.
+
+    Returns:
+        list[bool]: For each event, whether it changed the stored status
+            (False for stale or duplicate events).
+    """
+    # Record the statuses in one pass; stale or duplicate events are ignored
+    changed = status_store.update_many((payload.id, payload.status, payload.delivered_at) for payload in payloads)
+
+    await handlers.dispatch_many(payloads)
+    return changed
+
+
+# Background processing of authenticated events, started by `lifespan`;
+# WEBHOOK_WORKERS=0 processes events inline in the request instead
+worker_pool: Optional[EventWorkerPool] = None
+if get_settings().WEBHOOK_WORKERS > 0:
+    worker_pool = EventWorkerPool(
+        process_events,
+        max_pending=get_settings().WEBHOOK_QUEUE_SIZE,
+        workers=get_settings().WEBHOOK_WORKERS,
+        retry_after=get_settings().WEBHOOK_RETRY_AFTER,
+    )
+
+
+def _dedup_store(settings) -> Union[TTLCache, SQLiteCache]:
+    if settings.WEBHOOK_DEDUP_PATH:
+        return SQLiteCache(
+            settings.WEBHOOK_DEDUP_PATH,
+            namespace="webhook_events",
+            ttl=settings.WEBHOOK_DEDUP_TTL,
+            max_entries=settings.WEBHOOK_DEDUP_MAX_ENTRIES,
+        )
+    return TTLCache(max_size=settings.WEBHOOK_DEDUP_MAX_ENTRIES, ttl=settings.WEBHOOK_DEDUP_TTL)
+
+
+# Events already received, so retried deliveries are acknowledged without processing
+deduplicator = EventDeduplicator(
+    _dedup_store(get_settings()),
+    ttl=get_settings().WEBHOOK_DEDUP_TTL,
+    replay_window=get_settings().WEBHOOK_REPLAY_WINDOW,
+)
+
+
+def _event_refs(payloads: List[WebhookPayload]) -> List[EventRef]:
+    return [(payload.id, payload.status, payload.delivered_at) for payload in payloads]
+
+
+async def _with_dedup_store(call, *args):
+    # The in-memory store answers in microseconds; a persistent one does
+    # blocking I/O and is kept off the event loop
+    if isinstance(deduplicator.store, TTLCache):
+        return call(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, call, *args)
+
+
+async def claim_events(payloads: List[WebhookPayload]) -> List[str]:
+    """
+    Check events against the deduplicator, remembering the new ones.
+
+    Returns:
+        list[str]: For each event, `new`, `duplicate` or `replayed`.
+    """
+    return await _with_dedup_store(deduplicator.claim_many, _event_refs(payloads))
+
+
+async def release_events(payloads: List[WebhookPayload]) -> None:
+    """
+    Forget claimed events that could not be accepted, so their redelivery is processed.
+    """
+    await _with_dedup_store(deduplicator.release_many, _event_refs(payloads))
+
+
+async def ingest(payloads: List[WebhookPayload]) -> Optional[List[bool]]:
+    """
+    Hand events to the background workers and return at once. Without a worker
+    pool (`WEBHOOK_WORKERS=0`) they are processed inline instead.
+
+    Returns:
+        list[bool]: The result of `process_events` when processed inline, None when queued.
+
+    Raises:
+        BatchTooLargeError: If there are more events than the queue can hold.
+        QueueFullError: If the queue is full, or the workers are not running
+            (not started yet, draining or stopped).
+    """
+    if worker_pool is None:
+        return await process_events(payloads)
+    worker_pool.submit(payloads)
+    return None
+
+
+def _service_unavailable(error: QueueFullError) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=error.message,
+        headers={"Retry-After": str(max(1, round(error.retry_after)))},
+    )
 
 
 @app.post("/webhooks")
 async def handle_webhook(
-    payload: WebhookPayload,
+    request: Request,
     authorization: str = Header(...),
-    request: Request = None,
 ):
     """
     Webhook endpoint to process incoming events.
+
+    The signature is verified over the streamed raw body before it is parsed, so
+    forged or oversized requests are rejected without any JSON work. The event is
+    then queued for the background workers and acknowledged immediately; a full
+    queue answers 503 with `Retry-After`. An event already received is
+    acknowledged again without being processed, and one older than the replay
+    window is refused with 400.
     """
     try:
-        # Extract raw request body
-        raw_body = await request.body()
-
-        # Validate signature using the SDK
-        verify_signature(raw_body, authorization.removeprefix("Bearer "), settings.WEBHOOK_SECRET)
+        # Authenticate the raw body, then parse it once
+        raw_body = await read_verified_body(request, authorization)
+        payload = parse_webhook_payload(raw_body)
 
         # Log the received payload
-        logger.info(f"Webhook received: {payload.model_dump()}")
+        logger.info("Webhook received for message %s with status %s", payload.id, payload.status)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Webhook payload: %s", payload.model_dump())
 
-        # Simulate event processing (printing is sufficient per task)
-        print(f"Processed webhook payload: {payload.model_dump()}")
+        # Retried deliveries get the same answer without being processed again
+        outcome = (await claim_events([payload]))[0]
+        if outcome == REPLAYED:
+            raise HTTPException(
+                status_code=400,
+                detail=BadRequestError(error="Webhook event is outside the replay window.").model_dump()
+            )
+        if outcome == DUPLICATE:
+            logger.debug("Duplicate webhook for message %s ignored", payload.id)
+            return {"message": "Webhook processed successfully."}
+
+        try:
+            await ingest([payload])
+        except Exception:
+            await release_events([payload])
+            raise
 
         return {"message": "Webhook processed successfully."}
-    
+
+    except (HTTPException, RequestValidationError):
+        raise
+    except QueueFullError as e:
+        raise _service_unavailable(e)
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -57,3 +350,71 @@ async def handle_webhook(
             status_code=500,
             detail=ServerError(message="An unexpected error occurred").model_dump()
         )
+
+
+@app.post("/webhooks/batch")
+async def handle_webhook_batch(
+    request: Request,
+    authorization: str = Header(...),
+):
+    """
+    Batch webhook endpoint: many delivery events in one signed body, either a
+    JSON array or NDJSON (one event per line).
+
+    The signature is verified once for the whole body. Valid events are processed
+    in bulk and each event gets an outcome: `accepted` (queued for the workers),
+    `processed` and `ignored` (stale) when processed inline, `duplicate`
+    (already received), `replayed` (outside the replay window), or `invalid`
+    (with its validation errors). A batch with more new events than the queue
+    can hold is refused with 413, since retrying it could never succeed.
+    """
+    try:
+        raw_body = await read_verified_body(request, authorization)
+        events = parse_webhook_batch(raw_body)
+
+        payloads = [event for event in events if isinstance(event, WebhookPayload)]
+        logger.info("Webhook batch received with %s events (%s valid)", len(events), len(payloads))
+        claimed = await claim_events(payloads)
+        fresh = [payload for payload, outcome in zip(payloads, claimed) if outcome == NEW]
+        try:
+            changed = await ingest(fresh)
+        except Exception:
+            await release_events(fresh)
+            raise
+        changed = iter(changed) if changed is not None else None
+        claimed = iter(claimed)
+
+        results = []
+        counts = {"accepted": 0, "processed": 0, "ignored": 0, "duplicate": 0, "replayed": 0, "invalid": 0}
+        for index, event in enumerate(events):
+            if isinstance(event, WebhookPayload):
+                outcome = next(claimed)
+                if outcome == NEW:
+                    if changed is None:
+                        outcome = "accepted"
+                    else:
+                        outcome = "processed" if next(changed) else "ignored"
+                results.append({"index": index, "id": event.id, "outcome": outcome})
+            else:
+                outcome = "invalid"
+                results.append({"index": index, "outcome": outcome, "errors": event})
+            counts[outcome] += 1
+
+        return {"message": "Webhook batch processed.", "received": len(events), **counts, "results": results}
+
+    except (HTTPException, RequestValidationError):
+        raise
+    except QueueFullError as e:
+        raise _service_unavailable(e)
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=413, detail=e.message)
+    except UnauthorizedError as e:
+        raise HTTPException(
+            status_code=401,
+            detail=e.message
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail=ServerError(message="An unexpected error occurred").model_dump()
+        )
@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.core.logger import webhook_logger as logger
+from src.core.status_store import STATUS_RANK
+
+# Registers a handler for every status
+WILDCARD = "*"
+
+EventHandler = Callable[[Any], Any]
+
+
+class HandlerRegistry:
+    """
+    Event handlers per delivery status, dispatched concurrently.
+
+    Handlers are registered for `queued`, `delivered`, `failed` or the wildcard
+    `*`, and may be coroutine functions or plain functions. For each event, all
+    matching handlers run at the same time: coroutines on the event loop, plain
+    functions on a thread pool so blocking work (database writes, HTTP calls)
+    never stalls the loop.
+
+    Every handler call is bounded by a timeout and isolated: an exception or
+    timeout is logged and counted, and neither affects the other handlers nor
+    the webhook response. A timed-out plain function cannot be interrupted; its
+    thread finishes in the background.
+
+    Attributes:
+        stats (dict): Per handler name, `calls`, `errors`, `timeouts`,
+            `total_seconds`, `avg_seconds` and `max_seconds`.
+    """
+
+    def __init__(self, timeout: Optional[float] = 10.0, executor: Optional[Executor] = None):
+        """
+        Args:
+            timeout (float, optional): Default seconds a handler may run. None waits indefinitely.
+            executor (Executor, optional): Thread pool for plain functions. Defaults to the event loop's.
+        """
+        self.timeout = timeout
+        self.executor = executor
+        self._handlers: Dict[str, List[Tuple[str, EventHandler, Optional[float]]]] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def register(
+        self,
+        status: str,
+        handler: EventHandler,
+        timeout: Optional[float] = None,
+        name: Optional[str] = None,
+    ) -> EventHandler:
+        """
+        Register a handler for events with a status.
+
+        Args:
+            status (str): 'queued', 'delivered', 'failed' or '*' for every event.
+            handler (Callable): Called with the event; sync or async.
+            timeout (float, optional): Overrides the registry's timeout for this handler.
+            name (str, optional): Name in logs and `stats`. Defaults to the function's qualified name.
+
+        Returns:
+            Callable: The handler, unchanged.
+
+        Raises:
+            ValueError: If the status is unknown.
+        """
+        if status != WILDCARD and status not in STATUS_RANK:
+            raise ValueError(f"Unknown status: {status}")
+        name = name or getattr(handler, "__qualname__", repr(handler))
+        self._handlers.setdefault(status, []).append((name, handler, timeout))
+        self.stats.setdefault(
+            name,
+            {"calls": 0, "errors": 0, "timeouts": 0, "total_seconds": 0.0, "avg_seconds": 0.0, "max_seconds": 0.0},
+        )
+        return handler
+
+    def on(self, status: str, timeout: Optional[float] = None) -> Callable[[EventHandler], EventHandler]:
+        """
+        Decorator form of `register`:
+
+            @handlers.on("delivered")
+            async def notify(event): ...
+        """
+        return lambda handler: self.register(status, handler, timeout)
+
+    def unregister(self, status: str, handler: EventHandler) -> None:
+        """
+        Remove a handler registered for a status.
+        """
+        self._handlers[status] = [entry for entry in self._handlers.get(status, []) if entry[1] is not handler]
+
+    def handlers_for(self, status: str) -> List[Tuple[str, EventHandler, Optional[float]]]:
+        """
+        Handlers matching a status: the status' own, then the wildcard ones.
+        """
+        return self._handlers.get(status, []) + self._handlers.get(WILDCARD, [])
+
+    async def dispatch(self, event: Any) -> Dict[str, str]:
+        """
+        Run every handler matching the event's status concurrently.
+
+        Args:
+            event: The event; its `status` attribute selects the handlers.
+
+        Returns:
+            dict: Per handler name, `ok`, `error` or `timeout`.
+        """
+        handlers = self.handlers_for(event.status)
+        if len(handlers) == 1:
+            # Nothing to run concurrently; skip the task gather would create
+            outcomes = [await self._call(*handlers[0], event)]
+        else:
+            outcomes = await asyncio.gather(*(self._call(*entry, event) for entry in handlers))
+        return {name: outcome for (name, _, _), outcome in zip(handlers, outcomes)}
+
+    async def dispatch_many(self, events: List[Any]) -> List[Dict[str, str]]:
+        """
+        Dispatch events one after another, so handlers see them in order.
+        """
+        return [await self.dispatch(event) for event in events]
+
+    async def _call(self, name: str, handler: EventHandler, timeout: Optional[float], event: Any) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        if inspect.iscoroutinefunction(handler):
+            call = handler(event)
+        else:
+            call = asyncio.get_running_loop().run_in_executor(self.executor, handler, event)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(call, timeout)
+            outcome = "ok"
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            logger.warning("Webhook handler %s timed out after %ss", name, timeout)
+        except Exception as e:
+            outcome = "error"
+            logger.error("Webhook handler %s failed: %s", name, e)
+        self._record(name, outcome, time.perf_counter() - started)
+        return outcome
+
+    def _record(self, name: str, outcome: str, elapsed: float) -> None:
+        stats = self.stats[name]
+        stats["calls"] += 1
+        if outcome == "error":
+            stats["errors"] += 1
+        elif outcome == "timeout":
+            stats["timeouts"] += 1
+        stats["total_seconds"] += elapsed
+        stats["avg_seconds"] = stats["total_seconds"] / stats["calls"]
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
@@ -0,0 +1,166 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Sequence
+from src.core.logger import webhook_logger as logger
+
+
+class QueueFullError(Exception):
+    """
+    Raised when events cannot be queued because the queue is full or the pool is
+    not accepting work (stopped or draining).
+    """
+
+    def __init__(self, message: str = "Webhook queue is full.", retry_after: float = 1.0):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+class BatchTooLargeError(Exception):
+    """
+    Raised when more events are submitted at once than the queue can ever hold,
+    so retrying the same submission cannot succeed.
+    """
+
+    def __init__(self, size: int, max_pending: int):
+        self.message = f"Batch of {size} events exceeds the webhook queue size of {max_pending}."
+        super().__init__(self.message)
+        self.size = size
+        self.max_pending = max_pending
+
+
+class EventWorkerPool:
+    """
+    Bounded in-memory queue of webhook events processed by background workers.
+
+    The endpoint authenticates and parses a request, `submit`s its events and
+    acknowledges immediately; slow processing no longer delays the response and
+    causes sender-side timeouts. The queue holds at most `max_pending` events:
+    beyond that `submit` raises `QueueFullError` so the endpoint can answer 503
+    with `Retry-After` and the sender backs off. A submission larger than
+    `max_pending` could never fit and raises `BatchTooLargeError` instead.
+
+    Workers are asyncio tasks. The handler may be a coroutine function, a plain
+    function run on the event loop, or (when `executor` is given) a plain
+    function run on that thread pool so it cannot block the loop.
+
+    Attributes:
+        stats (dict): `enqueued`, `processed`, `failed` and `rejected` event counts.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Any],
+        max_pending: int = 10_000,
+        workers: int = 4,
+        executor: Optional[Executor] = None,
+        retry_after: float = 1.0,
+    ):
+        """
+        Args:
+            handler (Callable): Processes a list of events; sync or async.
+            max_pending (int): Maximum number of queued, unprocessed events.
+            workers (int): Number of concurrent worker tasks.
+            executor (Executor, optional): Thread pool for a sync handler.
+            retry_after (float): Seconds suggested to senders when the queue is full.
+        """
+        self.handler = handler
+        self.max_pending = max_pending
+        self.workers = workers
+        self.executor = executor
+        self.retry_after = retry_after
+        self.pending = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._accepting = False
+        self.stats = {"enqueued": 0, "processed": 0, "failed": 0, "rejected": 0}
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the pool accepts new events.
+        """
+        return self._accepting
+
+    async def start(self) -> None:
+        """
+        Start the worker tasks on the running event loop.
+        """
+        if self._accepting:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work(), name=f"webhook-worker-{i}") for i in range(self.workers)]
+        self._accepting = True
+        logger.info("Started %s webhook workers (queue size %s)", self.workers, self.max_pending)
+
+    def submit(self, events: Sequence[Any]) -> None:
+        """
+        Queue events for processing by the workers, all or none.
+
+        Raises:
+            BatchTooLargeError: If there are more events than `max_pending`.
+            QueueFullError: If the pool is not running or the events do not fit now.
+        """
+        if len(events) > self.max_pending:
+            self.stats["rejected"] += len(events)
+            raise BatchTooLargeError(len(events), self.max_pending)
+        if not self._accepting:
+            self.stats["rejected"] += len(events)
+            raise QueueFullError("Webhook workers are not accepting events.", self.retry_after)
+        if self.pending + len(events) > self.max_pending:
+            self.stats["rejected"] += len(events)
+            logger.warning("Webhook queue full (%s pending); rejecting %s events", self.pending, len(events))
+            raise QueueFullError(retry_after=self.retry_after)
+        self.pending += len(events)
+        self.stats["enqueued"] += len(events)
+        self._queue.put_nowait(list(events))
+
+    async def process(self, events: List[Any]) -> Any:
+        """
+        Run the handler on events now, in the caller's task.
+
+        Returns:
+            Any: The handler's result.
+        """
+        if inspect.iscoroutinefunction(self.handler):
+            return await self.handler(events)
+        if self.executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.handler, events)
+        return self.handler(events)
+
+    async def _work(self) -> None:
+        while True:
+            events = await self._queue.get()
+            try:
+                await self.process(events)
+                self.stats["processed"] += len(events)
+            except Exception as e:
+                self.stats["failed"] += len(events)
+                logger.error("Webhook worker failed to process %s events: %s", len(events), e)
+            finally:
+                self.pending -= len(events)
+                self._queue.task_done()
+
+    async def stop(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        Stop accepting events, wait for queued and in-flight events to be
+        processed, then stop the workers.
+
+        Args:
+            timeout (float, optional): Maximum seconds to drain. None waits until the queue is empty.
+        """
+        if not self._accepting:
+            return
+        self._accepting = False
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            logger.info("Drained webhook queue in %.2fs", time.monotonic() - started)
+        except asyncio.TimeoutError:
+            logger.warning("Webhook queue drain timed out; dropping %s pending events", self.pending)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -1,8 +1,16 @@
-import pytest
-from src.sdk.client import ApiClient
-from src.sdk.features.contacts import Contacts
-from src.sdk.features.messages import Messages
-from unittest.mock import patch
+import os
+import tempfile
+
+# Keep the warnings logged by tests out of the working tree
+os.environ.setdefault("LOG_DIR", os.path.join(tempfile.gettempdir(), "sdk-test-logs"))
+# Process webhooks inline so tests can assert on their effects; queue tests install a worker pool
+os.environ.setdefault("WEBHOOK_WORKERS", "0")
+
+import pytest  # noqa: E402
+from src.sdk.client import ApiClient  # noqa: E402
+from src.sdk.features.contacts import Contacts, AsyncContacts  # noqa: E402
+from src.sdk.features.messages import Messages, AsyncMessages  # noqa: E402
+from unittest.mock import patch, AsyncMock, MagicMock  # noqa: E402
 
 
 @pytest.fixture
@@ -61,3 +69,32 @@ def messages(mock_api_client):
         Messages: A Messages instance using the mocked ApiClient.
     """
     return Messages(client=mock_api_client)
+
+
+@pytest.fixture
+def mock_async_client():
+    """
+    Fixture to provide a mocked AsyncApiClient whose 'request' is an AsyncMock.
+
+    Returns:
+        MagicMock: A mocked AsyncApiClient instance.
+    """
+    mock_client = MagicMock()
+    mock_client.request = AsyncMock(return_value={"success": True})
+    return mock_client
+
+
+@pytest.fixture
+def async_contacts(mock_async_client):
+    """
+    Fixture to provide an AsyncContacts instance with a mocked AsyncApiClient.
+    """
+    return AsyncContacts(client=mock_async_client)
+
+
+@pytest.fixture
+def async_messages(mock_async_client):
+    """
+    Fixture to provide an AsyncMessages instance with a mocked AsyncApiClient.
+    """
+    return AsyncMessages(client=mock_async_client)
@@ -1,4 +1,5 @@
 import pytest
+from src.schemas.contacts import Contact, ListContactsResponse
 
 
 @pytest.mark.e2e
@@ -17,7 +18,7 @@ def test_create_and_retrieve_contact(mock_api_client, contacts):
     # Step 1: Create a contact
     contact_payload = {"name": "John Doe", "phone": "+123456789"}
     created_contact = contacts.create_contact(contact_payload)
-    assert created_contact == create_response, "Failed to create contact."
+    assert created_contact == Contact.model_validate(create_response), "Failed to create contact."
 
     # Mock the API response for retrieving the contact
     retrieve_response = {
@@ -29,7 +30,7 @@ def test_create_and_retrieve_contact(mock_api_client, contacts):
 
     # Step 2: Retrieve the contact
     retrieved_contact = contacts.get_contact(contact_id="contact123")
-    assert retrieved_contact == retrieve_response, "Failed to retrieve contact."
+    assert retrieved_contact == Contact.model_validate(retrieve_response), "Failed to retrieve contact."
 
     # Ensure API calls were made as expected
     mock_api_client.request.assert_any_call("POST", "/contacts", json=contact_payload)
@@ -52,7 +53,7 @@ def test_update_contact_and_verify(mock_api_client, contacts):
     # Step 1: Update the contact
     update_payload = {"name": "Johnathan Doe", "phone": "+987654321"}
     updated_contact = contacts.update_contact(contact_id="contact123", payload=update_payload)
-    assert updated_contact == update_response, "Failed to update contact."
+    assert updated_contact == Contact.model_validate(update_response), "Failed to update contact."
 
     # Mock the API response for retrieving the updated contact
     retrieve_response = {
@@ -64,7 +65,7 @@ def test_update_contact_and_verify(mock_api_client, contacts):
 
     # Step 2: Retrieve the updated contact
     retrieved_contact = contacts.get_contact(contact_id="contact123")
-    assert retrieved_contact == retrieve_response, "Failed to verify updated contact."
+    assert retrieved_contact == Contact.model_validate(retrieve_response), "Failed to verify updated contact."
 
     # Ensure API calls were made as expected
     mock_api_client.request.assert_any_call("PATCH", "/contacts/contact123", json=update_payload)
@@ -117,7 +118,8 @@ def test_list_contacts_with_pagination(mock_api_client, contacts):
     contacts_list = contacts.list_contacts(page=1, max=2)
 
     # Validate the response
-    assert contacts_list == list_response, "Failed to list contacts with pagination."
+    expected = ListContactsResponse.model_validate(list_response)
+    assert contacts_list == expected, "Failed to list contacts with pagination."
 
     # Ensure the API call was made with the correct arguments
     mock_api_client.request.assert_called_once_with(
@@ -1,4 +1,5 @@
 import pytest
+from src.schemas.messages import ListMessagesResponse, Message
 
 
 @pytest.mark.e2e
@@ -28,7 +29,7 @@ def test_send_message_and_verify(mock_api_client, messages):
         "from": "+987654321"  # Use the correct field name
     }
     sent_message = messages.send_message(payload=send_payload)
-    assert sent_message == send_response, "Failed to send message."
+    assert sent_message == Message.model_validate(send_response), "Failed to send message."
 
     # Step 3: Mock the API response for retrieving the message
     retrieve_response = {
@@ -47,7 +48,7 @@ def test_send_message_and_verify(mock_api_client, messages):
 
     # Step 4: Retrieve the message and verify its details
     retrieved_message = messages.get_message(message_id="msg123")
-    assert retrieved_message == retrieve_response, "Failed to retrieve the sent message."
+    assert retrieved_message == Message.model_validate(retrieve_response), "Failed to retrieve the sent message."
 
     # Ensure the API calls were made as expected
     mock_api_client.request.assert_any_call("POST", "/messages", json=send_payload)
@@ -86,7 +87,8 @@ def test_list_messages_with_pagination(mock_api_client, messages):
 
     # Step 2: List messages
     messages_list = messages.list_messages(page=1, limit=2)
-    assert messages_list == list_response, "Failed to list messages with pagination."
+    expected = ListMessagesResponse.model_validate(list_response)
+    assert messages_list == expected, "Failed to list messages with pagination."
 
     # Ensure the API call was made as expected
     mock_api_client.request.assert_called_once_with(
@@ -116,7 +118,7 @@ def test_resend_failed_message(mock_api_client, messages):
 
     # Step 2: Retrieve the failed message
     failed_message = messages.get_message(message_id="msg123")
-    assert failed_message == retrieve_response, "Failed to retrieve the failed message."
+    assert failed_message == Message.model_validate(retrieve_response), "Failed to retrieve the failed message."
 
     # Step 3: Mock the API response for resending the message
     resend_payload = {
@@ -140,7 +142,7 @@ def test_resend_failed_message(mock_api_client, messages):
 
     # Step 4: Resend the message
     resent_message = messages.send_message(payload=resend_payload)
-    assert resent_message == resend_response, "Failed to resend the failed message."
+    assert resent_message == Message.model_validate(resend_response), "Failed to resend the failed message."
 
     # Ensure the API calls were made as expected
     mock_api_client.request.assert_any_call("GET", "/messages/msg123")
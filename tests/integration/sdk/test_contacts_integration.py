@@ -13,9 +13,9 @@ def test_create_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("POST", "/contacts", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
-    assert response["phone"] == "+123456789"
+    assert response.id == "123"
+    assert response.name == "John Doe"
+    assert response.phone == "+123456789"
 
 
 def test_create_contact_invalid_response(contacts, mock_api_client):
@@ -66,8 +66,8 @@ def test_list_contacts_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/contacts", params={"pageIndex": 1, "max": 2})
-    assert len(response["contactsList"]) == 2
-    assert response["contactsList"][0]["id"] == "123"
+    assert len(response.contacts) == 2
+    assert response.contacts[0].id == "123"
 
 
 def test_get_contact_success(contacts, mock_api_client):
@@ -81,8 +81,8 @@ def test_get_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", f"/contacts/{contact_id}")
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
+    assert response.id == "123"
+    assert response.name == "John Doe"
 
 
 def test_get_contact_not_found(contacts, mock_api_client):
@@ -108,8 +108,8 @@ def test_update_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("PATCH", f"/contacts/{contact_id}", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "Jane Doe"
+    assert response.id == "123"
+    assert response.name == "Jane Doe"
 
 
 def test_update_contact_not_found(contacts, mock_api_client):
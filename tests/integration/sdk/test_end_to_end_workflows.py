@@ -1,4 +1,6 @@
 import pytest
+from src.schemas.contacts import ListContactsResponse
+from src.schemas.messages import ListMessagesResponse, Message
 
 
 def test_send_and_check_message_workflow(messages, mock_api_client):
@@ -27,12 +29,12 @@ def test_send_and_check_message_workflow(messages, mock_api_client):
 
     # Send the message
     sent_message = messages.send_message(payload=send_payload)
-    assert sent_message == sent_message_response, "Message sending failed."
+    assert sent_message == Message.model_validate(sent_message_response), "Message sending failed."
 
     # Step 2: Check the status of the message
     mock_api_client.request.return_value = sent_message_response
     retrieved_message = messages.get_message(message_id="msg123")
-    assert retrieved_message == sent_message_response, "Failed to retrieve the sent message."
+    assert retrieved_message == Message.model_validate(sent_message_response), "Failed to retrieve the sent message."
 
     # Ensure the API was called as expected
     mock_api_client.request.assert_any_call("POST", "/messages", json=send_payload)
@@ -57,7 +59,7 @@ def test_list_contacts_and_messages_workflow(contacts, messages, mock_api_client
 
     # Call the list_contacts method
     contacts_list = contacts.list_contacts()
-    assert contacts_list == contacts_list_response, "Failed to list contacts."
+    assert contacts_list == ListContactsResponse.model_validate(contacts_list_response), "Failed to list contacts."
 
     # Assert the API call was made with correct parameters
     mock_api_client.request.assert_called_once_with(
@@ -84,7 +86,7 @@ def test_list_contacts_and_messages_workflow(contacts, messages, mock_api_client
 
     # Call the list_messages method
     messages_list = messages.list_messages()
-    assert messages_list == messages_list_response, "Failed to list messages."
+    assert messages_list == ListMessagesResponse.model_validate(messages_list_response), "Failed to list messages."
 
     # Assert the API call was made with correct parameters
     mock_api_client.request.assert_called_with(
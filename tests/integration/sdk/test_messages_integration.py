@@ -1,5 +1,6 @@
 import pytest
 from src.core.exceptions import ApiError, UnauthorizedError, MessageNotFoundError
+from src.schemas.messages import ListMessagesResponse, Message
 
 def test_send_message_success(messages, mock_api_client):
     """
@@ -27,7 +28,7 @@ def test_send_message_success(messages, mock_api_client):
     mock_api_client.request.assert_called_once_with(
         "POST", "/messages", json=payload
     )
-    assert result == mock_response
+    assert result == Message.model_validate(mock_response)
 
 
 def test_send_message_validation_error(messages, mock_api_client):
@@ -75,7 +76,7 @@ def test_list_messages_success(messages, mock_api_client):
     mock_api_client.request.assert_called_once_with(
         "GET", "/messages", params={"page": 1, "limit": 10}
     )
-    assert result == mock_response
+    assert result == ListMessagesResponse.model_validate(mock_response)
 
 
 def test_list_messages_error(messages, mock_api_client):
@@ -108,7 +109,7 @@ def test_get_message_success(messages, mock_api_client):
     mock_api_client.request.assert_called_once_with(
         "GET", "/messages/msg123"
     )
-    assert result == mock_response
+    assert result == Message.model_validate(mock_response)
 
 
 def test_get_message_not_found(messages, mock_api_client):
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+from src.core.cache import TTLCache
+
+
+def test_get_returns_default_on_miss():
+    """Test that a missing key counts as a miss."""
+    cache = TTLCache()
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "fallback") == "fallback"
+    assert cache.stats["misses"] == 2
+
+
+def test_set_and_get_counts_hits():
+    """Test that stored values are returned and counted as hits."""
+    cache = TTLCache()
+    cache.set("a", {"id": "a"})
+
+    assert cache.get("a") == {"id": "a"}
+    assert cache.stats["hits"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test LRU eviction once max_size is exceeded."""
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl():
+    """Test that entries are dropped once their TTL passes."""
+    cache = TTLCache(ttl=10)
+    with patch("src.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+    with patch("src.core.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    assert cache.stats["expirations"] == 1
+
+
+def test_delete_and_clear():
+    """Test explicit invalidation."""
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("unknown")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_delete_prefix():
+    """Test dropping every key with a common prefix."""
+    cache = TTLCache()
+    for key in ("GET /contacts", "GET /contacts {}", "GET /messages"):
+        cache.set(key, 1)
+
+    cache.delete_prefix("GET /contacts")
+
+    assert len(cache) == 1
+    assert cache.get("GET /messages") == 1
@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.core.exceptions import CircuitOpenError, ServerError, NotFoundError, RateLimitError, TransientError
+
+KEY = "POST /messages"
+
+
+def trip(breaker, key=KEY, times=3):
+    for _ in range(times):
+        breaker.before_call(key)
+        breaker.record_failure(key, ServerError())
+
+
+def test_opens_after_consecutive_failures():
+    """Test that the circuit opens after the failure threshold and then fails fast."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+    trip(breaker)
+
+    assert breaker.state(KEY) == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError, match="Circuit open for POST /messages") as excinfo:
+        breaker.before_call(KEY)
+    assert 0 < excinfo.value.retry_after <= 60
+
+
+def test_success_resets_failure_count():
+    """Test that a success in between failures keeps the circuit closed."""
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record_failure(KEY, ServerError())
+    breaker.record_success(KEY)
+    breaker.record_failure(KEY, ServerError())
+
+    assert breaker.state(KEY) == CircuitState.CLOSED
+
+
+def test_client_errors_do_not_count():
+    """Test that 4xx and rate limiting do not open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    breaker.record_failure(KEY, NotFoundError())
+    breaker.record_failure(KEY, RateLimitError(retry_after=1))
+
+    assert breaker.state(KEY) == CircuitState.CLOSED
+
+
+def test_circuits_are_independent_per_endpoint():
+    """Test that one failing endpoint does not affect another."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    trip(breaker, times=1)
+
+    assert breaker.state(KEY) == CircuitState.OPEN
+    breaker.before_call("GET /contacts/{id}")
+
+
+def test_half_open_trial_closes_or_reopens():
+    """Test the half-open trial call after the cool-down."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, half_open_max_calls=1)
+
+    with patch("src.core.circuit_breaker.time.monotonic", return_value=100.0):
+        trip(breaker, times=1)
+    with patch("src.core.circuit_breaker.time.monotonic", return_value=111.0):
+        breaker.before_call(KEY)
+        assert breaker.state(KEY) == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call(KEY)  # only one trial call at a time
+        breaker.record_failure(KEY, TransientError(status_code=503))
+        assert breaker.state(KEY) == CircuitState.OPEN
+
+    with patch("src.core.circuit_breaker.time.monotonic", return_value=122.0):
+        breaker.before_call(KEY)
+        breaker.record_success(KEY)
+        assert breaker.state(KEY) == CircuitState.CLOSED
+
+
+def test_release_frees_half_open_trial_slot():
+    """Test that an abandoned trial call lets the next call try again."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, half_open_max_calls=1)
+
+    with patch("src.core.circuit_breaker.time.monotonic", return_value=100.0):
+        trip(breaker, times=1)
+    with patch("src.core.circuit_breaker.time.monotonic", return_value=111.0):
+        breaker.before_call(KEY)
+        breaker.release(KEY)
+        breaker.before_call(KEY)
+
+    assert breaker.state(KEY) == CircuitState.HALF_OPEN
+
+
+def test_state_change_hooks():
+    """Test that hooks are notified about transitions and hook errors are isolated."""
+    hook = MagicMock()
+    breaker = CircuitBreaker(failure_threshold=1, on_state_change=hook)
+    breaker.add_listener(MagicMock(side_effect=Exception("broken hook")))
+
+    trip(breaker, times=1)
+
+    hook.assert_called_once_with(KEY, CircuitState.CLOSED, CircuitState.OPEN)
@@ -0,0 +1,59 @@
+import json
+import pytest
+from src.core import codec
+from src.core.codec import get_codec, load_codec, set_codec
+
+PAYLOAD = {"id": "msg1", "content": "Grüße 👋", "to": {"id": "c1"}, "pages": [1, 2.5, None, True]}
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    yield
+    set_codec(None)
+
+
+def available_backends():
+    backends = []
+    for name in codec.BACKENDS:
+        try:
+            load_codec(name)
+            backends.append(name)
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_backends_produce_identical_output(name):
+    """Test that payloads and signatures do not depend on the installed library."""
+    encoded = load_codec(name).dumps(PAYLOAD)
+
+    assert encoded == json.dumps(PAYLOAD, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert load_codec(name).loads(encoded) == PAYLOAD
+
+
+@pytest.mark.parametrize("name", available_backends())
+def test_decode_errors_are_json_decode_errors(name):
+    """Test that every backend reports malformed input the same way."""
+    with pytest.raises(json.JSONDecodeError):
+        load_codec(name).loads(b'{"id": ')
+
+
+def test_auto_prefers_fast_backend():
+    """Test that the first installed backend is picked."""
+    assert load_codec("auto").name == available_backends()[0]
+
+
+def test_set_codec_overrides_settings():
+    """Test forcing the stdlib backend at runtime."""
+    set_codec("json")
+
+    assert get_codec().name == "json"
+    assert codec.dumps({"a": 1}) == b'{"a":1}'
+    assert codec.loads('{"a": 1}') == {"a": 1}
+
+
+def test_unknown_codec():
+    """Test that a typo in the backend name is reported."""
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        set_codec("ujson")
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from src.core.dedup import DUPLICATE, NEW, REPLAYED, EventDeduplicator
+from src.core.sqlite_cache import SQLiteCache
+
+DELIVERED_AT = datetime(2024, 12, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_claim_recognizes_duplicates():
+    """Test that an event is new once and a duplicate afterwards."""
+    dedup = EventDeduplicator()
+
+    assert dedup.claim("msg1", "delivered", DELIVERED_AT) == NEW
+    assert dedup.claim("msg1", "delivered", DELIVERED_AT) == DUPLICATE
+    assert dedup.claim("msg1", "delivered", DELIVERED_AT.isoformat()) == DUPLICATE
+    assert dedup.stats == {NEW: 1, DUPLICATE: 2, REPLAYED: 0}
+
+
+def test_claim_many_matches_single_claims():
+    """Test that a batch claim reports each event's outcome in order."""
+    dedup = EventDeduplicator(replay_window=300)
+    stale = datetime.now(timezone.utc) - timedelta(seconds=301)
+
+    outcomes = dedup.claim_many([("msg1", "queued", None), ("msg1", "queued", None), ("msg2", "delivered", stale)])
+
+    assert outcomes == [NEW, DUPLICATE, REPLAYED]
+    dedup.release_many([("msg1", "queued", None)])
+    assert dedup.claim("msg1", "queued") == NEW
+
+
+def test_key_includes_status_and_timestamp():
+    """Test that a new status or delivery time of the same message is not a duplicate."""
+    dedup = EventDeduplicator()
+
+    assert dedup.claim("msg1", "queued") == NEW
+    assert dedup.claim("msg1", "delivered", DELIVERED_AT) == NEW
+    assert dedup.claim("msg1", "delivered", DELIVERED_AT + timedelta(seconds=1)) == NEW
+
+
+def test_release_forgets_event():
+    """Test that a released event is processed on its next delivery."""
+    dedup = EventDeduplicator()
+    dedup.claim("msg1", "failed")
+
+    dedup.release("msg1", "failed")
+
+    assert dedup.claim("msg1", "failed") == NEW
+
+
+def test_events_expire_after_ttl():
+    """Test that events are forgotten once their TTL passes."""
+    dedup = EventDeduplicator(ttl=60)
+    with patch("src.core.cache.time.monotonic", return_value=1000.0):
+        dedup.claim("msg1", "failed")
+    with patch("src.core.cache.time.monotonic", return_value=1061.0):
+        assert dedup.claim("msg1", "failed") == NEW
+
+
+def test_replay_window():
+    """Test that events older than the window are refused and undated ones accepted."""
+    dedup = EventDeduplicator(replay_window=300)
+    now = datetime.now(timezone.utc)
+
+    assert dedup.claim("msg1", "delivered", now - timedelta(seconds=301)) == REPLAYED
+    assert dedup.claim("msg2", "delivered", now - timedelta(seconds=10)) == NEW
+    assert dedup.claim("msg3", "queued") == NEW
+    assert dedup.is_replay(datetime(2024, 12, 1, 12, 0), now=datetime(2024, 12, 1, 12, 6, tzinfo=timezone.utc))
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    """Test that duplicates are still recognized with a new deduplicator on the same file."""
+    path = str(tmp_path / "events.db")
+    EventDeduplicator(SQLiteCache(path, namespace="webhook_events")).claim("msg1", "delivered", DELIVERED_AT)
+
+    restarted = EventDeduplicator(SQLiteCache(path, namespace="webhook_events"))
+
+    assert restarted.claim("msg1", "delivered", DELIVERED_AT) == DUPLICATE
@@ -0,0 +1,45 @@
+from src.core.hedging import HedgingPolicy
+
+
+def test_delay_uses_initial_delay_until_enough_samples():
+    """Test the fallback delay before latencies are known."""
+    policy = HedgingPolicy(initial_delay=0.2, min_samples=5)
+
+    for _ in range(4):
+        policy.record_request("GET /contacts/{id}", 0.01)
+
+    assert policy.delay("GET /contacts/{id}") == 0.2
+
+
+def test_delay_tracks_latency_percentile():
+    """Test that the hedge delay follows the configured percentile per endpoint."""
+    policy = HedgingPolicy(percentile=90, min_samples=10, min_delay=0)
+
+    for i in range(1, 101):
+        policy.record_request("GET /messages/{id}", i / 1000)
+
+    assert policy.delay("GET /messages/{id}") == 0.091
+    assert policy.delay("GET /contacts/{id}") == policy.initial_delay
+
+
+def test_hedge_budget_caps_extra_load():
+    """Test that hedges are limited to the configured ratio of requests."""
+    policy = HedgingPolicy(max_hedge_ratio=0.1)
+
+    allowed = 0
+    for _ in range(100):
+        policy.record_request("GET /contacts/{id}", 0.01)
+        allowed += policy.allow_hedge()
+
+    assert allowed <= 10
+    assert policy.stats["hedged"] == allowed
+    assert policy.stats["requests"] == 100
+
+
+def test_only_idempotent_methods_are_hedged():
+    """Test that mutating requests are never hedged."""
+    policy = HedgingPolicy()
+
+    assert policy.applies_to("get")
+    assert not policy.applies_to("POST")
+    assert not policy.applies_to("PATCH")
@@ -0,0 +1,103 @@
+from unittest.mock import patch
+from src.core.http_cache import HttpCache, parse_cache_control
+
+
+def test_parse_cache_control():
+    """Test parsing of Cache-Control directives."""
+    assert parse_cache_control('private, Max-Age="60", no-cache') == {
+        "private": None, "max-age": "60", "no-cache": None,
+    }
+    assert parse_cache_control(None) == {}
+
+
+def test_fresh_entry_is_served_until_max_age():
+    """Test that max-age controls freshness."""
+    cache = HttpCache()
+    with patch("src.core.http_cache.time.time", return_value=1000.0):
+        cache.save("key", {"Cache-Control": "max-age=60"}, {"id": "1"})
+        entry = cache.lookup("key")
+        assert cache.is_fresh(entry)
+    with patch("src.core.http_cache.time.time", return_value=1061.0):
+        assert not cache.is_fresh(entry)
+
+    assert cache.stats["hits"] == 1
+
+
+def test_validators_produce_conditional_headers():
+    """Test that ETag and Last-Modified are sent back as conditions."""
+    cache = HttpCache()
+    cache.save("key", {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, {"id": "1"})
+
+    entry = cache.lookup("key")
+
+    assert not cache.is_fresh(entry)
+    assert cache.conditional_headers(entry) == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def test_no_store_and_unvalidated_responses_are_not_stored():
+    """Test that uncacheable responses are skipped."""
+    cache = HttpCache()
+    cache.save("a", {"Cache-Control": "no-store", "ETag": '"v1"'}, {})
+    cache.save("b", {}, {})
+
+    assert cache.lookup("a") is None
+    assert cache.lookup("b") is None
+    assert cache.stats["stored"] == 0
+
+
+def test_revalidated_refreshes_entry():
+    """Test that a 304 keeps the body and updates validators and freshness."""
+    cache = HttpCache()
+    cache.save("key", {"ETag": '"v1"'}, {"id": "1"})
+
+    body = cache.revalidated("key", cache.lookup("key"), {"ETag": '"v2"', "Cache-Control": "max-age=30"})
+
+    entry = cache.lookup("key")
+    assert body == {"id": "1"}
+    assert entry["etag"] == '"v2"'
+    assert cache.is_fresh(entry)
+
+
+def test_invalidate_drops_cached_get():
+    """Test that writes invalidate the cached GET of the same path."""
+    cache = HttpCache()
+    cache.save(HttpCache.key("/contacts/1"), {"ETag": '"v1"'}, {"id": "1"})
+
+    cache.invalidate("/contacts/1")
+
+    assert cache.lookup(HttpCache.key("/contacts/1")) is None
+
+
+def test_invalidate_drops_parameterized_and_nested_entries():
+    """Test that a write drops the path's filtered pages, sub-paths and parent listings, not siblings."""
+    cache = HttpCache()
+    keys = {
+        "page": HttpCache.key("/contacts", {"pageIndex": 2}),
+        "list": HttpCache.key("/contacts"),
+        "item": HttpCache.key("/contacts/1"),
+        "sibling": HttpCache.key("/contacts/2"),
+        "other": HttpCache.key("/contactsArchive", {"pageIndex": 1}),
+    }
+    for key in keys.values():
+        cache.save(key, {"ETag": '"v1"'}, {"id": "1"})
+
+    cache.invalidate("/contacts/1")
+    assert [name for name, key in keys.items() if cache.lookup(key)] == ["sibling", "other"]
+
+    cache.invalidate("/contacts")
+    assert [name for name, key in keys.items() if cache.lookup(key)] == ["other"]
+
+
+def test_cached_bodies_are_not_shared_with_callers():
+    """Test that modifying a saved, served or revalidated body leaves the cache intact."""
+    cache = HttpCache()
+    body = {"contacts": [{"id": "1"}]}
+    cache.save("key", {"ETag": '"v1"'}, body)
+    body["contacts"].append({"id": "2"})
+
+    cache.lookup("key")["body"]["contacts"].clear()
+    cache.revalidated("key", cache.lookup("key"), {"ETag": '"v1"'})["contacts"].clear()
+
+    assert cache.lookup("key")["body"] == {"contacts": [{"id": "1"}]}
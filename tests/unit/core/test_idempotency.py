@@ -0,0 +1,27 @@
+from src.core.idempotency import IdempotencyKeys, IDEMPOTENCY_HEADER
+
+
+def test_every_call_gets_a_new_key():
+    """Test that identical independent calls never share a key."""
+    keys = IdempotencyKeys()
+    first, second = {"json": {"content": "Hi"}}, {"json": {"content": "Hi"}}
+
+    assert keys.prepare("POST", first) != keys.prepare("POST", second)
+    assert keys.stats == {"issued": 2}
+
+
+def test_prepare_only_adds_header_to_mutating_requests():
+    """Test header injection and that caller-provided keys are respected."""
+    keys = IdempotencyKeys()
+
+    get_kwargs = {"params": {"page": 1}}
+    assert keys.prepare("GET", get_kwargs) is None
+    assert "headers" not in get_kwargs
+
+    post_kwargs = {"json": {"content": "Hi"}}
+    key = keys.prepare("POST", post_kwargs)
+    assert post_kwargs["headers"][IDEMPOTENCY_HEADER] == key
+
+    own_kwargs = {"json": {}, "headers": {"idempotency-key": "mine"}}
+    assert keys.prepare("POST", own_kwargs) is None
+    assert own_kwargs["headers"] == {"idempotency-key": "mine"}
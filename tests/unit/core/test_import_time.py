@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from src.core import config
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# Cold import budget of the SDK client, in seconds; override on slow machines
+IMPORT_BUDGET = float(os.environ.get("IMPORT_BUDGET_SECONDS", "1.0"))
+
+HEAVY_MODULES = ("fastapi", "pydantic", "pydantic_settings")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+{after}
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def cold_import(module, cwd, after="", **env):
+    """Import `module` in a fresh interpreter without any SDK configuration."""
+    environ = {k: v for k, v in os.environ.items() if k not in ("API_KEY", "WEBHOOK_SECRET")}
+    environ.update(PYTHONPATH=ROOT, **env)
+    code = PROBE.format(module=module, after=after, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=environ, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_client_import_is_lazy_and_within_budget(tmp_path):
+    """Test that importing the client reads no settings, writes no files and skips heavy modules."""
+    probe = cold_import("src.sdk.client", tmp_path)
+
+    assert probe["loaded"] == []
+    assert list(tmp_path.iterdir()) == []
+    assert probe["elapsed"] < IMPORT_BUDGET
+
+
+def test_features_import_without_configuration(tmp_path):
+    """Test that the SDK imports without API_KEY, `.env` or a writable directory."""
+    probe = cold_import("src.sdk.features.messages", tmp_path)
+
+    assert "pydantic_settings" not in probe["loaded"]
+    assert "fastapi" not in probe["loaded"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_explicit_configuration_never_loads_settings(tmp_path):
+    """Test that a client built from passed-in config does not need the environment."""
+    probe = cold_import(
+        "src.sdk.client", tmp_path,
+        after="src.sdk.client.ApiClient(base_url='http://api.test', api_key='key').close()",
+    )
+
+    assert "pydantic_settings" not in probe["loaded"]
+
+
+REQUEST_WITHOUT_SETTINGS = """
+from unittest.mock import patch
+import requests
+from src.core import config
+from src.sdk.features.contacts import Contacts
+
+response = requests.Response()
+response.status_code = 200
+response._content = b'{"id": "contact123", "name": "Alice", "phone": "+1234567890"}'
+with patch.object(config.Settings, "__init__", side_effect=AssertionError("Settings loaded")):
+    with src.sdk.client.ApiClient(base_url="http://api.test", api_key="key") as client:
+        with patch.object(client.session, "request", return_value=response):
+            assert Contacts(client).get_contact("contact123").name == "Alice"
+src.core.logger.stop_logging()
+"""
+
+
+def test_explicit_configuration_requests_without_settings(tmp_path):
+    """Test that requests of an explicitly configured client work without API_KEY, `.env` or a writable CWD."""
+    cold_import("src.sdk.client", tmp_path, after=REQUEST_WITHOUT_SETTINGS, LOG_DIR=str(tmp_path / "logs"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_log_directory_created_on_first_warning(tmp_path):
+    """Test that the error log is only created when something is logged."""
+    cold_import(
+        "src.core.logger", tmp_path,
+        after="src.core.logger.logger.warning('disk almost full'); src.core.logger.stop_logging()",
+        LOG_DIR=str(tmp_path / "logs"),
+    )
+
+    assert "disk almost full" in (tmp_path / "logs" / "app.log").read_text()
+
+
+def test_settings_attribute_is_loaded_on_access():
+    """Test that `config.settings` is the lazily built shared instance."""
+    assert config.settings is config.get_settings()
+    with pytest.raises(AttributeError):
+        config.missing
+
+
+def test_env_example_is_a_valid_env_file():
+    """Test that `cp .env.example .env` gives settings that load."""
+    env_example = os.path.join(os.path.dirname(config._ENV_FILE), ".env.example")
+
+    settings = config.Settings(_env_file=env_example)
+
+    assert settings.VALIDATION_MODE == "strict"
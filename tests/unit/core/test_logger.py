@@ -0,0 +1,117 @@
+import logging
+import threading
+import pytest
+from logging.handlers import QueueHandler
+from src.core import logger as logger_module
+from src.core.logger import SamplingFilter, get_logger, set_sampling, start_logging
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def recording():
+    handler = RecordingHandler()
+    start_logging([handler])
+    yield handler
+    start_logging()
+    set_sampling("test", None)
+
+
+def test_records_are_written_off_the_calling_thread(recording):
+    """Test that handlers run on the queue listener thread."""
+    log = get_logger("test")
+
+    log.warning("Sent %s messages", 3)
+    start_logging([])
+
+    assert [r.getMessage() for r in recording.records] == ["Sent 3 messages"]
+    assert threading.current_thread().name not in recording.threads
+    assert sum(isinstance(h, QueueHandler) for h in log.handlers) == 1
+
+
+def test_disabled_levels_are_not_formatted(recording):
+    """Test that arguments of filtered-out records are never rendered."""
+    class Expensive:
+        def __str__(self):
+            raise AssertionError("formatted a disabled record")
+
+    log = get_logger("test", level="INFO")
+    log.debug("Payload: %s", Expensive())
+    start_logging([])
+
+    assert recording.records == []
+
+
+def test_sampling_keeps_fraction_and_all_warnings(recording):
+    """Test that sampling thins INFO records but never drops warnings."""
+    log = get_logger("test", level="INFO")
+    set_sampling("test", 0.25)
+
+    for i in range(8):
+        log.info("info %s", i)
+    log.error("boom")
+    start_logging([])
+
+    assert [r.getMessage() for r in recording.records] == ["info 3", "info 7", "boom"]
+
+
+def test_sampling_rate_is_validated():
+    """Test that an impossible sampling rate is rejected."""
+    with pytest.raises(ValueError):
+        SamplingFilter(1.5)
+
+
+def test_sdk_logger_defaults_to_info():
+    """Test that debug payload dumps are disabled by default."""
+    assert not logger_module.logger.isEnabledFor(logging.DEBUG)
+    assert logger_module.logger.isEnabledFor(logging.INFO)
+
+
+def test_exception_info_reaches_handlers(recording):
+    """Test that handlers receive the exception itself, not only its text."""
+    log = get_logger("test")
+    try:
+        raise ValueError("bad payload")
+    except ValueError:
+        log.exception("Request failed")
+    start_logging([])
+
+    assert recording.records[0].exc_info[0] is ValueError
+
+
+def test_log_directory_created_only_for_file_records(tmp_path, monkeypatch):
+    """Test that INFO records leave the filesystem untouched and a warning creates the log file."""
+    monkeypatch.setattr(logger_module, "log_dir", str(tmp_path / "logs"))
+    start_logging()
+    log = get_logger("test")
+
+    log.info("Sending request")
+    start_logging([])
+    assert list(tmp_path.iterdir()) == []
+
+    start_logging()
+    log.warning("Retrying request")
+    start_logging([])
+    assert "Retrying request" in (tmp_path / "logs" / "app.log").read_text()
+
+
+def test_unwritable_log_directory_disables_file_logging(tmp_path, monkeypatch, capsys):
+    """Test that a log directory that cannot be created does not break logging."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(logger_module, "log_dir", str(blocker / "logs"))
+    start_logging()
+
+    get_logger("test").error("Request failed")
+    start_logging([])
+
+    assert "File logging disabled" in capsys.readouterr().err
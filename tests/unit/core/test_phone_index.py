@@ -0,0 +1,47 @@
+import pytest
+from src.core.phone_index import PhoneIndex, normalize_e164
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("+1 (234) 567-890", "+1234567890"),
+    ("0044 20.7946.0958", "+442079460958"),
+    ("+441234567890", "+441234567890"),
+])
+def test_normalize_e164(raw, expected):
+    """Test that formatting differences normalize to the same key."""
+    assert normalize_e164(raw) == expected
+
+
+def test_normalize_e164_with_default_country_code():
+    """Test that local numbers get the default country code."""
+    assert normalize_e164("020 7946 0958", default_country_code="44") == "+442079460958"
+
+
+@pytest.mark.parametrize("raw", ["12345", "+0123456", "+1234567890123456", "phone", ""])
+def test_normalize_e164_rejects_invalid_numbers(raw):
+    """Test that numbers that are not E.164 are rejected."""
+    with pytest.raises(ValueError, match="Invalid phone number"):
+        normalize_e164(raw)
+
+
+def test_index_tracks_phone_changes_and_removal():
+    """Test that re-indexing a contact moves it to its new number."""
+    index = PhoneIndex()
+    index.add({"id": "1", "name": "John", "phone": "+1 234 567 890"})
+    assert index.get("+1234567890")["id"] == "1"
+
+    index.add({"id": "1", "name": "John", "phone": "+1999999999"})
+    assert index.get("+1234567890") is None
+    assert index.get("+1 999 999 999")["id"] == "1"
+
+    index.remove("1")
+    assert index.get("+1999999999") is None
+    assert len(index) == 0
+
+
+def test_index_skips_invalid_numbers():
+    """Test that contacts without a valid phone are ignored."""
+    index = PhoneIndex()
+    index.add({"id": "1", "name": "John", "phone": "unknown"})
+
+    assert len(index) == 0
@@ -0,0 +1,95 @@
+import threading
+import pytest
+from unittest.mock import patch, AsyncMock
+from src.core.rate_limit import TokenBucket, RateLimiter, parse_retry_after
+from src.core.requests import endpoint_template
+
+
+def test_endpoint_template():
+    """Test that resource IDs are collapsed into an endpoint template."""
+    assert endpoint_template("get", "/contacts/abc123") == "GET /contacts/{id}"
+    assert endpoint_template("POST", "/messages") == "POST /messages"
+    assert endpoint_template("GET", "/messages?page=2") == "GET /messages"
+
+
+def test_parse_retry_after():
+    """Test parsing delay-seconds, HTTP-dates and invalid values."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """Test that the bucket serves its burst immediately and then spaces requests."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+
+def test_token_bucket_throttle_and_recover():
+    """Test that throttling pauses and slows the bucket, and recovery restores it."""
+    bucket = TokenBucket(rate=10)
+
+    bucket.throttle(retry_after=1.0, factor=0.5)
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+    for _ in range(10):
+        bucket.recover(step=0.1)
+    assert bucket.rate == 10
+
+
+def test_rate_limiter_tracks_throttled_time():
+    """Test that the limiter records how long callers were throttled."""
+    limiter = RateLimiter(rate=100, burst=1)
+
+    with patch("src.core.rate_limit.time.sleep") as mock_sleep:
+        limiter.acquire("GET /contacts")
+        limiter.acquire("GET /contacts")
+
+    mock_sleep.assert_called_once()
+    assert limiter.stats["throttled_requests"] == 1
+    assert limiter.stats["throttled_seconds"] > 0
+
+
+def test_rate_limiter_endpoint_limits_and_429():
+    """Test per-endpoint buckets and that a 429 pauses only the affected endpoint."""
+    limiter = RateLimiter(endpoint_limits={"POST /messages": (5, 5)})
+
+    limiter.on_rate_limited("POST /messages", retry_after=2)
+
+    assert limiter.stats["rate_limited_responses"] == 1
+    assert limiter._reserve("POST /messages") == pytest.approx(2, abs=0.05)
+    assert limiter._reserve("GET /contacts/{id}") == 0
+
+
+def test_rate_limiter_is_thread_safe():
+    """Test that concurrent reservations never hand out more than the burst for free."""
+    limiter = RateLimiter(rate=1, burst=10)
+    delays = []
+
+    def worker():
+        delays.append(limiter._reserve("GET /contacts"))
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(1 for delay in delays if delay == 0) == 10
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async_acquire():
+    """Test that async acquisition waits with asyncio.sleep."""
+    limiter = RateLimiter(rate=100, burst=1)
+
+    with patch("src.core.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire_async("GET /messages")
+        await limiter.acquire_async("GET /messages")
+
+    mock_sleep.assert_awaited_once()
@@ -0,0 +1,128 @@
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from src.core.retry import RetryPolicy, RetryBudget, retry
+from src.core.exceptions import TransientError, RateLimitError, NotFoundError, RetryExhaustedError
+
+
+def test_backoff_grows_exponentially_without_jitter():
+    """Test exponential growth capped at max_delay."""
+    policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=5, jitter=False)
+    error = TransientError(status_code=503)
+
+    assert [policy.compute_delay(n, error) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_full_jitter_stays_within_backoff():
+    """Test that jittered delays are spread between zero and the backoff."""
+    policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=10)
+    delays = [policy.compute_delay(3, TransientError(status_code=503)) for _ in range(200)]
+
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_after_is_a_lower_bound():
+    """Test that a server-provided Retry-After is never undercut."""
+    policy = RetryPolicy(base_delay=0.1)
+
+    assert policy.compute_delay(1, RateLimitError(retry_after=3)) == 3
+
+
+def test_is_retryable_classification():
+    """Test which errors are considered transient."""
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(TransientError(status_code=503))
+    assert policy.is_retryable(httpx.ConnectTimeout("timeout"))
+    assert not policy.is_retryable(TransientError(status_code=500))
+    assert not policy.is_retryable(NotFoundError())
+    assert not RetryPolicy(retry_network_errors=False).is_retryable(httpx.ConnectError("refused"))
+
+
+@patch("src.core.retry.time.sleep")
+def test_call_retries_then_succeeds(mock_sleep):
+    """Test that transient failures are retried until success."""
+    func = MagicMock(side_effect=[TransientError(status_code=503), "ok"])
+
+    assert RetryPolicy(jitter=False, base_delay=0.5).call(func) == "ok"
+    mock_sleep.assert_called_once_with(0.5)
+
+
+@patch("src.core.retry.time.sleep")
+def test_non_retryable_errors_are_raised_immediately(mock_sleep):
+    """Test that non-transient errors are not retried."""
+    func = MagicMock(side_effect=NotFoundError())
+
+    with pytest.raises(NotFoundError):
+        RetryPolicy().call(func)
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("src.core.retry.time.sleep")
+def test_exhaustion_keeps_last_status(mock_sleep):
+    """Test that exhausting attempts raises RetryExhaustedError with the last status."""
+    func = MagicMock(side_effect=TransientError(status_code=502))
+
+    with pytest.raises(RetryExhaustedError, match="Failed after 4 attempts") as excinfo:
+        RetryPolicy(max_attempts=4).call(func)
+    assert excinfo.value.status_code == 502
+    assert isinstance(excinfo.value, RuntimeError)
+
+
+@patch("src.core.retry.time.sleep")
+def test_max_elapsed_deadline(mock_sleep):
+    """Test that retries stop once the next backoff would pass the deadline."""
+    func = MagicMock(side_effect=TransientError(status_code=503))
+
+    with pytest.raises(RetryExhaustedError):
+        RetryPolicy(max_attempts=10, base_delay=2, jitter=False, max_elapsed=3).call(func)
+    # The second backoff (4s) would exceed the 3s deadline, so only one retry is made
+    assert func.call_count == 2
+
+
+@patch("src.core.retry.time.sleep")
+def test_retry_budget_caps_amplification(mock_sleep):
+    """Test that an empty budget stops retries and re-raises the original error."""
+    budget = RetryBudget(ratio=0.0, min_tokens=1)
+    policy = RetryPolicy(max_attempts=3, budget=budget)
+    func = MagicMock(side_effect=TransientError(status_code=503))
+
+    with pytest.raises(TransientError) as excinfo:
+        policy.call(func)
+    assert not isinstance(excinfo.value, RetryExhaustedError)
+    assert func.call_count == 2  # one retry paid for by the single token
+
+    func.reset_mock()
+    with pytest.raises(TransientError):
+        policy.call(func)
+    assert func.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_acall_uses_asyncio_sleep():
+    """Test that coroutine retries sleep without blocking the loop."""
+    func = AsyncMock(side_effect=[TransientError(status_code=503), "ok"])
+
+    with patch("src.core.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+            patch("src.core.retry.time.sleep") as mock_time_sleep:
+        assert await RetryPolicy().acall(func) == "ok"
+
+    mock_sleep.assert_awaited_once()
+    mock_time_sleep.assert_not_called()
+
+
+@patch("src.core.retry.time.sleep")
+def test_retry_decorator_builds_policy(mock_sleep):
+    """Test the decorator form with inline policy options."""
+    calls = []
+
+    @retry(max_attempts=2, base_delay=0)
+    def flaky():
+        calls.append(1)
+        raise TransientError(status_code=503)
+
+    with pytest.raises(RetryExhaustedError):
+        flaky()
+    assert len(calls) == 2
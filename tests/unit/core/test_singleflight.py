@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.core.singleflight import SingleFlight, AsyncSingleFlight, request_key
+
+
+def test_request_key_is_stable():
+    """Test that argument order does not change the key."""
+    first = request_key("get", "/contacts", params={"pageIndex": 1, "max": 10})
+    second = request_key("GET", "/contacts", params={"max": 10, "pageIndex": 1})
+
+    assert first == second
+    assert first != request_key("GET", "/contacts", params={"pageIndex": 2, "max": 10})
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test that callers arriving while a call is in flight get its result."""
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"id": "abc"}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(group.do, "GET /messages/abc", fetch) for _ in range(5)]
+        while group.stats["calls"] + group.stats["collapsed"] < 5:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == [{"id": "abc"}] * 5
+    assert len(calls) == 1
+    assert group.stats == {"calls": 1, "collapsed": 4}
+
+
+def test_error_is_shared_and_next_call_runs_again():
+    """Test that waiters receive the error and nothing is cached afterwards."""
+    group = SingleFlight()
+
+    with pytest.raises(ValueError):
+        group.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert group.do("key", lambda: 42) == 42
+    assert group.stats["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_calls_share_one_execution():
+    """Test coalescing of concurrent coroutines."""
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(group.do("key", fetch) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert len(calls) == 1
+    assert group.stats == {"calls": 1, "collapsed": 9}
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiter leaves the shared call running."""
+    group = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.ensure_future(group.do("key", fetch))
+    second = asyncio.ensure_future(group.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
@@ -0,0 +1,96 @@
+import sqlite3
+from unittest.mock import patch
+from src.core.sqlite_cache import SQLiteCache, SCHEMA_VERSION
+
+
+def test_entries_survive_reopening(tmp_path):
+    """Test that a new store on the same file starts warm."""
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, namespace="contacts")
+    cache.set("123", {"id": "123", "name": "John Doe"})
+    cache.close()
+
+    reopened = SQLiteCache(path, namespace="contacts")
+
+    assert reopened.get("123") == {"id": "123", "name": "John Doe"}
+    assert reopened.stats["hits"] == 1
+    reopened.close()
+
+
+def test_wal_mode_and_schema_version(tmp_path):
+    """Test that the database uses WAL and records its schema version."""
+    path = str(tmp_path / "cache.db")
+    SQLiteCache(path).close()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    conn.close()
+
+
+def test_incompatible_schema_is_rebuilt(tmp_path):
+    """Test that a file from another schema version is discarded."""
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE cache_entries (legacy TEXT)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(path)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    cache.close()
+
+
+def test_namespaces_are_isolated(tmp_path):
+    """Test that stores sharing a file do not see each other's keys."""
+    path = str(tmp_path / "cache.db")
+    contacts = SQLiteCache(path, namespace="contacts")
+    messages = SQLiteCache(path, namespace="messages")
+    contacts.set("1", "contact")
+
+    assert messages.get("1") is None
+    messages.clear()
+    assert contacts.get("1") == "contact"
+
+
+def test_delete_prefix_stays_in_namespace(tmp_path):
+    """Test that a prefix delete only drops matching keys of its own namespace."""
+    path = str(tmp_path / "cache.db")
+    contacts = SQLiteCache(path, namespace="contacts")
+    messages = SQLiteCache(path, namespace="messages")
+    for key in ("GET /contacts", "GET /contacts_%", "GET /messages"):
+        contacts.set(key, 1)
+        messages.set(key, 1)
+
+    contacts.delete_prefix("GET /contacts")
+
+    assert len(contacts) == 1 and contacts.get("GET /messages") == 1
+    assert len(messages) == 3
+
+
+def test_expired_entries_are_dropped():
+    """Test TTL-based expiry."""
+    cache = SQLiteCache(":memory:", ttl=10)
+    with patch("src.core.sqlite_cache.time.time", return_value=1000.0):
+        cache.set("a", 1)
+    with patch("src.core.sqlite_cache.time.time", return_value=1011.0):
+        assert cache.get("a") is None
+
+    assert cache.stats["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_size_cap_evicts_oldest_entries():
+    """Test that pruning enforces max_entries."""
+    cache = SQLiteCache(":memory:", ttl=None, max_entries=3, prune_interval=1)
+    for i in range(5):
+        with patch("src.core.sqlite_cache.time.time", return_value=1000.0 + i):
+            cache.set(str(i), i)
+
+    assert len(cache) == 3
+    assert cache.get("0") is None
+    assert cache.get("4") == 4
+    assert cache.stats["evictions"] == 2
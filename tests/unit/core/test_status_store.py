@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import pytest
+from src.core.status_store import MessageStatusStore
+
+
+def test_transitions_are_monotonic():
+    """Test that late or duplicate events do not move a status backwards."""
+    store = MessageStatusStore()
+
+    assert store.update("msg1", "queued")
+    assert store.update("msg1", "delivered", "2024-12-01T12:00:00Z")
+    assert not store.update("msg1", "queued")
+    assert not store.update("msg1", "failed")
+    assert not store.update("msg1", "delivered")
+
+    assert store.get("msg1") == {"id": "msg1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}
+    assert store.stats == {"applied": 2, "ignored": 3}
+
+
+def test_out_of_order_terminal_event_first():
+    """Test that a terminal event arriving before 'queued' wins."""
+    store = MessageStatusStore()
+    store.update("msg1", "failed")
+    store.update("msg1", "queued")
+
+    assert store.get("msg1")["status"] == "failed"
+
+
+def test_unknown_status_is_rejected():
+    """Test that invalid statuses raise."""
+    with pytest.raises(ValueError, match="Unknown message status"):
+        MessageStatusStore().update("msg1", "sent")
+
+
+def test_subscribers_are_notified_and_isolated():
+    """Test that listeners see applied changes and a failing listener is isolated."""
+    store = MessageStatusStore()
+    seen = []
+    store.subscribe(lambda message_id, record: 1 / 0)
+    unsubscribe = store.subscribe(lambda message_id, record: seen.append((message_id, record["status"])))
+
+    store.update("msg1", "queued")
+    store.update("msg1", "queued")
+    unsubscribe()
+    store.update("msg1", "delivered")
+
+    assert seen == [("msg1", "queued")]
+
+
+def test_wait_for_status_wakes_on_update():
+    """Test that a blocked waiter is woken by a webhook event from another thread."""
+    store = MessageStatusStore()
+    threading.Timer(0.05, store.update, args=("msg1", "delivered")).start()
+
+    record = store.wait_for_status("msg1", timeout=5)
+
+    assert record["status"] == "delivered"
+
+
+def test_wait_for_status_times_out():
+    """Test that waiting returns None when no event arrives."""
+    assert MessageStatusStore().wait_for_status("msg1", timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_status_async():
+    """Test waiting without blocking the event loop."""
+    store = MessageStatusStore()
+    asyncio.get_running_loop().call_later(0.01, store.update, "msg1", "failed")
+
+    record = await store.wait_for_status_async("msg1", timeout=5)
+
+    assert record["status"] == "failed"
+    assert await store.wait_for_status_async("msg2", timeout=0.01) is None
+
+
+def test_update_many_applies_batch_in_order():
+    """Test that a batch is recorded at once and reports each event's outcome."""
+    store = MessageStatusStore()
+    seen = []
+    store.subscribe(lambda message_id, record: seen.append((message_id, record["status"])))
+
+    changed = store.update_many([
+        ("msg1", "queued", None),
+        ("msg1", "delivered", "2024-12-01T12:00:00Z"),
+        ("msg1", "queued", None),
+        ("msg2", "failed", None),
+    ])
+
+    assert changed == [True, True, False, True]
+    assert seen == [("msg1", "queued"), ("msg1", "delivered"), ("msg2", "failed")]
+    assert store.get("msg1")["deliveredAt"] == "2024-12-01T12:00:00Z"
+
+
+def test_update_many_rejects_unknown_status_atomically():
+    """Test that one bad status leaves the whole batch unrecorded."""
+    store = MessageStatusStore()
+
+    with pytest.raises(ValueError, match="Unknown message status"):
+        store.update_many([("msg1", "queued", None), ("msg2", "sent", None)])
+    assert len(store) == 0
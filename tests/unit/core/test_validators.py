@@ -0,0 +1,72 @@
+import pytest
+from src.core.validators import (
+    ValidationMode, get_adapter, get_validation_mode, set_response_format, set_validation_mode, validate_json,
+    validate_response,
+)
+from src.schemas.contacts import Contact
+
+
+@pytest.fixture(autouse=True)
+def reset_mode():
+    yield
+    set_validation_mode(None)
+    set_response_format(None)
+
+
+@validate_response(Contact)
+def fetch(response):
+    return response
+
+
+def test_adapters_are_cached():
+    """Test that each model is compiled once."""
+    assert get_adapter(Contact) is get_adapter(Contact)
+
+
+def test_default_mode_is_strict():
+    """Test the default comes from settings."""
+    assert get_validation_mode() is ValidationMode.STRICT
+    with pytest.raises(ValueError, match="Invalid response"):
+        fetch({"id": "1"})
+
+
+def test_lenient_mode_returns_invalid_response():
+    """Test that lenient mode logs instead of raising."""
+    set_validation_mode("lenient")
+
+    assert fetch({"id": "1"}) == {"id": "1"}
+
+
+def test_off_mode_skips_validation():
+    """Test that validation can be disabled for trusted servers."""
+    set_validation_mode(ValidationMode.OFF)
+
+    assert fetch("not even a dict") == "not even a dict"
+
+
+def test_validate_json_from_bytes():
+    """Test one-pass parsing and validation of raw JSON."""
+    contact = validate_json(Contact, b'{"id": "1", "name": "Alice", "phone": "+1234567890"}')
+
+    assert contact.name == "Alice"
+    with pytest.raises(ValueError, match="Invalid JSON document"):
+        validate_json(Contact, b'{"id": "1"')
+
+
+def test_returns_model_by_default():
+    """Test that the validated model is returned instead of the input dict."""
+    contact = fetch({"id": "1", "name": "Alice", "phone": "+1234567890"})
+
+    assert isinstance(contact, Contact)
+    assert contact.phone == "+1234567890"
+
+
+def test_raw_format_returns_validated_dict():
+    """Test the opt-in dictionary format still validates."""
+    set_response_format("raw")
+
+    assert fetch({"id": "1", "name": "Alice", "phone": "+1234567890"}) == {
+        "id": "1", "name": "Alice", "phone": "+1234567890",
+    }
+    with pytest.raises(ValueError, match="Invalid response"):
+        fetch({"id": "1"})
@@ -0,0 +1,203 @@
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock
+from src.sdk.async_client import AsyncApiClient
+from src.core.hedging import HedgingPolicy
+from src.core.http_cache import HttpCache
+from src.core.singleflight import AsyncSingleFlight
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError
+
+
+def make_client(handler):
+    """Build an AsyncApiClient whose requests are answered by `handler`."""
+    return AsyncApiClient(base_url="http://api.test", api_key="test-key", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_request_success():
+    """Test a successful async API request with auth headers applied."""
+    seen = {}
+
+    def handler(request):
+        seen["auth"] = request.headers["Authorization"]
+        seen["url"] = str(request.url)
+        return httpx.Response(200, json={"success": True})
+
+    async with make_client(handler) as client:
+        response = await client.request("GET", "/contacts", params={"pageIndex": 1})
+
+    assert response == {"success": True}
+    assert seen["auth"] == "Bearer test-key"
+    assert seen["url"] == "http://api.test/contacts?pageIndex=1"
+
+
+@pytest.mark.asyncio
+async def test_request_delete_returns_none():
+    """Test that a 204 response returns None."""
+    async with make_client(lambda request: httpx.Response(204)) as client:
+        assert await client.request("DELETE", "/contacts/123") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, error", [
+    (401, UnauthorizedError),
+    (404, NotFoundError),
+    (500, ServerError),
+    (418, ApiError),
+])
+async def test_request_error_mapping(status, error):
+    """Test that HTTP errors map to the same exceptions as the sync client."""
+    async with make_client(lambda request: httpx.Response(status, text="error")) as client:
+        with pytest.raises(error):
+            await client.request("GET", "/contacts")
+
+
+@pytest.mark.asyncio
+async def test_retry_logic_uses_async_sleep():
+    """Test that transient errors are retried without blocking the event loop."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    with patch("src.core.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+            patch("src.core.retry.time.sleep") as mock_time_sleep:
+        async with make_client(handler) as client:
+            with pytest.raises(RuntimeError, match="Failed after 3 attempts."):
+                await client.request("GET", "/contacts")
+
+    assert len(calls) == 3
+    assert mock_sleep.await_count == 2
+    mock_time_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests():
+    """Test that many requests can be in flight at once on one client."""
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async with make_client(handler) as client:
+        results = await asyncio.gather(*(client.request("GET", f"/messages/{i}") for i in range(50)))
+
+    assert [r["path"] for r in results] == [f"/messages/{i}" for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_hedged_get_cancels_loser():
+    """Test that a slow async GET is hedged and the losing request is cancelled."""
+    calls = []
+    cancelled = asyncio.Event()
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200, json={"from": "primary"})
+        return httpx.Response(200, json={"from": "hedge"})
+
+    hedging = HedgingPolicy(initial_delay=0.02, max_hedge_ratio=1.0)
+    hedging.budget.deposit()
+    client = AsyncApiClient(
+        base_url="http://api.test", api_key="test-key", transport=httpx.MockTransport(handler), hedging=hedging
+    )
+
+    async with client:
+        assert await client.request("GET", "/messages/msg123") == {"from": "hedge"}
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert len(calls) == 2
+    assert hedging.stats["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_are_coalesced():
+    """Test that concurrent identical GETs share one HTTP call."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "abc"})
+
+    client = AsyncApiClient(
+        base_url="http://api.test", api_key="test-key",
+        transport=httpx.MockTransport(handler), singleflight=AsyncSingleFlight(),
+    )
+    async with client:
+        results = await asyncio.gather(*(client.request("GET", "/messages/abc") for _ in range(10)))
+
+    assert results == [{"id": "abc"}] * 10
+    assert len(calls) == 1
+    assert client.singleflight.stats["collapsed"] == 9
+
+
+@pytest.mark.asyncio
+async def test_http_cache_revalidates_with_etag():
+    """Test that the async client sends conditional requests and serves 304s from the cache."""
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"contactsList": []}, headers={"ETag": '"v1"'})
+
+    client = AsyncApiClient(
+        base_url="http://api.test", api_key="test-key",
+        transport=httpx.MockTransport(handler), http_cache=HttpCache(),
+    )
+    async with client:
+        first = await client.request("GET", "/contacts", params={"pageIndex": 1})
+        second = await client.request("GET", "/contacts", params={"pageIndex": 1})
+
+    assert first == second == {"contactsList": []}
+    assert client.http_cache.stats["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_json_body_is_sent_encoded():
+    """Test that request bodies are serialized with the JSON codec."""
+    seen = {}
+
+    def handler(request):
+        seen["body"] = request.content
+        seen["type"] = request.headers["Content-Type"]
+        return httpx.Response(200, json={"id": "msg1"})
+
+    async with make_client(handler) as client:
+        assert await client.request("POST", "/messages", json={"content": "Hi"}) == {"id": "msg1"}
+
+    assert seen == {"body": b'{"content":"Hi"}', "type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_releases_circuit():
+    """Test that cancelling a half-open trial call does not leave the circuit stuck."""
+    key = "GET /contacts"
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.before_call(key)
+    breaker.record_failure(key, ServerError())
+    started = asyncio.Event()
+
+    async def slow_handler(request):
+        started.set()
+        await asyncio.sleep(10)
+
+    async with AsyncApiClient(
+        base_url="http://api.test", api_key="test-key", circuit_breaker=breaker,
+        transport=httpx.MockTransport(slow_handler),
+    ) as client:
+        trial = asyncio.ensure_future(client.request("GET", "/contacts"))
+        await started.wait()
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+    assert breaker.state(key) == CircuitState.HALF_OPEN
+    breaker.before_call(key)  # the trial slot is free again
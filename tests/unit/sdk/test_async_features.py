@@ -0,0 +1,171 @@
+import asyncio
+import pytest
+from src.core.exceptions import ApiError, ContactNotFoundError
+from src.core.cache import TTLCache
+from src.core.phone_index import PhoneIndex
+from src.sdk.features.contacts import AsyncContacts
+
+
+@pytest.mark.asyncio
+async def test_async_create_contact_success(async_contacts, mock_async_client):
+    """Test creating a contact through AsyncContacts."""
+    mock_async_client.request.return_value = {"id": "123", "name": "John Doe", "phone": "+123456789"}
+    payload = {"name": "John Doe", "phone": "+123456789"}
+
+    response = await async_contacts.create_contact(payload=payload)
+
+    mock_async_client.request.assert_awaited_once_with("POST", "/contacts", json=payload)
+    assert response.id == "123"
+
+
+@pytest.mark.asyncio
+async def test_async_create_contact_validation_error(async_contacts, mock_async_client):
+    """Test that invalid payloads are rejected before any request is made."""
+    with pytest.raises(ValueError, match="Invalid payload"):
+        await async_contacts.create_contact(payload={"name": "John Doe"})
+    mock_async_client.request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_list_contacts_success(async_contacts, mock_async_client):
+    """Test listing contacts through AsyncContacts."""
+    mock_async_client.request.return_value = {
+        "contactsList": [{"id": "123", "name": "John Doe", "phone": "+123456789"}],
+        "pageNumber": 1,
+        "pageSize": 10,
+    }
+
+    response = await async_contacts.list_contacts(page=1, max=10)
+
+    mock_async_client.request.assert_awaited_once_with("GET", "/contacts", params={"pageIndex": 1, "max": 10})
+    assert response.contacts[0].id == "123"
+
+
+@pytest.mark.asyncio
+async def test_async_delete_contact_not_found(async_contacts, mock_async_client):
+    """Test that API errors propagate unchanged from async methods."""
+    mock_async_client.request.side_effect = ContactNotFoundError(id="non-existent", message="Contact not found.")
+
+    with pytest.raises(ContactNotFoundError, match="Contact not found."):
+        await async_contacts.delete_contact(contact_id="non-existent")
+
+
+@pytest.mark.asyncio
+async def test_async_send_message_success(async_messages, mock_async_client):
+    """Test sending a message through AsyncMessages."""
+    mock_async_client.request.return_value = {
+        "id": "msg123",
+        "from": "+123456789",
+        "to": {"id": "contact123"},
+        "content": "Hello, World!",
+        "status": "queued",
+        "createdAt": "2024-11-28T10:00:00Z",
+    }
+    payload = {"to": {"id": "contact123"}, "content": "Hello, World!", "from": "+123456789"}
+
+    response = await async_messages.send_message(payload=payload)
+
+    mock_async_client.request.assert_awaited_once_with("POST", "/messages", json=payload)
+    assert response.status == "queued"
+
+
+@pytest.mark.asyncio
+async def test_async_get_message_api_error(async_messages, mock_async_client):
+    """Test that API errors propagate from AsyncMessages.get_message."""
+    mock_async_client.request.side_effect = ApiError("Unhandled API Error")
+
+    with pytest.raises(ApiError, match="Unhandled API Error"):
+        await async_messages.get_message(message_id="msg123")
+
+
+@pytest.mark.asyncio
+async def test_async_unexpected_error_wrapped(async_messages, mock_async_client):
+    """Test that unexpected errors are wrapped in RuntimeError like the sync SDK."""
+    mock_async_client.request.side_effect = KeyError("boom")
+
+    with pytest.raises(RuntimeError, match="An unexpected error occurred"):
+        await async_messages.list_messages()
+
+
+@pytest.mark.asyncio
+async def test_async_send_messages_streams_results_in_order(async_messages, mock_async_client):
+    """Test async bulk sending keeps input order and isolates failures."""
+    async def respond(method, endpoint, json):
+        if json["content"] == "fail":
+            raise ApiError("Unhandled API Error")
+        return {
+            "id": f"msg-{json['content']}",
+            "from": json["from"],
+            "to": json["to"],
+            "content": json["content"],
+            "status": "queued",
+            "createdAt": "2024-11-28T10:00:00Z",
+        }
+
+    mock_async_client.request.side_effect = respond
+
+    async def payloads():
+        for content in ["a", "fail", "b"]:
+            yield {"to": {"id": "contact123"}, "content": content, "from": "+123456789"}
+        yield {"to": {"id": "contact123"}}
+
+    results = [result async for result in async_messages.send_messages(payloads(), concurrency=2)]
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, False]
+    assert results[2].response.id == "msg-b"
+    assert isinstance(results[3].error, ValueError)
+    assert mock_async_client.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_iter_contacts_walks_all_pages(async_contacts, mock_async_client):
+    """Test that AsyncContacts.iter_contacts walks pages until a short page."""
+    async def respond(method, endpoint, params):
+        start = (params["pageIndex"] - 1) * params["max"]
+        ids = range(start, min(start + params["max"], 5))
+        return {
+            "contactsList": [{"id": str(i), "name": "Contact", "phone": "+123456789"} for i in ids],
+            "pageNumber": params["pageIndex"],
+            "pageSize": params["max"],
+        }
+
+    mock_async_client.request.side_effect = respond
+
+    result = [contact.id async for contact in async_contacts.iter_contacts(page_size=2)]
+
+    assert result == ["0", "1", "2", "3", "4"]
+    assert mock_async_client.request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_iter_messages_empty(async_messages, mock_async_client):
+    """Test that AsyncMessages.iter_messages handles an empty first page."""
+    mock_async_client.request.return_value = {"messages": [], "page": 1, "quantityPerPage": 10}
+
+    assert [m async for m in async_messages.iter_messages(page_size=10)] == []
+    mock_async_client.request.assert_awaited_once_with("GET", "/messages", params={"page": 1, "limit": 10})
+
+
+@pytest.mark.asyncio
+async def test_async_get_contact_served_from_cache(mock_async_client):
+    """Test that the async module shares the read-through cache behaviour."""
+    contacts = AsyncContacts(client=mock_async_client, cache=TTLCache())
+    mock_async_client.request.return_value = {"id": "123", "name": "John Doe", "phone": "+123456789"}
+
+    await contacts.get_contact("123")
+    await contacts.get_contact("123")
+
+    mock_async_client.request.assert_awaited_once_with("GET", "/contacts/123")
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_create_contact_creates_once(mock_async_client):
+    """Test that concurrent lookups of an unknown number create a single contact."""
+    async_contacts = AsyncContacts(client=mock_async_client, phone_index=PhoneIndex())
+    mock_async_client.request.return_value = {"id": "456", "name": "Jane", "phone": "+1987654321"}
+
+    results = await asyncio.gather(*(async_contacts.get_or_create_contact("+1987654321", "Jane") for _ in range(5)))
+
+    assert {r.id for r in results} == {"456"}
+    mock_async_client.request.assert_awaited_once()
@@ -1,7 +1,21 @@
+import json
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from src.sdk.client import ApiClient
-from src.core.exceptions import UnauthorizedError, NotFoundError, ServerError, ApiError
+from src.sdk.features.messages import Messages
+import requests
+from src.core.exceptions import (
+    UnauthorizedError, NotFoundError, ServerError, ApiError, RateLimitError, RetryExhaustedError, TransientError,
+    CircuitOpenError,
+)
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.core.hedging import HedgingPolicy
+from src.core.http_cache import HttpCache
+from src.core.rate_limit import RateLimiter
+from src.core.retry import RetryPolicy
+from src.core.singleflight import SingleFlight
 from src.core.config import settings
 
 
@@ -13,14 +27,14 @@ def api_client():
         return ApiClient()
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_success(mock_request, api_client):
     """Test a successful API request."""
     # Mock response
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.ok = True
-    mock_response.json.return_value = {"success": True}
+    mock_response.content = json.dumps({"success": True}).encode()
     mock_request.return_value = mock_response
 
     # Perform request
@@ -30,15 +44,12 @@ def test_request_success(mock_request, api_client):
     mock_request.assert_called_once_with(
         "GET",
         f"{settings.BASE_URL}/contacts",
-        headers={
-            "Authorization": f"Bearer {settings.API_KEY}",
-            "Content-Type": "application/json"
-        }
+        timeout=api_client.timeout,
     )
     assert response == {"success": True}
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_unauthorized(mock_request, api_client):
     """Test 401 UnauthorizedError."""
     mock_response = MagicMock()
@@ -51,7 +62,7 @@ def test_request_unauthorized(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_not_found(mock_request, api_client):
     """Test 404 NotFoundError."""
     mock_response = MagicMock()
@@ -64,7 +75,7 @@ def test_request_not_found(mock_request, api_client):
         api_client.request("GET", "/contacts/non-existent")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_server_error(mock_request, api_client):
     """Test 500 ServerError."""
     mock_response = MagicMock()
@@ -77,7 +88,7 @@ def test_request_server_error(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
+@patch("src.sdk.client.requests.Session.request")
 def test_request_generic_error(mock_request, api_client):
     """Test a generic ApiError for unexpected status codes."""
     mock_response = MagicMock()
@@ -90,16 +101,319 @@ def test_request_generic_error(mock_request, api_client):
         api_client.request("GET", "/contacts")
 
 
-@patch("src.sdk.client.requests.request")
-def test_retry_logic(mock_request, api_client):
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_logic(mock_request, mock_sleep, api_client):
     """Test retry logic for transient errors."""
     mock_response = MagicMock()
     mock_response.status_code = 503
     mock_response.ok = False
     mock_request.side_effect = [mock_response, mock_response, mock_response]
 
-    with pytest.raises(RuntimeError, match="Failed after 3 retries."):
+    with pytest.raises(RuntimeError, match="Failed after 3 attempts."):
         api_client.request("GET", "/contacts")
 
     # Ensure retries happened 3 times
     assert mock_request.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_gateway_timeout_is_retried(mock_request, mock_sleep):
+    """Test that a 504 is transient and retried like 502 and 503."""
+    mock_request.side_effect = [_response(504), _response(200, {"id": "1"})]
+    client = ApiClient()
+
+    assert client.request("GET", "/contacts/1") == {"id": "1"}
+    assert mock_request.call_count == 2
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_policy_per_call_override(mock_request, mock_sleep, api_client):
+    """Test that a per-call retry policy overrides the client default."""
+    mock_request.return_value = MagicMock(status_code=503, ok=False, text="")
+
+    with pytest.raises(RetryExhaustedError) as excinfo:
+        api_client.request("GET", "/contacts", retry_policy=RetryPolicy(max_attempts=5, base_delay=0))
+
+    assert mock_request.call_count == 5
+    assert excinfo.value.status_code == 503
+    assert isinstance(excinfo.value.last_error, TransientError)
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_retry_on_connection_error(mock_request, mock_sleep, api_client):
+    """Test that network errors are classified as retryable."""
+    success = MagicMock(status_code=200, ok=True)
+    success.content = json.dumps({"success": True}).encode()
+    mock_request.side_effect = [requests.exceptions.ConnectionError("reset"), success]
+
+    assert api_client.request("GET", "/contacts") == {"success": True}
+    assert mock_request.call_count == 2
+
+
+def test_session_carries_auth_headers(api_client):
+    """Test that authentication headers are set once on the pooled session."""
+    assert api_client.session.headers["Authorization"] == f"Bearer {settings.API_KEY}"
+    assert api_client.session.headers["Content-Type"] == "application/json"
+
+
+def test_session_pool_configuration():
+    """Test that pool settings are applied to the mounted adapters."""
+    client = ApiClient(pool_connections=4, pool_maxsize=32, pool_block=True)
+    adapter = client.session.get_adapter("https://example.com")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert client.session.get_adapter("http://example.com") is adapter
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_session_reused_across_requests(mock_request, api_client):
+    """Test that consecutive requests go through the same session."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.ok = True
+    mock_response.content = json.dumps({"success": True}).encode()
+    mock_request.return_value = mock_response
+
+    session = api_client.session
+    api_client.request("GET", "/contacts")
+    api_client.request("GET", "/messages")
+
+    assert api_client.session is session
+    assert mock_request.call_count == 2
+
+
+def test_context_manager_closes_session():
+    """Test that leaving the context manager closes the session."""
+    client = ApiClient()
+    with patch.object(client.session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+    mock_close.assert_called_once()
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_rate_limited_response_is_retried(mock_request, mock_sleep):
+    """Test that a 429 feeds the rate limiter and the request is retried."""
+    limiter = RateLimiter()
+    client = ApiClient(rate_limiter=limiter)
+
+    throttled = MagicMock(status_code=429, ok=False, text="Too Many Requests", headers={"Retry-After": "0"})
+    success = MagicMock(status_code=200, ok=True)
+    success.content = json.dumps({"success": True}).encode()
+    mock_request.side_effect = [throttled, success]
+
+    assert client.request("POST", "/messages", json={}) == {"success": True}
+    assert limiter.stats["rate_limited_responses"] == 1
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_rate_limit_error_carries_retry_after(mock_request, api_client):
+    """Test that RateLimitError exposes the parsed Retry-After delay."""
+    mock_request.return_value = MagicMock(status_code=429, ok=False, text="", headers={"Retry-After": "7"})
+
+    with patch("src.core.retry.time.sleep"), pytest.raises(RuntimeError, match="Failed after 3 attempts."):
+        api_client.request("GET", "/contacts")
+
+    with pytest.raises(RateLimitError) as excinfo:
+        api_client._handle_api_errors(mock_request.return_value)
+    assert excinfo.value.retry_after == 7
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_circuit_breaker_fails_fast(mock_request, mock_sleep):
+    """Test that an open circuit stops requests from reaching the server."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    client = ApiClient(circuit_breaker=breaker)
+    mock_request.return_value = MagicMock(status_code=503, ok=False, text="")
+
+    with pytest.raises(RetryExhaustedError):
+        client.request("GET", "/contacts/abc")
+    assert breaker.state("GET /contacts/{id}") == CircuitState.OPEN
+
+    mock_request.reset_mock()
+    with pytest.raises(CircuitOpenError):
+        client.request("GET", "/contacts/xyz")
+    mock_request.assert_not_called()
+
+
+def _hedging_policy():
+    """A hedging policy that hedges after 20ms and always has budget."""
+    policy = HedgingPolicy(initial_delay=0.02, max_hedge_ratio=1.0)
+    policy.budget.deposit()
+    return policy
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_hedged_get_returns_fastest_response(mock_request):
+    """Test that a slow GET is hedged and the faster duplicate wins."""
+    slow = MagicMock(status_code=200, ok=True)
+    slow.content = json.dumps({"from": "primary"}).encode()
+    fast = MagicMock(status_code=200, ok=True)
+    fast.content = json.dumps({"from": "hedge"}).encode()
+    calls = []
+
+    def respond(method, url, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            time.sleep(0.3)
+            return slow
+        return fast
+
+    mock_request.side_effect = respond
+    client = ApiClient(hedging=_hedging_policy())
+
+    assert client.request("GET", "/contacts/abc") == {"from": "hedge"}
+    assert len(calls) == 2
+    assert client.hedging.stats["hedge_wins"] == 1
+    client.close()
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_post_is_never_hedged(mock_request):
+    """Test that mutating requests bypass hedging."""
+    response = MagicMock(status_code=200, ok=True)
+    response.content = json.dumps({"success": True}).encode()
+    mock_request.return_value = response
+    client = ApiClient(hedging=_hedging_policy())
+
+    client.request("POST", "/messages", json={})
+
+    assert mock_request.call_count == 1
+    assert client.hedging.stats["requests"] == 0
+    client.close()
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_concurrent_identical_gets_are_coalesced(mock_request):
+    """Test that concurrent identical GETs share one HTTP call."""
+    response = MagicMock(status_code=200, ok=True)
+    response.content = json.dumps({"id": "abc"}).encode()
+
+    def respond(method, url, **kwargs):
+        time.sleep(0.1)
+        return response
+
+    mock_request.side_effect = respond
+    client = ApiClient(singleflight=SingleFlight())
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: client.request("GET", "/messages/abc"), range(5)))
+
+    assert results == [{"id": "abc"}] * 5
+    assert mock_request.call_count == 1
+    assert client.singleflight.stats["collapsed"] == 4
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_post_is_never_coalesced(mock_request):
+    """Test that mutating requests always reach the server."""
+    response = MagicMock(status_code=200, ok=True)
+    response.content = json.dumps({"success": True}).encode()
+    mock_request.return_value = response
+    client = ApiClient(singleflight=SingleFlight())
+
+    client.request("POST", "/messages", json={})
+    client.request("POST", "/messages", json={})
+
+    assert mock_request.call_count == 2
+    assert client.singleflight.stats["calls"] == 0
+
+
+def _response(status, body=None, headers=None):
+    response = MagicMock(status_code=status, ok=status < 400, headers=headers or {})
+    response.content = json.dumps(body).encode()
+    return response
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_http_cache_revalidates_with_etag(mock_request):
+    """Test that a stale entry is revalidated and a 304 is served from the cache."""
+    mock_request.side_effect = [
+        _response(200, {"id": "abc", "status": "queued"}, {"ETag": '"v1"'}),
+        _response(304, headers={"ETag": '"v1"'}),
+    ]
+    client = ApiClient(http_cache=HttpCache())
+
+    first = client.request("GET", "/messages/abc")
+    second = client.request("GET", "/messages/abc")
+
+    assert first == second == {"id": "abc", "status": "queued"}
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert client.http_cache.stats["revalidated"] == 1
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_http_cache_serves_fresh_entries_and_invalidates_on_write(mock_request):
+    """Test max-age freshness and invalidation by a PATCH to the same path."""
+    mock_request.side_effect = [
+        _response(200, {"id": "1", "name": "Old"}, {"Cache-Control": "max-age=60"}),
+        _response(200, {"id": "1", "name": "New"}),
+        _response(200, {"id": "1", "name": "New"}, {"Cache-Control": "max-age=60"}),
+    ]
+    client = ApiClient(http_cache=HttpCache())
+
+    client.request("GET", "/contacts/1")
+    assert client.request("GET", "/contacts/1") == {"id": "1", "name": "Old"}
+    assert mock_request.call_count == 1
+
+    client.request("PATCH", "/contacts/1", json={"name": "New"})
+    assert client.request("GET", "/contacts/1") == {"id": "1", "name": "New"}
+    assert mock_request.call_count == 3
+
+
+@patch("src.core.retry.time.sleep")
+@patch("src.sdk.client.requests.Session.request")
+def test_post_retries_reuse_idempotency_key(mock_request, mock_sleep):
+    """Test that every retry of a POST carries the same Idempotency-Key."""
+    mock_request.side_effect = [
+        _response(503),
+        _response(502),
+        _response(200, {"id": "msg1"}),
+    ]
+    client = ApiClient()
+
+    assert client.request("POST", "/messages", json={"content": "Hi"}) == {"id": "msg1"}
+
+    keys = {c.kwargs["headers"]["Idempotency-Key"] for c in mock_request.call_args_list}
+    assert len(keys) == 1
+    assert client.idempotency.stats["issued"] == 1
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_identical_sends_get_distinct_idempotency_keys(mock_request):
+    """Test that two deliberate identical sends, even concurrent ones, are not collapsed into one."""
+    mock_request.side_effect = lambda *args, **kwargs: _response(200, {
+        "id": "msg1", "from": "+0987654321", "to": {"id": "contact123"}, "content": "Hi",
+        "status": "queued", "createdAt": "2024-12-01T12:00:00Z",
+    })
+    client = ApiClient()
+
+    messages = Messages(client)
+    payload = {"to": {"id": "contact123"}, "content": "Hi", "from": "+0987654321"}
+    results = messages.send_messages([payload, dict(payload)], concurrency=2)
+
+    assert all(result.ok for result in results)
+    keys = {c.kwargs["headers"]["Idempotency-Key"] for c in mock_request.call_args_list}
+    assert len(keys) == 2
+
+
+@patch("src.sdk.client.requests.Session.request")
+def test_json_body_is_sent_encoded(mock_request):
+    """Test that request bodies are serialized once with the JSON codec."""
+    mock_request.return_value = _response(200, {"id": "msg1"})
+    client = ApiClient()
+
+    client.request("POST", "/messages", json={"content": "Grüße"})
+
+    sent = mock_request.call_args.kwargs
+    assert "json" not in sent
+    assert sent["data"] == '{"content":"Grüße"}'.encode("utf-8")
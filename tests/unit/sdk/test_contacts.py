@@ -1,5 +1,10 @@
+import threading
+import tracemalloc
 import pytest
+from src.core.cache import TTLCache
 from src.core.exceptions import ApiError, ContactNotFoundError
+from src.core.phone_index import PhoneIndex
+from src.sdk.features.contacts import Contacts
 
 
 def test_create_contact_success(contacts, mock_api_client):
@@ -15,9 +20,9 @@ def test_create_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("POST", "/contacts", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
-    assert response["phone"] == "+123456789"
+    assert response.id == "123"
+    assert response.name == "John Doe"
+    assert response.phone == "+123456789"
 
 
 def test_create_contact_validation_error(contacts):
@@ -57,10 +62,10 @@ def test_list_contacts_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/contacts", params={"pageIndex": 1, "max": 10})
-    assert response["pageNumber"] == 1
-    assert len(response["contactsList"]) == 1
-    assert response["contactsList"][0]["id"] == "123"
-    assert response["contactsList"][0]["name"] == "John Doe"
+    assert response.page_number == 1
+    assert len(response.contacts) == 1
+    assert response.contacts[0].id == "123"
+    assert response.contacts[0].name == "John Doe"
 
 
 def test_get_contact_success(contacts, mock_api_client):
@@ -73,9 +78,9 @@ def test_get_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/contacts/123")
-    assert response["id"] == "123"
-    assert response["name"] == "John Doe"
-    assert response["phone"] == "+123456789"
+    assert response.id == "123"
+    assert response.name == "John Doe"
+    assert response.phone == "+123456789"
 
 
 def test_update_contact_success(contacts, mock_api_client):
@@ -91,9 +96,9 @@ def test_update_contact_success(contacts, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("PATCH", "/contacts/123", json=payload)
-    assert response["id"] == "123"
-    assert response["name"] == "Jane Doe"
-    assert response["phone"] == "+987654321"
+    assert response.id == "123"
+    assert response.name == "Jane Doe"
+    assert response.phone == "+987654321"
 
 
 def test_delete_contact_success(contacts, mock_api_client):
@@ -129,3 +134,171 @@ def test_delete_contact_not_found(contacts, mock_api_client):
     # Assertions
     with pytest.raises(ContactNotFoundError, match="Contact not found."):
         contacts.delete_contact(contact_id="non-existent")
+
+
+def _contacts_page(page, size, total):
+    """Build a contacts page response holding `total` contacts split into pages of `size`."""
+    start = (page - 1) * size
+    ids = range(start, min(start + size, total))
+    return {
+        "contactsList": [{"id": str(i), "name": f"Contact {i}", "phone": "+123456789"} for i in ids],
+        "pageNumber": page,
+        "pageSize": size,
+    }
+
+
+def test_iter_contacts_walks_all_pages(contacts, mock_api_client):
+    """Test that iter_contacts yields every contact and stops on the short page."""
+    mock_api_client.request.side_effect = lambda method, endpoint, params: _contacts_page(
+        params["pageIndex"], params["max"], total=7
+    )
+
+    result = [contact.id for contact in contacts.iter_contacts(page_size=3)]
+
+    assert result == [str(i) for i in range(7)]
+    pages = [c.kwargs["params"]["pageIndex"] for c in mock_api_client.request.call_args_list]
+    assert pages == [1, 2, 3]
+
+
+def test_iter_contacts_prefetches_next_page(contacts, mock_api_client):
+    """Test that the next page is requested before the current page is fully consumed."""
+    second_page_requested = threading.Event()
+
+    def respond(method, endpoint, params):
+        if params["pageIndex"] == 2:
+            second_page_requested.set()
+        return _contacts_page(params["pageIndex"], params["max"], total=4)
+
+    mock_api_client.request.side_effect = respond
+
+    iterator = contacts.iter_contacts(page_size=2)
+    assert next(iterator).id == "0"
+
+    # Page 2 is fetched in the background while page 1 is still being consumed
+    assert second_page_requested.wait(timeout=5)
+    iterator.close()
+
+
+def test_iter_contacts_stops_on_empty_page(contacts, mock_api_client):
+    """Test that an exact multiple of the page size ends on an empty page."""
+    mock_api_client.request.side_effect = lambda method, endpoint, params: _contacts_page(
+        params["pageIndex"], params["max"], total=4
+    )
+
+    assert len(list(contacts.iter_contacts(page_size=2))) == 4
+    assert mock_api_client.request.call_count == 3
+
+
+def test_get_contact_served_from_cache(mock_api_client):
+    """Test that a cached contact is returned without an HTTP request."""
+    contacts = Contacts(client=mock_api_client, cache=TTLCache())
+    mock_api_client.request.return_value = {"id": "123", "name": "John Doe", "phone": "+123456789"}
+
+    first = contacts.get_contact("123")
+    second = contacts.get_contact("123")
+
+    assert first == second
+    mock_api_client.request.assert_called_once_with("GET", "/contacts/123")
+    assert contacts.cache.stats["hits"] == 1
+
+
+def test_list_contacts_populates_cache(mock_api_client):
+    """Test that listed contacts are cached for later lookups."""
+    contacts = Contacts(client=mock_api_client, cache=TTLCache())
+    mock_api_client.request.return_value = _contacts_page(1, 3, total=3)
+
+    contacts.list_contacts(page=1, max=3)
+    contact = contacts.get_contact("2")
+
+    assert contact.name == "Contact 2"
+    assert mock_api_client.request.call_count == 1
+
+
+def test_update_and_delete_invalidate_cache(mock_api_client):
+    """Test that writes refresh or invalidate cached contacts."""
+    cache = TTLCache()
+    contacts = Contacts(client=mock_api_client, cache=cache)
+    cache.set("123", {"id": "123", "name": "Old Name", "phone": "+123456789"})
+
+    mock_api_client.request.return_value = {"id": "123", "name": "New Name", "phone": "+123456789"}
+    contacts.update_contact("123", {"name": "New Name", "phone": "+123456789"})
+    assert cache.get("123")["name"] == "New Name"
+
+    mock_api_client.request.return_value = None
+    contacts.delete_contact("123")
+    assert cache.get("123") is None
+
+
+@pytest.fixture
+def indexed_contacts(mock_api_client):
+    """Contacts with a phone index, as `get_or_create_contact` requires."""
+    return Contacts(client=mock_api_client, phone_index=PhoneIndex())
+
+
+def test_iter_contacts_keeps_no_contacts_by_default(contacts, mock_api_client):
+    """Test that exporting contacts holds at most a page or two in memory, not all of them."""
+    def respond(method, endpoint, params):
+        start = (params["pageIndex"] - 1) * params["max"]
+        ids = range(start, min(start + params["max"], 20_000))
+        contacts_list = [{"id": str(i), "name": f"Contact {i}", "phone": f"+1555{i:07d}"} for i in ids]
+        return {"contactsList": contacts_list, "pageNumber": params["pageIndex"], "pageSize": params["max"]}
+
+    mock_api_client.request.side_effect = respond
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        count = sum(1 for _ in contacts.iter_contacts(page_size=500))
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20_000
+    assert contacts.phone_index is None
+    # Indexing all 20,000 contacts would retain about 8 MB
+    assert retained < 3_000_000
+
+
+def test_get_or_create_contact_requires_phone_index(contacts):
+    """Test that the lookup refuses to run without an index rather than create duplicates."""
+    with pytest.raises(ValueError, match="requires a phone_index"):
+        contacts.get_or_create_contact("+1234567890", "John Doe")
+
+
+def test_get_or_create_contact_uses_index(indexed_contacts, mock_api_client):
+    """Test that a listed phone number is found without creating a duplicate."""
+    mock_api_client.request.return_value = {
+        "contactsList": [{"id": "123", "name": "John Doe", "phone": "+1234567890"}],
+        "pageNumber": 1,
+        "pageSize": 10,
+    }
+    indexed_contacts.list_contacts()
+
+    contact = indexed_contacts.get_or_create_contact("+1 (234) 567-890", "John Doe")
+
+    assert contact.id == "123"
+    assert mock_api_client.request.call_count == 1
+
+
+def test_get_or_create_contact_creates_once(indexed_contacts, mock_api_client):
+    """Test that an unknown number is created once and indexed."""
+    mock_api_client.request.return_value = {"id": "456", "name": "Jane", "phone": "+1987654321"}
+
+    first = indexed_contacts.get_or_create_contact("+1 987 654 321", "Jane")
+    second = indexed_contacts.get_or_create_contact("+1987654321", "Jane")
+
+    assert first == second
+    mock_api_client.request.assert_called_once_with(
+        "POST", "/contacts", json={"name": "Jane", "phone": "+1987654321"}
+    )
+
+
+def test_deleted_contact_leaves_phone_index(indexed_contacts, mock_api_client):
+    """Test that deleting a contact removes it from the phone index."""
+    mock_api_client.request.return_value = {"id": "456", "name": "Jane", "phone": "+1987654321"}
+    indexed_contacts.create_contact({"name": "Jane", "phone": "+1987654321"})
+
+    mock_api_client.request.return_value = None
+    indexed_contacts.delete_contact("456")
+
+    assert indexed_contacts.phone_index.get("+1987654321") is None
@@ -1,5 +1,7 @@
 import pytest
 from src.core.exceptions import ApiError
+from src.core.cache import TTLCache
+from src.sdk.features.messages import Messages
 
 
 def test_send_message_success(messages, mock_api_client):
@@ -26,10 +28,10 @@ def test_send_message_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("POST", "/messages", json=payload)
-    assert response["id"] == "msg123"
-    assert response["status"] == "queued"
-    assert response["content"] == "Hello, World!"
-    assert response["to"] == {"id": "contact123", "name": "John Doe", "phone": "+987654321"}
+    assert response.id == "msg123"
+    assert response.status == "queued"
+    assert response.content == "Hello, World!"
+    assert response.to.model_dump() == {"id": "contact123", "name": "John Doe", "phone": "+987654321"}
 
 
 def test_send_message_validation_error(messages):
@@ -83,8 +85,8 @@ def test_list_messages_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/messages", params={"page": 1, "limit": 10})
-    assert len(response["messages"]) == 1
-    assert response["messages"][0]["id"] == "msg123"
+    assert len(response.messages) == 1
+    assert response.messages[0].id == "msg123"
 
 
 def test_get_message_success(messages, mock_api_client):
@@ -105,5 +107,128 @@ def test_get_message_success(messages, mock_api_client):
 
     # Assertions
     mock_api_client.request.assert_called_once_with("GET", "/messages/msg123")
-    assert response["id"] == "msg123"
-    assert response["content"] == "Hello, World!"
+    assert response.id == "msg123"
+    assert response.content == "Hello, World!"
+
+
+def _bulk_response(method, endpoint, json):
+    """Echo a message response for bulk tests, failing payloads whose content is 'fail'."""
+    if json["content"] == "fail":
+        raise ApiError("Unhandled API Error")
+    return {
+        "id": f"msg-{json['content']}",
+        "from": json["from"],
+        "to": json["to"],
+        "content": json["content"],
+        "status": "queued",
+        "createdAt": "2024-11-28T10:00:00Z",
+    }
+
+
+def test_send_messages_streams_results_in_order(messages, mock_api_client):
+    """Test bulk sending yields one result per payload in input order without aborting on failures."""
+    mock_api_client.request.side_effect = _bulk_response
+    contents = ["a", "fail", "b", "c"]
+    payloads = ({"to": {"id": "contact123"}, "content": c, "from": "+123456789"} for c in contents)
+
+    results = list(messages.send_messages(payloads, concurrency=2))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert results[0].response.id == "msg-a"
+    assert isinstance(results[1].error, ApiError)
+    assert mock_api_client.request.call_count == 4
+
+
+def test_send_messages_validates_up_front(messages, mock_api_client):
+    """Test that invalid payloads are reported without being sent."""
+    mock_api_client.request.side_effect = _bulk_response
+    payloads = [
+        {"to": {"id": "contact123"}, "content": "a", "from": "+123456789"},
+        {"to": {"id": "contact123"}},
+    ]
+
+    results = list(messages.send_messages(payloads))
+
+    assert results[0].ok
+    assert isinstance(results[1].error, ValueError)
+    assert mock_api_client.request.call_count == 1
+
+
+def test_send_messages_consumes_input_lazily(messages, mock_api_client):
+    """Test that the input iterable is only consumed as results are drained."""
+    mock_api_client.request.side_effect = _bulk_response
+    consumed = []
+
+    def payloads():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"to": {"id": "contact123"}, "content": str(i), "from": "+123456789"}
+
+    stream = messages.send_messages(payloads(), concurrency=4)
+    first = next(stream)
+    stream.close()
+
+    assert first.index == 0
+    assert len(consumed) <= 2 * 4
+
+
+def test_iter_messages_walks_all_pages(messages, mock_api_client):
+    """Test that iter_messages yields every message across pages."""
+    def respond(method, endpoint, params):
+        start = (params["page"] - 1) * params["limit"]
+        ids = range(start, min(start + params["limit"], 5))
+        return {
+            "messages": [
+                {
+                    "id": f"msg{i}",
+                    "from": "+123456789",
+                    "to": "contact123",
+                    "content": "Hello, World!",
+                    "status": "delivered",
+                    "createdAt": "2024-11-28T10:00:00Z",
+                }
+                for i in ids
+            ],
+            "page": params["page"],
+            "quantityPerPage": params["limit"],
+        }
+
+    mock_api_client.request.side_effect = respond
+
+    result = [message.id for message in messages.iter_messages(page_size=2)]
+
+    assert result == [f"msg{i}" for i in range(5)]
+    assert mock_api_client.request.call_count == 3
+
+
+def test_get_message_caches_terminal_messages_only(mock_api_client):
+    """Test that delivered messages are cached and queued ones are always re-fetched."""
+    messages = Messages(client=mock_api_client, cache=TTLCache())
+    queued = {
+        "id": "msg1", "from": "+123456789", "to": {"id": "contact-id"}, "content": "Hello",
+        "status": "queued", "createdAt": "2024-12-01T12:00:00Z",
+    }
+    delivered = {**queued, "id": "msg2", "status": "delivered"}
+
+    mock_api_client.request.return_value = queued
+    messages.get_message("msg1")
+    messages.get_message("msg1")
+    assert mock_api_client.request.call_count == 2
+
+    mock_api_client.request.return_value = delivered
+    messages.get_message("msg2")
+    assert messages.get_message("msg2").status == "delivered"
+    assert mock_api_client.request.call_count == 3
+
+
+def test_get_message_records_status(messages, mock_api_client):
+    """Test that fetched messages feed the status store."""
+    mock_api_client.request.return_value = {
+        "id": "msg1", "from": "+123456789", "to": {"id": "contact-id"}, "content": "Hello",
+        "status": "failed", "createdAt": "2024-12-01T12:00:00Z",
+    }
+
+    messages.get_message("msg1")
+
+    assert messages.wait_for_status("msg1", timeout=0)["status"] == "failed"
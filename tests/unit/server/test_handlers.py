@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.schemas.webhook import WebhookPayload
+from src.server.handlers import WILDCARD, HandlerRegistry
+
+
+def event(status="delivered"):
+    return WebhookPayload(id="msg1", status=status)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_selects_handlers_by_status():
+    """Test that a status' handlers and wildcard handlers receive the event."""
+    registry = HandlerRegistry()
+    received = []
+    registry.register("delivered", lambda e: received.append(("delivered", e.status)), name="delivered")
+    registry.register("failed", lambda e: received.append(("failed", e.status)), name="failed")
+    registry.register(WILDCARD, lambda e: received.append(("*", e.status)), name="any")
+
+    outcomes = await registry.dispatch(event("delivered"))
+
+    assert outcomes == {"delivered": "ok", "any": "ok"}
+    assert sorted(received) == [("*", "delivered"), ("delivered", "delivered")]
+
+
+def test_register_rejects_unknown_status():
+    """Test that only known statuses and the wildcard can be registered."""
+    with pytest.raises(ValueError):
+        HandlerRegistry().register("sent", print)
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_concurrently():
+    """Test that independent async handlers overlap instead of running one by one."""
+    registry = HandlerRegistry()
+
+    @registry.on("delivered")
+    async def first(e):
+        await asyncio.sleep(0.05)
+
+    @registry.on("delivered")
+    async def second(e):
+        await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await registry.dispatch(event())
+
+    assert time.perf_counter() - started < 0.09
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_off_the_event_loop():
+    """Test that plain functions run on a worker thread."""
+    registry = HandlerRegistry()
+    threads = []
+    registry.register("delivered", lambda e: threads.append(threading.current_thread()), name="sync")
+
+    await registry.dispatch(event())
+
+    assert threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_errors_and_timeouts_are_isolated():
+    """Test that a failing or slow handler does not affect the others."""
+    registry = HandlerRegistry(timeout=0.01)
+    received = []
+
+    @registry.on(WILDCARD)
+    def broken(e):
+        raise RuntimeError("boom")
+
+    @registry.on(WILDCARD)
+    async def slow(e):
+        await asyncio.sleep(1)
+
+    @registry.on(WILDCARD, timeout=1)
+    async def working(e):
+        received.append(e.id)
+
+    outcomes = await registry.dispatch(event())
+
+    assert list(outcomes.values()) == ["error", "timeout", "ok"]
+    assert received == ["msg1"]
+    assert registry.stats[broken.__qualname__]["errors"] == 1
+    assert registry.stats[slow.__qualname__]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_stats():
+    """Test that calls and their durations are recorded per handler."""
+    registry = HandlerRegistry()
+
+    @registry.on("queued")
+    async def handler(e):
+        await asyncio.sleep(0.01)
+
+    await registry.dispatch_many([event("queued"), event("queued"), event("failed")])
+
+    stats = registry.stats[handler.__qualname__]
+    assert stats["calls"] == 2
+    assert stats["max_seconds"] >= 0.01
+    assert stats["avg_seconds"] == pytest.approx(stats["total_seconds"] / 2)
+
+
+@pytest.mark.asyncio
+async def test_unregister():
+    """Test that a removed handler is no longer called."""
+    registry = HandlerRegistry()
+    registry.register("failed", print, name="print")
+
+    registry.unregister("failed", print)
+
+    assert await registry.dispatch(event("failed")) == {}
@@ -1,7 +1,16 @@
+import asyncio
+import hashlib
+import hmac
 import json
+import pytest
+
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
-from src.server.app import app
+import src.server.app as server
+from src.server.app import app, status_store, messages_sdk, deduplicator, handlers
+from src.server.workers import EventWorkerPool
+from src.core.sqlite_cache import SQLiteCache
 from src.core.config import settings
 from src.core.security import generate_signature
 
@@ -64,4 +73,265 @@ def test_webhook_invalid_payload():
     assert response.status_code == 422
 
     assert "status" in response.json()["detail"][0]["loc"]
-    assert response.json()["detail"][0]["msg"] == "Input should be 'queued', 'delivered' or 'failed'"
\ No newline at end of file
+    assert response.json()["detail"][0]["msg"] == "Input should be 'queued', 'delivered' or 'failed'"
+
+
+def test_webhook_malformed_json():
+    body = b'{"id": "msg123", "status": '
+    signature = hmac.new(settings.WEBHOOK_SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+    response = client.post(
+        "/webhooks",
+        content=body,
+        headers={"Authorization": f"Bearer {signature}", "Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_webhook_verifies_signature_before_parsing():
+    with patch("src.server.app.parse_webhook_payload") as parse:
+        response = client.post(
+            "/webhooks",
+            content=b'{"id": "msg123", "status": ',
+            headers={"Authorization": "Bearer forged"}
+        )
+
+    assert response.status_code == 401
+    parse.assert_not_called()
+
+
+def test_webhook_rejects_oversized_body():
+    body = b"x" * (settings.WEBHOOK_MAX_BODY_BYTES + 1)
+
+    response = client.post("/webhooks", content=body, headers={"Authorization": "Bearer forged"})
+
+    assert response.status_code == 413
+
+
+def test_webhook_rejects_oversized_chunked_body():
+    chunks = (b"x" * 65536 for _ in range(settings.WEBHOOK_MAX_BODY_BYTES // 65536 + 1))
+
+    response = client.post("/webhooks", content=chunks, headers={"Authorization": "Bearer forged"})
+
+    assert response.status_code == 413
+
+
+def test_webhook_updates_status_store():
+    payload = {
+        "id": "msg-status-1",
+        "status": "delivered",
+        "deliveredAt": "2024-12-01T12:00:00Z",
+    }
+    serialized_payload = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    signature = generate_signature(payload, settings.WEBHOOK_SECRET)
+
+    response = client.post(
+        "/webhooks",
+        content=serialized_payload,
+        headers={"Authorization": f"Bearer {signature}"}
+    )
+
+    assert response.status_code == 200
+    assert status_store.get("msg-status-1")["status"] == "delivered"
+    assert messages_sdk.wait_for_status("msg-status-1", timeout=0) == status_store.get("msg-status-1")
+
+
+def _signed(body):
+    signature = hmac.new(settings.WEBHOOK_SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return {"Authorization": f"Bearer {signature}"}
+
+
+def test_webhook_batch_json_array():
+    events = [
+        {"id": "batch-1", "status": "queued"},
+        {"id": "batch-1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"},
+        {"id": "batch-1", "status": "queued", "deliveredAt": "2024-12-01T11:00:00Z"},
+        {"id": "batch-2", "status": "sent"},
+        {"id": "batch-1", "status": "queued"},
+    ]
+    body = json.dumps(events).encode("utf-8")
+
+    response = client.post("/webhooks/batch", content=body, headers=_signed(body))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["received"], data["processed"], data["ignored"], data["invalid"], data["duplicate"]) == (5, 2, 1, 1, 1)
+    assert [r["outcome"] for r in data["results"]] == ["processed", "processed", "ignored", "invalid", "duplicate"]
+    assert data["results"][3]["errors"][0]["loc"] == ["status"]
+    assert status_store.get("batch-1")["status"] == "delivered"
+
+
+def test_webhook_batch_ndjson():
+    body = b'{"id": "batch-3", "status": "failed"}\n{"id": \n\n{"id": "batch-4", "status": "queued"}\n'
+
+    response = client.post(
+        "/webhooks/batch", content=body, headers={**_signed(body), "Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    assert [r["outcome"] for r in response.json()["results"]] == ["processed", "invalid", "processed"]
+    assert response.json()["results"][1]["errors"][0]["type"] == "json_invalid"
+
+
+def test_webhook_batch_requires_signature():
+    body = b'[{"id": "batch-5", "status": "failed"}]'
+
+    response = client.post("/webhooks/batch", content=body, headers={"Authorization": "Bearer forged"})
+
+    assert response.status_code == 401
+    assert status_store.get("batch-5") is None
+
+
+def test_webhook_batch_malformed_array():
+    body = b'[{"id": "batch-6", '
+
+    response = client.post("/webhooks/batch", content=body, headers=_signed(body))
+
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def worker_pool(monkeypatch):
+    """Background workers for the app, which the test suite otherwise runs inline (WEBHOOK_WORKERS=0)."""
+    pool = EventWorkerPool(server.process_events, workers=2)
+    monkeypatch.setattr(server, "worker_pool", pool)
+    return pool
+
+
+def test_webhook_queued_by_background_workers(worker_pool):
+    body = b'{"id": "queued-1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}'
+
+    # The lifespan starts the workers and drains their queue on exit
+    with TestClient(app) as running:
+        response = running.post("/webhooks", content=body, headers=_signed(body))
+        batch = b'[{"id": "queued-2", "status": "failed"}, {"id": "queued-3", "status": "sent"}]'
+        batch_response = running.post("/webhooks/batch", content=batch, headers=_signed(batch))
+
+    assert response.status_code == 200
+    assert [r["outcome"] for r in batch_response.json()["results"]] == ["accepted", "invalid"]
+    assert status_store.get("queued-1")["status"] == "delivered"
+    assert status_store.get("queued-2")["status"] == "failed"
+
+
+def test_webhook_queue_full_returns_503(worker_pool):
+    body = b'{"id": "queued-4", "status": "failed"}'
+    worker_pool.pending = worker_pool.max_pending
+
+    with TestClient(app) as running:
+        response = running.post("/webhooks", content=body, headers=_signed(body))
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert status_store.get("queued-4") is None
+
+
+def test_webhook_batch_larger_than_queue_returns_413(worker_pool):
+    events = [{"id": f"big-{i}", "status": "failed"} for i in range(150)]
+    body = json.dumps(events).encode()
+    worker_pool.max_pending = 100
+
+    with TestClient(app) as running:
+        responses = [running.post("/webhooks/batch", content=body, headers=_signed(body)) for _ in range(3)]
+        # A part that fits is accepted; its events were not kept as duplicates
+        part = json.dumps(events[:100]).encode()
+        accepted = running.post("/webhooks/batch", content=part, headers=_signed(part))
+
+    assert [r.status_code for r in responses] == [413, 413, 413]
+    assert "Retry-After" not in responses[0].headers
+    assert accepted.json()["accepted"] == 100
+    assert status_store.get("big-99")["status"] == "failed"
+
+
+def test_webhook_refused_while_workers_are_not_running(worker_pool):
+    body = b'{"id": "queued-5", "status": "failed"}'
+
+    # Before start and after stop (draining) events are refused, not processed inline
+    before = client.post("/webhooks", content=body, headers=_signed(body))
+    with TestClient(app):
+        pass
+    after = client.post("/webhooks", content=body, headers=_signed(body))
+
+    assert before.status_code == after.status_code == 503
+    assert after.headers["Retry-After"] == "1"
+    assert status_store.get("queued-5") is None
+
+
+def test_webhook_duplicate_is_acknowledged_without_processing():
+    body = b'{"id": "dup-1", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}'
+
+    first = client.post("/webhooks", content=body, headers=_signed(body))
+    with patch("src.server.app.process_events") as process:
+        retried = client.post("/webhooks", content=body, headers=_signed(body))
+
+    assert retried.status_code == first.status_code == 200
+    assert retried.json() == first.json()
+    process.assert_not_called()
+
+
+def test_webhook_rejected_by_full_queue_is_not_a_duplicate(worker_pool):
+    body = b'{"id": "dup-2", "status": "failed"}'
+    worker_pool.pending = worker_pool.max_pending
+
+    with TestClient(app) as running:
+        assert running.post("/webhooks", content=body, headers=_signed(body)).status_code == 503
+        worker_pool.pending = 0
+        response = running.post("/webhooks", content=body, headers=_signed(body))
+
+    assert response.status_code == 200
+    assert status_store.get("dup-2")["status"] == "failed"
+
+
+def test_webhook_replay_window():
+    body = b'{"id": "dup-3", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"}'
+    batch = (
+        b'[{"id": "dup-4", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"},'
+        b' {"id": "dup-4", "status": "queued"}]'
+    )
+
+    with patch.object(deduplicator, "replay_window", 300):
+        response = client.post("/webhooks", content=body, headers=_signed(body))
+        batch_response = client.post("/webhooks/batch", content=batch, headers=_signed(batch))
+
+    assert response.status_code == 400
+    assert status_store.get("dup-3") is None
+    assert [r["outcome"] for r in batch_response.json()["results"]] == ["replayed", "processed"]
+
+
+def test_webhook_persistent_dedup_store_is_used_off_the_event_loop(tmp_path):
+    body = b'[{"id": "dup-5", "status": "failed"}, {"id": "dup-6", "status": "failed"}]'
+    store = SQLiteCache(str(tmp_path / "events.db"), namespace="webhook_events")
+    loops = []
+    original_set = store.set
+
+    def recording_set(*args, **kwargs):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        original_set(*args, **kwargs)
+
+    with patch.object(deduplicator, "store", store), patch.object(store, "set", recording_set):
+        client.post("/webhooks/batch", content=body, headers=_signed(body))
+        response = client.post("/webhooks/batch", content=body, headers=_signed(body))
+
+    assert loops == [None, None]
+    assert [r["outcome"] for r in response.json()["results"]] == ["duplicate", "duplicate"]
+
+
+def test_webhook_dispatches_to_registered_handlers():
+    body = b'{"id": "handled-1", "status": "failed"}'
+    received = []
+
+    async def on_failed(event):
+        received.append(event.id)
+
+    handlers.register("failed", on_failed)
+    try:
+        response = client.post("/webhooks", content=body, headers=_signed(body))
+    finally:
+        handlers.unregister("failed", on_failed)
+
+    assert response.status_code == 200
+    assert received == ["handled-1"]
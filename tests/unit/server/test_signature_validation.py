@@ -3,9 +3,10 @@ import hmac
 import hashlib
 import json
 
+from src.core import codec
 from src.core.config import settings
 from src.core.security import verify_signature
-from src.core.security import generate_signature
+from src.core.security import generate_signature, SignatureVerifier
 from src.schemas.errors import UnauthorizedError
 
 
@@ -31,3 +32,36 @@ def test_empty_signature():
     with pytest.raises(UnauthorizedError, match="Unauthorized: Signature validation failed."):
         verify_signature(serialized_payload, empty_signature, settings.WEBHOOK_SECRET)
 
+
+def test_incremental_verifier_matches_whole_body():
+    payload = {"id": "msg123", "status": "delivered"}
+    serialized_payload = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    signature = generate_signature(payload, settings.WEBHOOK_SECRET)
+
+    verifier = SignatureVerifier(settings.WEBHOOK_SECRET)
+    for start in range(0, len(serialized_payload), 7):
+        verifier.update(serialized_payload[start:start + 7])
+
+    assert verifier.verify(signature) is True
+    with pytest.raises(UnauthorizedError):
+        verifier.verify("invalidsignature")
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+@pytest.mark.parametrize("payload, expected", [
+    (
+        {"id": "msg123", "status": "delivered", "deliveredAt": "2024-12-01T12:00:00Z"},
+        "fa64421cd8c5b5a918adbfb3d02195fef6e6e1c6437dc4d7e195b3274f5ec455",
+    ),
+    ({"content": "café", "n": 1e16}, "cc88c97fbc9b1f78f52653f39806e06a48b324ed0ad55fdf598db62b5ab595e8"),
+])
+def test_signature_is_stable_across_codecs(backend, payload, expected):
+    """Test golden signatures, including non-ASCII text and large floats, whatever JSON codec is active."""
+    try:
+        codec.set_codec(backend)
+    except ImportError:
+        pytest.skip(f"{backend} is not installed")
+    try:
+        assert generate_signature(payload, "mySecret") == expected
+    finally:
+        codec.set_codec(None)
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.server.workers import BatchTooLargeError, EventWorkerPool, QueueFullError
+
+
+@pytest.mark.asyncio
+async def test_submit_processes_events_in_background():
+    """Test that submitted events are handled by the workers."""
+    handled = []
+    pool = EventWorkerPool(handled.extend, workers=2)
+    await pool.start()
+
+    pool.submit(["a", "b"])
+    pool.submit(["c"])
+    await pool.stop()
+
+    assert sorted(handled) == ["a", "b", "c"]
+    assert pool.stats["processed"] == 3
+    assert pool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_full():
+    """Test that a batch which does not fit is rejected as a whole."""
+    release = asyncio.Event()
+
+    async def handler(events):
+        await release.wait()
+
+    pool = EventWorkerPool(handler, max_pending=2, workers=1, retry_after=5)
+    await pool.start()
+    pool.submit(["a"])
+
+    with pytest.raises(QueueFullError) as error:
+        pool.submit(["b", "c"])
+
+    assert error.value.retry_after == 5
+    assert pool.stats["rejected"] == 2
+    assert pool.pending == 1
+    release.set()
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_batch_larger_than_queue():
+    """Test that a batch which can never fit is not reported as retryable."""
+    pool = EventWorkerPool(list, max_pending=100, workers=1)
+    await pool.start()
+
+    for _ in range(3):
+        with pytest.raises(BatchTooLargeError, match="150 events exceeds the webhook queue size of 100"):
+            pool.submit(list(range(150)))
+
+    assert pool.pending == 0
+    assert pool.stats["rejected"] == 450
+    pool.submit(list(range(100)))
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_not_running():
+    """Test that events are refused before start and after stop."""
+    pool = EventWorkerPool(list)
+
+    with pytest.raises(QueueFullError):
+        pool.submit(["a"])
+
+    await pool.start()
+    await pool.stop()
+    with pytest.raises(QueueFullError):
+        pool.submit(["a"])
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_events():
+    """Test that stop waits for slow events already queued."""
+    handled = []
+
+    async def handler(events):
+        await asyncio.sleep(0.01)
+        handled.extend(events)
+
+    pool = EventWorkerPool(handler, workers=1)
+    await pool.start()
+    for i in range(5):
+        pool.submit([i])
+    await pool.stop(timeout=5)
+
+    assert handled == [0, 1, 2, 3, 4]
+    assert not pool.running
+
+
+@pytest.mark.asyncio
+async def test_stop_gives_up_after_timeout():
+    """Test that a stuck handler does not block shutdown forever."""
+    async def handler(events):
+        await asyncio.sleep(10)
+
+    pool = EventWorkerPool(handler, workers=1)
+    await pool.start()
+    pool.submit(["a"])
+    await pool.stop(timeout=0.01)
+
+    assert pool.stats["processed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_is_counted():
+    """Test that a failing batch does not stop the worker."""
+    def handler(events):
+        if "bad" in events:
+            raise RuntimeError("boom")
+
+    pool = EventWorkerPool(handler, workers=1)
+    await pool.start()
+    pool.submit(["bad"])
+    pool.submit(["good"])
+    await pool.stop()
+
+    assert pool.stats["failed"] == 1
+    assert pool.stats["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_on_executor():
+    """Test that a sync handler runs off the event loop when an executor is given."""
+    loop_thread = []
+
+    def handler(events):
+        loop_thread.append(threading.current_thread().name)
+        return len(events)
+
+    with ThreadPoolExecutor(1, thread_name_prefix="webhook") as executor:
+        pool = EventWorkerPool(handler, executor=executor)
+        assert await pool.process(["a", "b"]) == 2
+
+    assert loop_thread[0].startswith("webhook")